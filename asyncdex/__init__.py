@@ -6,6 +6,7 @@ from .enum import (
     FollowStatus,
     MangaStatus,
     Relationship,
+    RequestPriority,
     Visibility,
 )
 from .exceptions import (
@@ -20,5 +21,13 @@ from .exceptions import (
 )
 from .list_orders import AuthorListOrder, ChapterListOrder, CoverListOrder, GroupListOrder, MangaListOrder, UserFollowsMangaFeedListOrder
 from .models import *
-from .utils import AttrDict, DefaultAttrDict, InclusionExclusionPair, Interval
+from .utils import (
+    AttrDict,
+    DefaultAttrDict,
+    InclusionExclusionPair,
+    Interval,
+    batched,
+    filter_concurrent,
+    map_concurrent,
+)
 from .version import version
@@ -0,0 +1,146 @@
+import asyncio
+from logging import getLogger
+from typing import Awaitable, Callable, List, Optional, Set, TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    from .client import MangadexClient
+    from .models.abc import Model
+
+logger = getLogger(__name__)
+
+_Entry = Tuple["Model", Callable[[], Awaitable[None]], "asyncio.Future[None]"]
+
+
+class BatchLoader:
+    """An object that collects the models passed to :meth:`.load` within a short window of time and fetches all of
+    them with the batch endpoint of the model, instead of making one request per model.
+
+    .. versionadded:: 1.2
+
+    .. seealso:: The ``auto_batch`` parameter of :class:`.MangadexClient`.
+
+    :param client: The client to make requests with.
+    :type client: MangadexClient
+    :param permission: The permission needed to use the batch endpoint.
+    :type permission: str
+    :param route_name: The name of the batch endpoint's route in :data:`.routes`.
+    :type route_name: str
+    :param delay: How long to wait for more models after the first model is given to :meth:`.load`, in seconds.
+        Defaults to ``0``, which collects all models given to :meth:`.load` before the event loop runs the next
+        batch of callbacks, such as models fetched with :func:`asyncio.gather`.
+    :type delay: float
+    """
+
+    client: "MangadexClient"
+    """The client to make requests with."""
+
+    permission: str
+    """The permission needed to use the batch endpoint."""
+
+    route_name: str
+    """The name of the batch endpoint's route in :data:`.routes`."""
+
+    delay: float
+    """How long to wait for more models after the first model is given to :meth:`.load`, in seconds."""
+
+    def __init__(self, client: "MangadexClient", permission: str, route_name: str, *, delay: float = 0):
+        self.client = client
+        self.permission = permission
+        self.route_name = route_name
+        self.delay = delay
+        self._queue: List[_Entry] = []
+        self._handle: Optional[asyncio.Handle] = None
+        # The event loop only keeps weak references to tasks, so the running batches are kept here.
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def load(self, model: "Model", fallback: Callable[[], Awaitable[None]]):
+        """Fetch the model as part of the next batch.
+
+        :param model: The model to fetch.
+        :type model: Model
+        :param fallback: A function returning a coroutine that fetches the model by itself. This is used if the
+            model is missing from the batch response.
+        :type fallback: Callable[[], Awaitable[None]]
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.append((model, fallback, future))
+        if self._handle is None:
+            if self.delay > 0:
+                self._handle = loop.call_later(self.delay, self._dispatch)
+            else:
+                self._handle = loop.call_soon(self._dispatch)
+        await future
+
+    def _dispatch(self):
+        items, self._queue = self._queue, []
+        self._handle = None
+        task = asyncio.ensure_future(self._run(items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self):
+        """Cancel the batches that are waiting to be sent or are running. Calls to :meth:`.load` waiting for them
+        raise :class:`asyncio.CancelledError`."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        items, self._queue = self._queue, []
+        for _, _, future in items:
+            future.cancel()
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, items: List[_Entry]):
+        try:
+            await self._run_batch(items)
+        finally:
+            # If the batch was cancelled, the models waiting for it would otherwise wait forever.
+            for _, _, future in items:
+                if not future.done():
+                    future.cancel()
+
+    async def _run_batch(self, items: List[_Entry]):
+        try:
+            found: Set[str] = await self.client._do_batch(
+                tuple(model for model, _, _ in items), self.permission, self.route_name
+            )
+        except Exception as e:
+            for _, _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        missing: List[_Entry] = []
+        for entry in items:
+            model, _, future = entry
+            if model.id in found:
+                if not future.done():
+                    future.set_result(None)
+            else:
+                missing.append(entry)
+        if missing:
+            # Batch endpoints can filter out models that can still be fetched individually, such as mangas with a
+            # content rating that is not included by default, so fetch those one by one instead.
+            logger.debug("Fetching %s models missing from the batch individually.", len(missing))
+            await asyncio.gather(*[self._fetch_individually(fallback, future) for _, fallback, future in missing])
+
+    @staticmethod
+    async def _fetch_individually(fallback: Callable[[], Awaitable[None]], future: "asyncio.Future[None]"):
+        try:
+            await fallback()
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(None)
+
+    def __repr__(self) -> str:
+        """Provide a string representation of the object.
+
+        :return: The string representation
+        :rtype: str
+        """
+        return f"{type(self).__name__}(route_name={self.route_name!r}, delay={self.delay!r})"
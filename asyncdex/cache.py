@@ -0,0 +1,297 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from logging import getLogger
+from time import monotonic
+from typing import Dict, Hashable, Mapping, Optional, Tuple
+
+import aiohttp
+
+from .constants import cache_ttls
+from .utils import RouteTable
+
+logger = getLogger(__name__)
+
+
+@dataclass()
+class CacheStats:
+    """Statistics about the usage of a :class:`.ResponseCache`.
+
+    .. versionadded:: 1.2
+    """
+
+    hits: int = 0
+    """The amount of requests answered from the cache without making a request."""
+
+    misses: int = 0
+    """The amount of requests for cacheable routes that were not in the cache or had expired."""
+
+    revalidations: int = 0
+    """The amount of expired responses that the API confirmed were unchanged, with a ``304 Not Modified`` response."""
+
+    evictions: int = 0
+    """The amount of responses removed from the cache to stay within its size limits."""
+
+    @property
+    def hit_ratio(self) -> float:
+        """The fraction of requests for cacheable routes that were answered from the cache.
+
+        :return: The hit ratio, between ``0`` and ``1``.
+        :rtype: float
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass()
+class CacheEntry:
+    """A response stored in a :class:`.ResponseCache`.
+
+    .. versionadded:: 1.2
+    """
+
+    response: aiohttp.ClientResponse
+    """The response. Its body has already been read."""
+
+    body: bytes
+    """The body of the response."""
+
+    path: str
+    """The path of the request, without the base URL or the query string."""
+
+    expires: float
+    """The :func:`time.monotonic` value after which the response has to be revalidated."""
+
+    etag: Optional[str] = None
+    """The value of the ``ETag`` header of the response."""
+
+    last_modified: Optional[str] = None
+    """The value of the ``Last-Modified`` header of the response."""
+
+    @property
+    def fresh(self) -> bool:
+        """Whether or not the response can be used without revalidating it.
+
+        :rtype: bool
+        """
+        return monotonic() < self.expires
+
+    def validators(self) -> Dict[str, str]:
+        """Get the headers needed to make a conditional request for the response.
+
+        :return: A dictionary of headers, which will be empty if the response had no validators.
+        :rtype: Dict[str, str]
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """An in-memory cache of responses to GET requests made to the MangaDex API.
+
+    Responses are kept for the TTL of the route they were made to, and the least recently used responses are evicted
+    when the cache holds more than ``max_entries`` responses or more than ``max_bytes`` bytes. Expired responses that
+    were sent with an ``ETag`` or ``Last-Modified`` header are kept, so that they can be revalidated with a
+    conditional request instead of downloading them again.
+
+    Entries are keyed by the identity of the user making the request as well as the URL, so that clients logged in as
+    different users can share a cache.
+
+    .. versionadded:: 1.2
+
+    .. seealso:: The ``cache`` parameter of :class:`.MangadexClient`.
+
+    :param ttls: A mapping of route templates (such as ``/manga/{id}``) to the amount of seconds responses from the
+        route are cached for. Routes with a TTL of ``0`` or that are not in the mapping are not cached. Defaults to
+        :data:`.cache_ttls`.
+    :type ttls: Mapping[str, float]
+    :param max_entries: The maximum amount of responses to keep. Defaults to ``1024``.
+    :type max_entries: int
+    :param max_bytes: The maximum size of all the response bodies in the cache, in bytes. Defaults to 32 MiB.
+    :type max_bytes: int
+    """
+
+    ttls: RouteTable[float]
+    """A table of route templates to the amount of seconds responses from the route are cached for."""
+
+    max_entries: int
+    """The maximum amount of responses to keep."""
+
+    max_bytes: int
+    """The maximum size of all the response bodies in the cache, in bytes."""
+
+    stats: CacheStats
+    """The statistics of the cache."""
+
+    def __init__(
+        self, ttls: Optional[Mapping[str, float]] = None, *, max_entries: int = 1024, max_bytes: int = 32 * 1024 * 1024
+    ):
+        if ttls is None:
+            ttls = cache_ttls
+        self.ttls = RouteTable()
+        for template, ttl in ttls.items():
+            self.ttls[template] = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Tuple[Hashable, str], CacheEntry]" = OrderedDict()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """The size of all the response bodies in the cache, in bytes.
+
+        :rtype: int
+        """
+        return self._size
+
+    def __len__(self) -> int:
+        """Return the amount of responses in the cache.
+
+        :return: The amount of responses.
+        :rtype: int
+        """
+        return len(self._entries)
+
+    def ttl_for(self, path: str) -> float:
+        """Get the TTL of the route matching the path.
+
+        :param path: The path, starting with ``/``. Any query string is ignored.
+        :type path: str
+        :return: The TTL in seconds, which is ``0`` if the path is not cacheable.
+        :rtype: float
+        """
+        return next(self.ttls.match(path), 0)
+
+    def get(self, key: Tuple[Hashable, str]) -> Optional[CacheEntry]:
+        """Get the entry for a key, even if it has expired. The entry is marked as recently used.
+
+        :param key: A tuple of the identity of the user and the path of the request, including the query string.
+        :type key: Tuple[Hashable, str]
+        :return: The entry, or ``None`` if the key is not in the cache.
+        :rtype: Optional[CacheEntry]
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def lookup(self, key: Tuple[Hashable, str]) -> Optional[aiohttp.ClientResponse]:
+        """Get the response for a key if it has not expired, and record a hit or a miss in :attr:`.stats`. Expired
+        entries without validators are removed.
+
+        :param key: A tuple of the identity of the user and the path of the request, including the query string.
+        :type key: Tuple[Hashable, str]
+        :return: The response, or ``None`` if a request has to be made.
+        :rtype: Optional[aiohttp.ClientResponse]
+        """
+        entry = self.get(key)
+        if entry is not None:
+            if entry.fresh:
+                self.stats.hits += 1
+                return entry.response
+            if not entry.validators():
+                self._remove(key)
+        self.stats.misses += 1
+        return None
+
+    def store(self, key: Tuple[Hashable, str], response: aiohttp.ClientResponse, body: bytes, ttl: float):
+        """Store a response whose body has been read.
+
+        :param key: A tuple of the identity of the user and the path of the request, including the query string.
+        :type key: Tuple[Hashable, str]
+        :param response: The response.
+        :type response: aiohttp.ClientResponse
+        :param body: The body of the response.
+        :type body: bytes
+        :param ttl: The amount of seconds to keep the response for.
+        :type ttl: float
+        """
+        if len(body) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = CacheEntry(
+            response,
+            body,
+            key[1].partition("?")[0],
+            monotonic() + ttl,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+        self._size += len(body)
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def revalidated(self, key: Tuple[Hashable, str], ttl: float) -> Optional[aiohttp.ClientResponse]:
+        """Mark an entry as unchanged after a ``304 Not Modified`` response.
+
+        :param key: A tuple of the identity of the user and the path of the request, including the query string.
+        :type key: Tuple[Hashable, str]
+        :param ttl: The amount of seconds to keep the response for.
+        :type ttl: float
+        :return: The stored response, or ``None`` if the key was removed while revalidating it.
+        :rtype: Optional[aiohttp.ClientResponse]
+        """
+        entry = self.get(key)
+        if entry is None:
+            return None
+        entry.expires = monotonic() + ttl
+        self.stats.revalidations += 1
+        return entry.response
+
+    def _remove(self, key: Tuple[Hashable, str]):
+        entry = self._entries.pop(key)
+        self._size -= len(entry.body)
+
+    def invalidate(self, path: str) -> int:
+        """Remove all responses for a path, for all users and query strings.
+
+        .. note::
+            The client calls this automatically after a successful request that is not a GET request, so that
+            updating or deleting an object removes the cached copy of it.
+
+        :param path: The path, starting with ``/``. Any query string is ignored.
+        :type path: str
+        :return: The amount of responses removed.
+        :rtype: int
+        """
+        path = path.partition("?")[0]
+        keys = [key for key, entry in self._entries.items() if entry.path == path]
+        for key in keys:
+            self._remove(key)
+        if keys:
+            logger.debug("Invalidated %s cached responses for %s", len(keys), path)
+        return len(keys)
+
+    def invalidate_route(self, template: str) -> int:
+        """Remove all responses for paths matching a route template, such as ``/manga/{id}``.
+
+        :param template: The route template.
+        :type template: str
+        :return: The amount of responses removed.
+        :rtype: int
+        """
+        table = RouteTable()
+        table[template] = True
+        keys = [key for key, entry in self._entries.items() if next(table.match(entry.path), False)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self):
+        """Remove all responses from the cache. The statistics are not reset."""
+        self._entries.clear()
+        self._size = 0
+
+    def __repr__(self) -> str:
+        """Provide a string representation of the object.
+
+        :return: The string representation
+        :rtype: str
+        """
+        return f"{type(self).__name__}(entries={len(self)}, size={self.size}, stats={self.stats!r})"
@@ -1,19 +1,49 @@
 import asyncio
 import configparser
 import os
-from dataclasses import asdict
+from concurrent.futures import Executor
+from dataclasses import asdict, replace
 from datetime import datetime, timedelta
 from json import dumps as convert_obj_to_json, load
 from logging import NullHandler, getLogger
 from types import TracebackType
-from typing import Any, BinaryIO, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar, Union
+from weakref import WeakKeyDictionary, WeakValueDictionary
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import aiohttp
+from aiohttp.payload import JsonPayload
 
-from .constants import permission_model_mapping, ratelimit_data, routes
-from .enum import ContentRating, Demographic, MangaStatus, TagMode
+from .batching import BatchLoader
+from .cache import ResponseCache
+from .connection import ConnectionPools
+from .constants import permission_model_mapping, ratelimit_data, routes, uploads_url
+from .enum import ContentRating, Demographic, MangaStatus, RequestPriority, TagMode
 from .exceptions import Captcha, HTTPException, InvalidCaptcha, InvalidID, Ratelimit, Unauthorized
-from .list_orders import AuthorListOrder, ChapterListOrder, CoverListOrder, GroupListOrder, MangaListOrder
+from .json_codec import JSONCodec, default_json_codec
+from .list_orders import (
+    AuthorListOrder,
+    ChapterListOrder,
+    CoverListOrder,
+    GroupListOrder,
+    MangaListOrder,
+    _known_order_mappings,
+)
 from .models.abc import Model
 from .models.author import Author
 from .models.chapter import Chapter
@@ -26,7 +56,9 @@ from .models.pager import Pager
 from .models.tag import Tag, TagDict
 from .models.title import TitleList
 from .models.user import User
-from .ratelimit import Ratelimits
+from .ratelimit import GlobalRatelimit, RatelimitBackend, Ratelimits
+from .retry import RetryBudget, RetryPolicy, parse_retry_after
+from .token_store import StoredTokens, TokenStore
 from .utils import remove_prefix, return_date_string
 
 logger = getLogger(__name__)
@@ -34,6 +66,7 @@ getLogger("asyncdex").addHandler(NullHandler())
 
 _LegacyModelT = TypeVar("_LegacyModelT", Manga, Chapter, Tag, Group)
 _T = TypeVar("_T")
+_ModelT = TypeVar("_ModelT", bound=Model)
 
 DEFAULT_API_URL = "https://api.mangadex.org"
 
@@ -46,9 +79,12 @@ class MangadexClient:
         normally, the aiohttp ClientSession does not like this.
 
     .. warning::
-        The client cannot ratelimit effectively if multiple clients are running on the same program. Furthermore,
-        the ratelimit may not work if multiple other people are accessing the MangaDex API at the same time or the
-        client is running on a shared network.
+        The client cannot ratelimit effectively if multiple clients are running on the same program, unless they
+        share a :class:`.RatelimitBackend`. Furthermore, the ratelimit may not work if multiple other people are
+        accessing the MangaDex API at the same time or the client is running on a shared network.
+
+        .. versionchanged:: 1.2
+            Use the ``ratelimit_backend`` parameter to share ratelimits between clients.
 
     :param username: The username of the user to authenticate as. Leave blank to not allow login to fetch a new
         refresh token. Specifying the username without specifying the password is an error.
@@ -67,12 +103,143 @@ class MangadexClient:
     :type sleep_on_ratelimit: bool
     :param session: The session object for the client to use. If one is not provided, the client will create a new
         session instead. This is useful for providing a custom session.
+
+        .. versionchanged:: 1.2
+            The session is only used for the API if ``connection_pools`` is given. Otherwise, it is used for every
+            request like before.
+
     :type session: aiohttp.ClientSession
     :param api_url: The base URL for the MangaDex API. Useful for private instances or a testing environment. Should
         not include a trailing slash.
     :type api_url: str
     :param anonymous: Whether or not to force anonymous mode. This will clear the username and/or password.
     :type anonymous: bool
+    :param global_ratelimit_rate: The amount of requests per second that can be made to the MangaDex API. Defaults to
+        ``5``.
+
+        .. versionadded:: 1.2
+
+    :type global_ratelimit_rate: float
+    :param global_ratelimit_burst: The amount of requests to the MangaDex API that can be made at once before requests
+        are spaced out to match ``global_ratelimit_rate``. Defaults to ``1``.
+
+        .. versionadded:: 1.2
+
+    :type global_ratelimit_burst: int
+    :param ratelimit_backend: The :class:`.RatelimitBackend` to store ratelimit state in. Clients using the same
+        backend share their ratelimits, such as multiple worker processes using a :class:`.FileRatelimitBackend` with
+        the same path. Defaults to ``None``, which only stores the state in the client.
+
+        .. versionadded:: 1.2
+
+    :type ratelimit_backend: RatelimitBackend
+    :param coalesce_requests: Whether or not identical GET requests to the MangaDex API that are made while another
+        one is in flight should share the response of the request in flight instead of making a new request. Defaults
+        to ``False``.
+
+        .. versionadded:: 1.2
+
+        .. warning::
+            Coalesced requests share the same :class:`aiohttp.ClientResponse` object, and JSON data obtained
+            internally is shared as well. Do not modify JSON data obtained from a shared response.
+
+    :type coalesce_requests: bool
+    :param auto_batch: Whether or not to fetch models that support batching (authors, chapters, covers, groups and
+        mangas) with their batch endpoint when :meth:`.Model.fetch` is called on several of them at the same time,
+        such as with :func:`asyncio.gather`. Defaults to ``False``.
+
+        .. versionadded:: 1.2
+
+        .. seealso:: :class:`.BatchLoader`
+
+    :type auto_batch: bool
+    :param auto_batch_delay: How long to wait for more models to fetch before making a batch request, in seconds.
+        Defaults to ``0``, which only batches models that are fetched in the same iteration of the event loop.
+
+        .. versionadded:: 1.2
+
+    :type auto_batch_delay: float
+    :param cache: The :class:`.ResponseCache` to store responses to GET requests in. The same cache can be given to
+        multiple clients. Defaults to ``None``, which disables caching.
+
+        .. versionadded:: 1.2
+
+        .. warning::
+            Cached responses are shared the same way as coalesced requests. Do not modify JSON data obtained from a
+            cached response.
+
+    :type cache: ResponseCache
+    :param retry_policy: The :class:`.RetryPolicy` deciding the delay between retries and the retry budget of every
+        route. Defaults to ``None``, which uses a :class:`.RetryPolicy` with the default settings.
+
+        .. versionadded:: 1.2
+
+    :type retry_policy: RetryPolicy
+    :param session_token_refresh_margin: How many seconds before the session token expires to start getting a new
+        one in the background. Requests keep using the current token until the new token arrives. Defaults to ``60``.
+
+        .. versionadded:: 1.2
+
+    :type session_token_refresh_margin: float
+    :param token_store: The :class:`.TokenStore` to keep the refresh and session tokens in. If it has tokens for the
+        same user when the client is created, the client starts with those tokens instead of logging in. The tokens
+        are saved whenever the client logs in or gets a new session token, and removed when :meth:`.logout` deletes
+        the tokens. Defaults to ``None``.
+
+        .. versionadded:: 1.2
+
+    :type token_store: TokenStore
+    :param identity_map: Whether or not to keep one model object per type and ID. If ``True``, models made from API
+        responses, such as the relationships of other models and the results of a :class:`.Pager`, reuse the object
+        that already exists for the ID and parse the new data into it, so that fetching a model updates every
+        reference to it. Objects are only kept while something else refers to them. Defaults to ``False``.
+
+        .. versionadded:: 1.2
+
+    :type identity_map: bool
+    :param lazy_parsing: Whether or not to decode the attributes of models the first time they are used instead of when
+        the response is received. This applies to every model except :class:`.Tag`. It makes listing many models faster
+        when only some of their attributes are read, at the cost of keeping the JSON of each model until all of its
+        attributes are decoded. Defaults to ``False``.
+
+        .. versionadded:: 1.2
+
+    :type lazy_parsing: bool
+    :param json_codec: The :class:`.JSONCodec` used to decode responses and encode request bodies. Defaults to the
+        fastest JSON library that is installed, chosen by :func:`.default_json_codec`.
+
+        .. versionadded:: 1.2
+
+    :type json_codec: JSONCodec
+    :param json_thread_threshold: The size in bytes above which response bodies are decoded in the default executor
+        of the event loop instead of on the event loop, so that decoding large pages does not delay other tasks such
+        as concurrent downloads. ``None`` decodes every response on the event loop. Defaults to 256 KiB.
+
+        .. versionadded:: 1.2
+
+    :type json_thread_threshold: Optional[int]
+    :param pager_executor: The executor that every :class:`.Pager` made by the client decodes its pages in, unless
+        the Pager is given its own. Use a :class:`concurrent.futures.ProcessPoolExecutor` to spread the work of
+        large crawls over more than one CPU core. Defaults to ``None``, which decodes the pages on the event loop.
+
+        .. versionadded:: 1.2
+
+    :type pager_executor: Executor
+    :param connection_pools: The connection pools for the API, the MD@H nodes, and the uploads host. Each pool gets a
+        session of its own, so that downloading images does not take connections away from API requests. Defaults to
+        the default :class:`.ConnectionPools`, unless ``session`` is given or ``session_kwargs`` has a ``connector``,
+        in which case that session or connector is used for every request. The default pools allow 100 connections
+        each like the default connector of aiohttp, but at most 8 connections to each MD@H node.
+
+        .. versionadded:: 1.2
+
+    :type connection_pools: ConnectionPools
+    :param warm_connections: The amount of connections to the API to open when the client is entered with ``async
+        with``, using :meth:`.warm_up`. Defaults to ``0``.
+
+        .. versionadded:: 1.2
+
+    :type warm_connections: int
     :param session_kwargs: Optional keyword arguments to pass on to the :class:`aiohttp.ClientSession`.
     """
 
@@ -95,11 +262,121 @@ class MangadexClient:
     """Whether or not to sleep when a ratelimit occurs."""
 
     session: aiohttp.ClientSession
-    """The :class:`aiohttp.ClientSession` that the client will use to make requests."""
+    """The :class:`aiohttp.ClientSession` that the client will use to make requests.
+
+    .. versionchanged:: 1.2
+        If the client has :attr:`.connection_pools`, this session is only used for the API.
+    """
+
+    image_session: aiohttp.ClientSession
+    """The :class:`aiohttp.ClientSession` used for requests to hosts other than the API and the uploads host, such as
+    MD@H nodes. This is :attr:`.session` if the client has no :attr:`.connection_pools`.
+
+    .. versionadded:: 1.2
+    """
+
+    upload_session: aiohttp.ClientSession
+    """The :class:`aiohttp.ClientSession` used for requests to :data:`.uploads_url`. This is :attr:`.session` if the
+    client has no :attr:`.connection_pools`.
+
+    .. versionadded:: 1.2
+    """
+
+    connection_pools: Optional[ConnectionPools]
+    """The connection pools of the client's sessions, or ``None`` if one session is used for every request.
+
+    .. versionadded:: 1.2
+    """
+
+    warm_connections: int
+    """The amount of connections to the API opened when the client is entered.
+
+    .. versionadded:: 1.2
+    """
 
     ratelimits: Ratelimits
     """The :class:`.Ratelimits` object that the client is using."""
 
+    global_ratelimit: GlobalRatelimit
+    """The :class:`.GlobalRatelimit` object that the client is using for the ratelimit shared by all API routes.
+
+    .. versionadded:: 1.2
+    """
+
+    coalesce_requests: bool
+    """Whether or not identical GET requests made while another one is in flight share the response.
+
+    .. versionadded:: 1.2
+    """
+
+    auto_batch: bool
+    """Whether or not calls to :meth:`.Model.fetch` made at the same time are combined into batch requests.
+
+    .. versionadded:: 1.2
+    """
+
+    auto_batch_delay: float
+    """How long to wait for more models to fetch before making a batch request, in seconds.
+
+    .. versionadded:: 1.2
+    """
+
+    cache: Optional[ResponseCache]
+    """The :class:`.ResponseCache` that responses to GET requests are stored in, or ``None`` if caching is disabled.
+
+    .. versionadded:: 1.2
+    """
+
+    retry_policy: RetryPolicy
+    """The :class:`.RetryPolicy` deciding the delay between retries and the retry budget of every route.
+
+    .. versionadded:: 1.2
+    """
+
+    session_token_refresh_margin: float
+    """How many seconds before the session token expires to start getting a new one in the background.
+
+    .. versionadded:: 1.2
+    """
+
+    token_store: Optional[TokenStore]
+    """The :class:`.TokenStore` that the tokens of the client are kept in.
+
+    .. versionadded:: 1.2
+    """
+
+    identity_map: Optional["WeakValueDictionary[Tuple[Type[Model], str], Model]"]
+    """A mapping of model types and IDs to the model object for the ID, or ``None`` if the identity map is disabled.
+    Objects are removed from the mapping once nothing else refers to them.
+
+    .. versionadded:: 1.2
+    """
+
+    lazy_parsing: bool
+    """Whether or not the attributes of models other than tags are decoded the first time they are used.
+
+    .. versionadded:: 1.2
+    """
+
+    json_codec: JSONCodec
+    """The :class:`.JSONCodec` used to decode responses and encode request bodies.
+
+    .. versionadded:: 1.2
+    """
+
+    json_thread_threshold: Optional[int]
+    """The size in bytes above which response bodies are decoded outside of the event loop, or ``None`` if every
+    response is decoded on the event loop.
+
+    .. versionadded:: 1.2
+    """
+
+    pager_executor: Optional[Executor]
+    """The executor that :class:`.Pager` objects decode their pages in by default.
+
+    .. versionadded:: 1.2
+    """
+
     anonymous_mode: bool
     """Whether or not the client is operating in **Anonymous Mode**, where it only accesses public endpoints."""
 
@@ -296,6 +573,23 @@ class MangadexClient:
         session: aiohttp.ClientSession = None,
         api_url: str = DEFAULT_API_URL,
         anonymous: bool = False,
+        global_ratelimit_rate: float = 5,
+        global_ratelimit_burst: int = 1,
+        ratelimit_backend: Optional[RatelimitBackend] = None,
+        coalesce_requests: bool = False,
+        auto_batch: bool = False,
+        auto_batch_delay: float = 0,
+        cache: Optional[ResponseCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        session_token_refresh_margin: float = 60,
+        token_store: Optional[TokenStore] = None,
+        identity_map: bool = False,
+        lazy_parsing: bool = False,
+        json_codec: Optional[JSONCodec] = None,
+        json_thread_threshold: Optional[int] = 256 * 1024,
+        pager_executor: Optional[Executor] = None,
+        connection_pools: Optional[ConnectionPools] = None,
+        warm_connections: int = 0,
         **session_kwargs,
     ):
         self.username = username
@@ -305,27 +599,58 @@ class MangadexClient:
         self.refresh_token = refresh_token
         self.sleep_on_ratelimit = sleep_on_ratelimit
         self.api_base = api_url
-        self.session = session or aiohttp.ClientSession(**session_kwargs)
+        if connection_pools is None and (session is not None or "connector" in session_kwargs):
+            # A custom session or connector decides how every request is made.
+            self.connection_pools = None
+            self.session = session or aiohttp.ClientSession(**session_kwargs)
+            self.image_session = self.upload_session = self.session
+        else:
+            self.connection_pools = connection_pools or ConnectionPools()
+            self.session = session or self.connection_pools.api.session(**session_kwargs)
+            self.image_session = self.connection_pools.images.session(**session_kwargs)
+            self.upload_session = self.connection_pools.uploads.session(**session_kwargs)
+        self.warm_connections = warm_connections
         self.anonymous_mode = anonymous or not (username or password or refresh_token)
         if anonymous:
             self.username = self.password = self.refresh_token = None
-        self.ratelimits = Ratelimits(*ratelimit_data)
+        # Copy the ratelimits so that clients do not share the state of the ratelimits unless they share a backend.
+        self.ratelimits = Ratelimits(*(replace(item) for item in ratelimit_data), backend=ratelimit_backend)
+        self.global_ratelimit = GlobalRatelimit(global_ratelimit_rate, global_ratelimit_burst, ratelimit_backend)
+        self.coalesce_requests = coalesce_requests
+        self._in_flight: Dict[Tuple[Any, ...], asyncio.Future] = {}
+        # The bodies of API responses, which are kept since cached and coalesced responses are read after being closed.
+        self._bodies: "WeakKeyDictionary[aiohttp.ClientResponse, bytes]" = WeakKeyDictionary()
+        self.auto_batch = auto_batch
+        self.auto_batch_delay = auto_batch_delay
+        self._batch_loaders: Dict[Tuple[str, str], BatchLoader] = {}
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
         self.tag_cache = TagDict()
+        self.identity_map = WeakValueDictionary() if identity_map else None
+        self.lazy_parsing = lazy_parsing
+        self.json_codec = json_codec or default_json_codec()
+        self.json_thread_threshold = json_thread_threshold
+        self.pager_executor = pager_executor
         self.user = ClientUser(self)
-        self._request_count = 0
-        self._request_second_start = datetime.utcnow()  # Use utcnow to keep everything using UTF+0 and also helps
-        # with daylight savings.
-        self._request_lock = asyncio.Lock()
         self._session_token: Optional[str] = None
+        # This is the time when the token is acquired. A new token is requested once the token is older than its
+        # lifetime of 15 minutes minus the refresh margin, and the token is vacated at 15 minutes and 10 seconds.
         self._session_token_acquired: Optional[datetime] = datetime(year=2000, month=1, day=1)
-        # This is the time when the token is acquired. The client will automatically vacate the token at 15 minutes
-        # and 10 seconds.
-        self._request_tried_refresh_token = False
-        # This is needed so the request method does not enter an infinite loop with the refresh token
+        self.session_token_refresh_margin = session_token_refresh_margin
+        self.token_store = token_store
+        # The refresh token that was last stored and when it was acquired, so that saving a new session token keeps the
+        # time the refresh token was acquired.
+        self._stored_refresh_token: Optional[str] = None
+        self._refresh_token_acquired: Optional[datetime] = None
+        self._fetch_user_after_load = False
+        if token_store is not None and not anonymous and self.refresh_token is None:
+            self._load_tokens()
 
     async def __aenter__(self):
         """Allow the client to be used with ``async with`` syntax similar to :class:`aiohttp.ClientSession`."""
         await self.session.__aenter__()
+        if self.warm_connections:
+            await self.warm_up(self.warm_connections)
         return self
 
     async def __aexit__(
@@ -334,6 +659,10 @@ class MangadexClient:
         """Exit the client. This will also close the underlying session object."""
         self.username = self.password = self.refresh_token = self.session_token = None
         self.anonymous_mode = True
+        for loader in self._batch_loaders.values():
+            await loader.close()
+        for session in {self.image_session, self.upload_session} - {self.session}:
+            await session.close()
         await self.session.__aexit__(exc_type, exc_val, exc_tb)
 
     def __repr__(self) -> str:
@@ -357,6 +686,7 @@ class MangadexClient:
         retries: int = 3,
         allow_non_successful_codes: bool = False,
         add_includes: bool = False,
+        priority: RequestPriority = RequestPriority.NORMAL,
         **session_request_kwargs,
     ) -> aiohttp.ClientResponse:
         """Perform a request.
@@ -377,6 +707,17 @@ class MangadexClient:
         .. versionchanged:: 0.4
             Added better handling of string items.
 
+        .. versionchanged:: 1.2
+            The global ratelimit is now handled by :attr:`.global_ratelimit`, which no longer blocks other requests
+            while waiting.
+
+        .. versionchanged:: 1.2
+            Identical GET requests are coalesced if :attr:`.coalesce_requests` is ``True``.
+
+        .. versionchanged:: 1.2
+            GET requests to cacheable routes are answered from :attr:`.cache` if it is set. Other successful requests
+            remove the cached responses for their path.
+
         :param method: The HTTP method to use for the request.
         :type method: str
         :param url: The URL to use for the request. May be either an absolute URL or a URL relative to the base
@@ -390,8 +731,13 @@ class MangadexClient:
         :param with_auth: Whether or not to append the session token to the request headers. Requests made without
             the header will behave as if the client is in anonymous mode. Defaults to ``True``.
         :type with_auth: bool
-        :param retries: The amount of times to retry. The function will recursively call itself, subtracting ``1``
-            from the original count until retries run out.
+        :param retries: The amount of times to retry. The delay between retries is decided by :attr:`.retry_policy`.
+
+            .. versionchanged:: 1.2
+                Retries resend the exact same request after a delay with exponential backoff and jitter, instead of
+                recursively calling the method. Requests failing because of connection errors are retried as well
+                if the method is idempotent, and retries stop early when the retry budget of the route runs out.
+
         :type retries: int
         :param allow_non_successful_codes: Whether or not to allow non-success codes (4xx codes that aren't 401/429)
             to pass through instead of raising an error. Defaults to ``False``.
@@ -399,7 +745,14 @@ class MangadexClient:
         :param add_includes: Whether or not to add the list of allowed reference expansions to the request. Defaults
             to ``False``.
         :type add_includes: bool
+        :param priority: The priority of the request if it has to wait for a ratelimit. Defaults to
+            :attr:`.RequestPriority.NORMAL`.
+
+            .. versionadded:: 1.2
+
+        :type priority: RequestPriority
         :param session_request_kwargs: Optional keyword arguments to pass to :meth:`aiohttp.ClientSession.request`.
+        :raises: :class:`ValueError` if both ``json`` and a ``data`` keyword argument are given.
         :raises: :class:`.Unauthorized` if the endpoint requires authentication and sufficient parameters for
             authentication were not provided to the client.
         :raises: :class`aiohttp.ClientResponseError` if the response is a 4xx or 5xx code after multiple retries or
@@ -407,6 +760,72 @@ class MangadexClient:
         :return: The response.
         :rtype: aiohttp.ClientResponse
         """
+        url = self._build_url(url, params, add_includes)
+        if method != "GET" or json is not None or session_request_kwargs or not url.startswith(self.api_base):
+            resp = await self._request(
+                method,
+                url,
+                json=json,
+                with_auth=with_auth,
+                retries=retries,
+                allow_non_successful_codes=allow_non_successful_codes,
+                priority=priority,
+                **session_request_kwargs,
+            )
+            if self.cache is not None and method != "GET" and resp is not None and resp.ok:
+                # The object was modified, so the cached copies of it are out of date.
+                self.cache.invalidate(remove_prefix(self.api_base, url))
+            return resp
+        identity = self._cache_identity(with_auth)
+        fetch = partial(
+            self._request,
+            method,
+            url,
+            with_auth=with_auth,
+            retries=retries,
+            allow_non_successful_codes=allow_non_successful_codes,
+            priority=priority,
+        )
+        if self.cache is not None:
+            path = remove_prefix(self.api_base, url)
+            ttl = self.cache.ttl_for(path)
+            if ttl > 0:
+                cached = self.cache.lookup((identity, path))
+                if cached is not None:
+                    return cached
+                fetch = partial(self._cached_request, (identity, path), ttl, fetch)
+        if self.coalesce_requests:
+            return await self._single_flight(("GET", url, identity, allow_non_successful_codes), fetch)
+        return await fetch()
+
+    def _cache_identity(self, with_auth: bool) -> Optional[str]:
+        """Get the value that identifies the user whose data a request returns."""
+        if not with_auth or self.anonymous_mode:
+            return None
+        return self.username or self.refresh_token
+
+    async def _cached_request(
+        self, key: Tuple[Optional[str], str], ttl: float, fetch: Callable[..., Awaitable[aiohttp.ClientResponse]]
+    ) -> aiohttp.ClientResponse:
+        entry = self.cache.get(key)
+        resp = await fetch(headers=entry.validators() if entry else {})
+        if resp.status == 304 and entry is not None:
+            resp.release()
+            cached = self.cache.revalidated(key, ttl)
+            if cached is not None:
+                return cached
+            # The entry was invalidated while it was being revalidated, so request it again.
+            resp = await fetch()
+        if resp.status == 200:
+            self.cache.store(key, resp, await self._read(resp), ttl)
+        return resp
+
+    def _build_url(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Optional[Union[str, Sequence[str], bool, float]]]],
+        add_includes: bool,
+    ) -> str:
         if url.startswith("/"):  # Add the base URL if the base URL is not an absolute URL.
             url = self.api_base + url
         params = dict(params) if params else {}
@@ -428,104 +847,228 @@ class MangadexClient:
                 else:
                     param_parts.append(f"{name}={convert_obj_to_json(value)}")
             url += "?" + "&".join(param_parts)
-        headers = {}
-        if with_auth and not self.anonymous_mode:
-            if self.session_token is None:
-                await self.get_session_token()
-            headers["Authorization"] = f"Bearer {self.session_token}"
-        path_obj = None
-        if url.startswith(self.api_base):
-            # We only want the ratelimit to only apply to the API urls.
-            async with self._request_lock:
+        return url
+
+    async def _single_flight(self, key: Tuple[Any, ...], factory: Callable[[], Awaitable[_T]]) -> _T:
+        """Run the coroutine made by the factory, unless a coroutine with the same key is already running. In that
+        case, wait for the running coroutine and share its result."""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+
+            def done(finished_task: asyncio.Future):
+                if self._in_flight.get(key) is finished_task:
+                    del self._in_flight[key]
+                if not finished_task.cancelled():
+                    finished_task.exception()  # Everyone waiting may have been cancelled.
+
+            task.add_done_callback(done)
+        # Shield the task so one caller being cancelled does not cancel the request for everyone else.
+        return await asyncio.shield(task)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Any = None,
+        with_auth: bool = True,
+        retries: int = 3,
+        allow_non_successful_codes: bool = False,
+        priority: RequestPriority = RequestPriority.NORMAL,
+        **session_request_kwargs,
+    ) -> aiohttp.ClientResponse:
+        extra_headers = session_request_kwargs.pop("headers", None)
+        body = {}
+        if json is not None:
+            if "data" in session_request_kwargs:
+                raise ValueError("The json and data parameters cannot be used at the same time.")
+            body["data"] = JsonPayload(json, dumps=self.json_codec.dumps)
+        is_api_url = url.startswith(self.api_base)
+        budget = self.retry_policy.budget(remove_prefix(self.api_base, url)) if is_api_url else None
+        if budget:
+            budget.deposit()
+        attempt = 0
+        tried_refresh = False
+        while True:
+            headers = dict(extra_headers or {})
+            sent_token = None
+            if with_auth and not self.anonymous_mode:
+                await self._ensure_session_token()
+                sent_token = self.session_token
+                headers["Authorization"] = f"Bearer {sent_token}"
+            path_obj = None
+            if is_api_url:
+                # We only want the ratelimit to only apply to the API urls.
                 # I decided not to throw exceptions for these 1-second ratelimits.
-                self._request_count += 1
-                time_now = datetime.utcnow()
-                time_difference = (time_now - self._request_second_start).total_seconds()
-                if time_difference <= 1.25 and self._request_count >= 5:  # Hopefully this will stop excess retries
-                    # which cripple pagers.
-                    logger.warning("Sleeping for 1.25 seconds.")
-                    await asyncio.sleep(1.25)
-                elif time_difference > 1:
-                    self._request_count = 0
-                    self._request_second_start = time_now
-            if self.sleep_on_ratelimit:
-                path_obj = await self.ratelimits.sleep(remove_prefix(self.api_base, url), method)
-            else:
-                time_to_sleep, path_obj = await self.ratelimits.check(remove_prefix(self.api_base, url), method)
-                if time_to_sleep > 0 and path_obj:
-                    raise Ratelimit(path_obj.path.name, path_obj.ratelimit_amount, path_obj.ratelimit_expires)
-        logger.info("Making %s request to %s", method, url)
-        resp = await self.session.request(method, url, headers=headers, json=json, **session_request_kwargs)
-        if path_obj:
-            path_obj.update(resp)
-        do_retry = False
-        if url.startswith(self.api_base):
-            try:
-                await resp.read()
-            except Exception:
-                pass
-            if resp.status == 401:  # Unauthorized
-                if self.refresh_token and not self._request_tried_refresh_token:  # Invalid session token
-                    self._request_tried_refresh_token = True
-                    await self.get_session_token()
-                    do_retry = True
-                    self._request_tried_refresh_token = False
-                elif self.username and self.password:  # Invalid refresh token
-                    await self.login()
-                    if path_obj.path.name == "/auth/refresh":
-                        return  # Just drop it for now because the login endpoint took care of it
-                    do_retry = True
-                else:
-                    try:
-                        raise Unauthorized(method, url, resp)
-                    finally:
-                        self._request_tried_refresh_token = False
-                        resp.close()
-            elif resp.status in [403, 412]:
-                site_key = resp.headers.get("X-Captcha-Sitekey", "")
-                if site_key:
-                    raise Captcha(site_key, method, url, resp)
-            elif resp.status == 429:  # Ratelimit error. This should be handled by ratelimits but I'll handle it here as
-                # well.
-                if resp.headers.get("x-ratelimit-retry-after", ""):
-                    diff = (
-                        datetime.utcfromtimestamp(int(resp.headers["x-ratelimit-retry-after"])) - datetime.utcnow()
-                    ).total_seconds()
-                    logger.warning("Sleeping for %s seconds.", diff)
-                    await asyncio.sleep(diff)
+                await self.global_ratelimit.acquire()
+                if self.sleep_on_ratelimit:
+                    path_obj = await self.ratelimits.sleep(remove_prefix(self.api_base, url), method, priority)
                 else:
-                    logger.warning("Sleeping for 1.25 seconds.")
-                    await asyncio.sleep(
-                        1.25
-                    )  # This is probably the result of multiple devices, so sleep for a second. Will
-                    # give up on the 4th try though if it is persistent.
-                do_retry = True
-        if resp.status // 100 == 5:  # 5xx
-            do_retry = True
-        if do_retry:
-            if retries > 0:
-                logger.warning("Retrying %s request to %s because of HTTP code %s", method, url, resp.status)
-                return await self.request(
-                    method, url, json=json, with_auth=with_auth, retries=retries - 1, **session_request_kwargs
+                    path_obj = self.ratelimits.find(remove_prefix(self.api_base, url), method)
+                    if path_obj and not path_obj.try_acquire():
+                        raise Ratelimit(path_obj.path.name, path_obj.ratelimit_amount, path_obj.ratelimit_expires)
+            logger.info("Making %s request to %s", method, url)
+            session = self.session if is_api_url else self._session_for(url)
+            try:
+                resp = await session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    **body,
+                    **session_request_kwargs,
                 )
-            else:
-                json_data = None
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if path_obj:
+                    path_obj.abandon()
+                if (
+                    session.closed
+                    or method not in self._idempotent_methods
+                    or not self._can_retry(attempt, retries, budget)
+                ):
+                    raise
+                delay = self.retry_policy.delay(attempt)
+                logger.warning("Retrying %s request to %s in %.2f seconds because of %r", method, url, delay, e)
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            except BaseException:
+                if path_obj:
+                    path_obj.abandon()
+                raise
+            if path_obj:
+                path_obj.update(resp)
+            do_retry = False
+            delay = 0.0
+            if is_api_url:
                 try:
-                    json_data = await resp.json()
+                    self._bodies[resp] = await resp.read()
                 except Exception:
                     pass
-                finally:
-                    raise HTTPException(method, url, resp, json=json_data)
-        elif not allow_non_successful_codes:
-            if not resp.ok:
+                if resp.status == 401:  # Unauthorized
+                    if sent_token and self.refresh_token and not tried_refresh:  # Invalid session token
+                        tried_refresh = True
+                        if self._session_token == sent_token:
+                            # Only refresh the token if another request has not refreshed it already.
+                            self.session_token = None
+                            await self.get_session_token()
+                        do_retry = True
+                    elif self.username and self.password:  # Invalid refresh token
+                        await self._single_flight(("login",), self.login)
+                        if remove_prefix(self.api_base, url) == routes["session_token"]:
+                            return  # Just drop it for now because the login endpoint took care of it
+                        do_retry = True
+                    else:
+                        try:
+                            raise Unauthorized(method, url, resp)
+                        finally:
+                            resp.close()
+                elif resp.status in [403, 412]:
+                    site_key = resp.headers.get("X-Captcha-Sitekey", "")
+                    if site_key:
+                        raise Captcha(site_key, method, url, resp)
+                elif resp.status == 429:  # Ratelimit error. This should be handled by ratelimits but I'll handle it
+                    # here as well. This is probably the result of multiple devices sharing the ratelimit.
+                    do_retry = True
+                    delay = self.retry_policy.delay(attempt, parse_retry_after(resp.headers))
+            if resp.status // 100 == 5:  # 5xx
+                do_retry = True
+                delay = self.retry_policy.delay(attempt, parse_retry_after(resp.headers))
+            # Retries after refreshing the authentication are not failures, so they do not use the retry budget.
+            if do_retry and (attempt < retries if resp.status == 401 else self._can_retry(attempt, retries, budget)):
+                logger.warning(
+                    "Retrying %s request to %s in %.2f seconds because of HTTP code %s", method, url, delay, resp.status
+                )
+                resp.close()
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            if do_retry or (not allow_non_successful_codes and not resp.ok):
                 json_data = None
                 try:
-                    json_data = await resp.json()
+                    json_data = await self._json(resp)
                 except Exception as e:
-                    logger.warning("%s while trying to see response: %s", type(e).__name__, e)
+                    if not do_retry:
+                        logger.warning("%s while trying to see response: %s", type(e).__name__, e)
                 finally:
                     raise HTTPException(method, url, resp, json=json_data)
-        return resp
+            return resp
+
+    _idempotent_methods = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def _can_retry(self, attempt: int, retries: int, budget: Optional[RetryBudget]) -> bool:
+        if attempt >= retries:
+            return False
+        if budget is not None and not budget.withdraw():
+            logger.warning("Not retrying because the retry budget of the route is exhausted.")
+            return False
+        return True
+
+    _coalescable_kwargs = frozenset({"add_includes", "allow_non_successful_codes", "priority"})
+
+    def _session_for(self, url: str) -> aiohttp.ClientSession:
+        """Get the session whose connection pool is used for a URL."""
+        if url.startswith(self.api_base):
+            return self.session
+        if url.startswith(uploads_url):
+            return self.upload_session
+        return self.image_session
+
+    async def warm_up(self, connections: int = 1) -> int:
+        """Open connections to the API ahead of time, so that the first requests do not have to wait for DNS lookups
+        and TLS handshakes. One ping request is made for each connection, and every response is kept until all of
+        them arrived so that each request needs a connection of its own. The requests respect the global ratelimit.
+
+        .. versionadded:: 1.2
+
+        .. seealso:: The ``warm_connections`` parameter of :class:`.MangadexClient`.
+
+        :param connections: The amount of connections to open. Defaults to ``1``.
+        :type connections: int
+        :return: The amount of connections that were opened. Failures are logged instead of raised.
+        :rtype: int
+        """
+
+        async def ping() -> aiohttp.ClientResponse:
+            await self.global_ratelimit.acquire()
+            return await self.session.get(self.api_base + routes["ping"])
+
+        opened = 0
+        cancelled: Optional[asyncio.CancelledError] = None
+        for result in await asyncio.gather(*(ping() for _ in range(connections)), return_exceptions=True):
+            if isinstance(result, asyncio.CancelledError):
+                cancelled = result
+            elif isinstance(result, BaseException):
+                logger.warning("Could not open a connection to the API: %s: %s", type(result).__name__, result)
+            else:
+                # Reading the body lets the connection go back to the pool instead of being closed.
+                await result.read()
+                result.release()
+                opened += 1
+        if cancelled is not None:
+            # The other responses are released first so that their connections are not leaked.
+            raise cancelled
+        return opened
+
+    async def _read(self, resp: aiohttp.ClientResponse) -> bytes:
+        """Read the body of a response."""
+        # A response whose body was read can be released, such as a cached response. aiohttp refuses to read released
+        # responses, so the body kept when the response was received is used instead.
+        body = self._bodies.get(resp)
+        if body is None:
+            body = self._bodies[resp] = await resp.read()
+        return body
+
+    async def _json(self, resp: aiohttp.ClientResponse) -> Any:
+        """Decode the body of a response with :attr:`.json_codec`. Bodies larger than :attr:`.json_thread_threshold`
+        are decoded in the default executor, since decoding them blocks the event loop for a long time."""
+        body = await self._read(resp)
+        if not body or body.isspace():
+            return None
+        if self.json_thread_threshold is not None and len(body) > self.json_thread_threshold:
+            return await asyncio.get_running_loop().run_in_executor(None, self.json_codec.loads, body)
+        return self.json_codec.loads(body)
 
     async def _one_off(self, method, url, *, params=None, json=None, with_auth=True, retries=3, **kwargs):
         """Use for one-off requests where we do not care about the response."""
@@ -534,10 +1077,22 @@ class MangadexClient:
 
     async def _get_json(self, method, url, *, params=None, json=None, with_auth=True, retries=3, **kwargs):
         """Used for getting the json quickly when we don't care about request codes."""
-        r = await self.request(method, url, params=params, json=json, with_auth=with_auth, retries=retries, **kwargs)
-        json = await r.json()
-        r.close()
-        return json
+
+        async def get():
+            r = await self.request(
+                method, url, params=params, json=json, with_auth=with_auth, retries=retries, **kwargs
+            )
+            data = await self._json(r)
+            r.close()
+            return data
+
+        if self.coalesce_requests and method == "GET" and json is None and set(kwargs) <= self._coalescable_kwargs:
+            # Share the parsed JSON as well as the response.
+            full_url = self._build_url(url, params, kwargs.get("add_includes", False))
+            return await self._single_flight(
+                ("JSON", full_url, self._cache_identity(with_auth), kwargs.get("allow_non_successful_codes")), get
+            )
+        return await get()
 
     # Authentication
 
@@ -562,6 +1117,8 @@ class MangadexClient:
         if self.anonymous_mode:
             raise Unauthorized(method, path, None)
 
+    _session_token_lifetime = timedelta(minutes=15)
+
     @property
     def session_token(self) -> Optional[str]:
         """The session token tht the client has obtained. This will be None when the client is operating in anonymous
@@ -587,19 +1144,80 @@ class MangadexClient:
             self._session_token_acquired = datetime(year=2000, month=1, day=1)
 
     async def get_session_token(self):
-        """Get the session token and store it inside the client."""
+        """Get the session token and store it inside the client.
+
+        .. versionchanged:: 1.2
+            Concurrent calls share a single request for a new session token.
+        """
+        await self._single_flight(("session_token",), self._get_session_token)
+
+    async def _get_session_token(self):
         if self.refresh_token is None:
             return await self.login()
         r = await self.request("POST", routes["session_token"], json={"token": self.refresh_token}, with_auth=False)
         if r is None:
             return
-        data = await r.json()
+        data = await self._json(r)
         r.close()
         self.session_token = data["token"]["session"]
         self.refresh_token = data["token"]["refresh"]
+        self._save_tokens()
+        self._fetch_user_after_load = False
         if self.user.id == "client-user":
             await self.user.fetch()
 
+    async def _ensure_session_token(self):
+        """Make sure the client has a session token, refreshing it in the background if it expires soon."""
+        if self._fetch_user_after_load and self.session_token is not None:
+            # Tokens loaded from the token store skip the request that normally gets the user's permissions.
+            self._fetch_user_after_load = False
+            await self.user.fetch()
+        if self.session_token is None:
+            await self.get_session_token()
+        elif (
+            self.refresh_token
+            and datetime.utcnow() - self._session_token_acquired
+            >= self._session_token_lifetime - timedelta(seconds=self.session_token_refresh_margin)
+            and ("session_token",) not in self._in_flight
+        ):
+            logger.debug("Refreshing the session token in the background.")
+            task = asyncio.ensure_future(self.get_session_token())
+            task.add_done_callback(self._log_background_refresh)
+
+    @staticmethod
+    def _log_background_refresh(task: asyncio.Future):
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Failed to refresh the session token in the background: %r", task.exception())
+
+    def _load_tokens(self):
+        tokens = self.token_store.load()
+        if tokens is None or (self.username and tokens.username and tokens.username != self.username):
+            return
+        logger.debug("Loaded tokens from %r", self.token_store)
+        self.refresh_token = self._stored_refresh_token = tokens.refresh_token
+        self._refresh_token_acquired = tokens.refresh_token_acquired
+        if tokens.session_token and tokens.session_token_acquired:
+            self._session_token = tokens.session_token
+            self._session_token_acquired = tokens.session_token_acquired
+            self._fetch_user_after_load = True
+        self.anonymous_mode = False
+
+    def _save_tokens(self):
+        if self.token_store is None or not self.refresh_token:
+            return
+        if self.refresh_token != self._stored_refresh_token:
+            self._stored_refresh_token = self.refresh_token
+            self._refresh_token_acquired = datetime.utcnow()
+        self.token_store.save(
+            StoredTokens(
+                refresh_token=self.refresh_token,
+                session_token=self._session_token,
+                session_token_acquired=self._session_token_acquired if self._session_token else None,
+                refresh_token_acquired=self._refresh_token_acquired,
+                username=self.username,
+            )
+        )
+
     async def login(self, username: Optional[str] = None, password: Optional[str] = None):
         """Logs in to the MangaDex API.
 
@@ -621,15 +1239,20 @@ class MangadexClient:
         r = await self.request(
             "POST", routes["login"], json={"username": self.username, "password": self.password}, with_auth=False
         )
-        data = await r.json()
+        data = await self._json(r)
         r.close()
         self.session_token = data["token"]["session"]
         self.refresh_token = data["token"]["refresh"]
+        self._save_tokens()
+        self._fetch_user_after_load = False
         await self.user.fetch()
 
     async def logout(self, delete_tokens: bool = True, clear_login_info: bool = True):
         """Log out from the API.
 
+        .. versionchanged:: 1.2
+            Deleting the tokens also removes them from :attr:`.token_store`.
+
         :param delete_tokens: Whether or not to delete the refresh/session tokens by calling the logout endpoint.
             Defaults to true.
 
@@ -647,6 +1270,8 @@ class MangadexClient:
         if (self.refresh_token or self.session_token) and delete_tokens:
             (await self.request("POST", routes["logout"])).release()
             self.refresh_token = self.session_token = None
+            if self.token_store is not None:
+                self.token_store.clear()
         if clear_login_info:
             self.username = self.password = self.refresh_token = self.session_token = None
             self.anonymous_mode = True
@@ -654,15 +1279,27 @@ class MangadexClient:
 
     # Methods to get models
 
+    def _model(self, model: Type[_ModelT], id: str, data: Optional[Dict[str, Any]] = None) -> _ModelT:
+        """Get the model object for an ID from the identity map, parsing the data into it if it already exists. A new
+        object is made if the identity map is disabled or has no object for the ID. Without data, the new object is a
+        stub made by :meth:`.Model._stub`."""
+        if self.identity_map is None:
+            return model(self, id=id, data=data) if data else model._stub(self, id)
+        key = (model, id)
+        obj = self.identity_map.get(key)
+        if obj is None:
+            obj = self.identity_map[key] = model(self, id=id, data=data) if data else model._stub(self, id)
+        elif data:
+            obj.parse(data)
+        return obj
+
     async def refresh_tag_cache(self):
         """Refresh the internal tag cache.
 
         .. versionadded:: 0.2
         .. seealso:: :attr:`.tag_cache`
         """
-        r = await self.request("GET", routes["tag_list"])
-        json = await r.json()
-        r.close()
+        json = await self._get_json("GET", routes["tag_list"])
         for item in json:
             assert item["data"]["id"], "ID missing from tag list"
             tag_id = item["data"]["id"]
@@ -736,7 +1373,7 @@ class MangadexClient:
         :return: A :class:`.Manga` object.
         :rtype: Manga
         """
-        return Manga(self, id=id)
+        return self._model(Manga, id)
 
     async def random_manga(self) -> Manga:
         """Get a random manga.
@@ -748,7 +1385,7 @@ class MangadexClient:
         """
         r = await self.request("GET", routes["random_manga"], add_includes=True)
         try:
-            return Manga(self, data=await r.json())
+            return Manga(self, data=await self._json(r))
         finally:
             r.close()
 
@@ -769,7 +1406,7 @@ class MangadexClient:
         :return: A :class:`.Author` object.
         :rtype: Author
         """
-        return Author(self, id=id)
+        return self._model(Author, id)
 
     def get_chapter(self, id: str) -> Chapter:
         """Get a chapter using it's ID.
@@ -787,7 +1424,7 @@ class MangadexClient:
         :return: A :class:`.Chapter` object.
         :rtype: Chapter
         """
-        return Chapter(self, id=id)
+        return self._model(Chapter, id)
 
     def get_user(self, id: str) -> User:
         """Get a user using it's ID.
@@ -803,7 +1440,7 @@ class MangadexClient:
         :return: A :class:`.User` object.
         :rtype: User
         """
-        return User(self, id=id)
+        return self._model(User, id)
 
     def get_group(self, id: str) -> Group:
         """Get a group using it's ID.
@@ -819,7 +1456,7 @@ class MangadexClient:
         :return: A :class:`.Group` object.
         :rtype: Group
         """
-        return Group(self, id=id)
+        return self._model(Group, id)
 
     def get_list(self, id: str) -> CustomList:
         """Get a custom list using it's ID.
@@ -851,11 +1488,17 @@ class MangadexClient:
         :return: A :class:`.CoverArt` object.
         :rtype: CoverArt
         """
-        return CoverArt(self, id=id)
+        return self._model(CoverArt, id)
 
     # Batch models
 
-    async def _do_batch(self, items: Tuple[Model, ...], permission: str, route_name: str):
+    def _get_batch_loader(self, permission: str, route_name: str) -> BatchLoader:
+        key = (permission, route_name)
+        if key not in self._batch_loaders:
+            self._batch_loaders[key] = BatchLoader(self, permission, route_name, delay=self.auto_batch_delay)
+        return self._batch_loaders[key]
+
+    async def _do_batch(self, items: Tuple[Model, ...], permission: str, route_name: str) -> Set[str]:
         self.user.permission_exception(permission, "GET", routes[route_name])
         uuid_map: Dict[str, List[Model]] = {}
         for item in items:
@@ -868,16 +1511,21 @@ class MangadexClient:
             uuids = uuids[100:]
             req_list.append(
                 asyncio.create_task(
-                    self._get_json("GET", routes[route_name], params=dict(limit=100, ids=uuids_for_this_batch, add_includes=True))
+                    self._get_json(
+                        "GET", routes[route_name], params=dict(limit=100, ids=uuids_for_this_batch), add_includes=True
+                    )
                 )
             )
         data = await asyncio.gather(*req_list)
+        found = set()
         for results in data:
             for item in results["results"]:
                 item_id = item["data"]["id"]
                 assert item_id, "Missing ID"
-                for obj in uuid_map[item_id]:
+                found.add(item_id)
+                for obj in uuid_map.get(item_id, ()):
                     obj.parse(item)
+        return found
 
     async def batch_authors(self, *authors: Author):
         """Updates a lot of authors at once, reducing the time needed to update tens or hundreds of authors.
@@ -941,7 +1589,7 @@ class MangadexClient:
             batch = manga_list[:100]
             manga_list = manga_list[100:]
             r = await self.request("GET", routes["batch_manga_read"], params={"ids": batch})
-            json = await r.json()
+            json = await self._json(r)
             r.close()
             final_data.extend(json["data"])
         for item in mangas:
@@ -966,7 +1614,9 @@ class MangadexClient:
         order: Optional[Union[GroupListOrder, AuthorListOrder, ChapterListOrder, MangaListOrder]],
     ):
         if order:
-            params["order"] = {k: v.value for k, v in asdict(order) if v}
+            for key, value in asdict(order).items():
+                if value:
+                    params[f"order[{_known_order_mappings.get(key, key)}]"] = value.value
 
     def get_groups(
         self, *, name: Optional[str] = None, order: Optional[GroupListOrder] = None, limit: Optional[int] = None
@@ -1018,6 +1668,7 @@ class MangadexClient:
         published_after: Optional[datetime] = None,
         order: Optional[ChapterListOrder] = None,
         limit: Optional[int] = None,
+        keyset: Optional[str] = None,
     ) -> Pager[Chapter]:
         """Gets a :class:`.Pager` of chapters. |permission| ``chapter.list``
 
@@ -1095,6 +1746,14 @@ class MangadexClient:
                 Pager making more requests than necessary, consuming ratelimits.
 
         :type limit: int
+        :param keyset: Page through the chapters by their ``createdAt`` or ``updatedAt`` attribute instead of by
+            offset, which is needed to get past the maximum offset of the API. Cannot be combined with ``order``.
+
+            .. versionadded:: 1.2
+
+            .. seealso:: :attr:`.Pager.keyset`
+
+        :type keyset: str
         :return: A Pager for the chapters.
         :rtype: Pager
         """
@@ -1121,7 +1780,7 @@ class MangadexClient:
             params["publishAtSince"] = return_date_string(published_after)
         self._add_order(params, order)
         self.user.permission_exception("chapter.list", "GET", routes["chapter_list"])
-        return Pager(routes["chapter_list"], Chapter, self, params=params, limit=limit)
+        return Pager(routes["chapter_list"], Chapter, self, params=params, limit=limit, keyset=keyset)
 
     def get_authors(
         self, *, name: Optional[str] = None, order: Optional[AuthorListOrder] = None, limit: Optional[int] = None
@@ -1177,6 +1836,7 @@ class MangadexClient:
         updated_after: Optional[datetime] = None,
         order: Optional[MangaListOrder] = None,
         limit: Optional[int] = None,
+        keyset: Optional[str] = None,
     ) -> Pager[Manga]:
         r"""Gets a :class:`.Pager` of mangas. |permission| ``manga.list``
 
@@ -1239,6 +1899,14 @@ class MangadexClient:
                 Pager making more requests than necessary, consuming ratelimits.
 
         :type limit: int
+        :param keyset: Page through the mangas by their ``createdAt`` or ``updatedAt`` attribute instead of by
+            offset, which is needed to get past the maximum offset of the API. Cannot be combined with ``order``.
+
+            .. versionadded:: 1.2
+
+            .. seealso:: :attr:`.Pager.keyset`
+
+        :type keyset: str
         :return: A Pager with the manga entries.
         :rtype: Pager
         """
@@ -1269,7 +1937,7 @@ class MangadexClient:
             params["updatedAtSince"] = return_date_string(updated_after)
         self._add_order(params, order)
         self.user.permission_exception("manga.list", "GET", routes["search"])
-        return Pager(routes["search"], Manga, self, params=params, limit=limit)
+        return Pager(routes["search"], Manga, self, params=params, limit=limit, keyset=keyset)
 
     search = get_mangas
     """Alias for :meth:`.get_mangas`."""
@@ -1340,7 +2008,7 @@ class MangadexClient:
         self.raise_exception_if_not_authenticated("POST", routes["author_list"])
         self.user.permission_exception("author.create", "POST", routes["author_list"])
         r = await self.request("POST", routes["author_list"], json=params)
-        json = await r.json()
+        json = await self._json(r)
         r.close()
         return Author(self, data=json)
 
@@ -1363,7 +2031,7 @@ class MangadexClient:
         self.raise_exception_if_not_authenticated("POST", routes["group_list"])
         self.user.permission_exception("scanlation_group.create", "POST", routes["group_list"])
         r = await self.request("POST", routes["group_list"], json=params)
-        json = await r.json()
+        json = await self._json(r)
         r.close()
         return Group(self, data=json)
 
@@ -1485,7 +2153,7 @@ class MangadexClient:
         self.raise_exception_if_not_authenticated("POST", routes["search"])
         self.user.permission_exception("manga.create", "POST", routes["search"])
         r = await self.request("POST", routes["search"], json=params)
-        json = await r.json()
+        json = await self._json(r)
         r.close()
         return Manga(self, data=json)
 
@@ -1513,7 +2181,7 @@ class MangadexClient:
                 routes["cover_upload"].format(mangaId=manga.id if isinstance(manga, Manga) else manga),
                 files=files,
             )
-            json = await r.json()
+            json = await self._json(r)
             r.close()
             cover = CoverArt(self, data=json)
             if isinstance(manga, Manga):
@@ -1643,7 +2311,7 @@ class MangadexClient:
         )
         try:
             if not r.ok:
-                raise InvalidCaptcha(r, json=await r.json())
+                raise InvalidCaptcha(r, json=await self._json(r))
         finally:
             r.close()
 
@@ -1685,7 +2353,7 @@ class MangadexClient:
         else:
             raise ValueError("Model param must be a (sub)class of Manga, Chapter, Group, or Tag.")
         r = await self.request("POST", routes["legacy"], json={"type": conversion_type, "ids": ids})
-        json = await r.json()
+        json = await self._json(r)
         r.close()
         for item in json:
             attribs = item["data"]["attributes"]
@@ -0,0 +1,150 @@
+from typing import Any, Optional
+
+import aiohttp
+
+
+class ConnectionPool:
+    """The settings of the connections a :class:`.MangadexClient` makes for one kind of traffic. Each pool has its
+    own :class:`aiohttp.TCPConnector`, so that traffic of one kind cannot use up the connections of another, such as
+    large image downloads keeping API requests waiting for a connection.
+
+    .. versionadded:: 1.2
+
+    .. seealso:: :class:`.ConnectionPools`
+
+    :param limit: The maximum amount of open connections. ``0`` means no limit. Defaults to ``100``.
+    :type limit: int
+    :param limit_per_host: The maximum amount of open connections to one host. ``0`` means no limit. Defaults to
+        ``0``.
+    :type limit_per_host: int
+    :param keepalive_timeout: How many seconds an idle connection is kept open to be reused. ``0`` closes every
+        connection after its response. Defaults to ``15``.
+    :type keepalive_timeout: float
+    :param dns_cache_ttl: How many seconds the results of DNS lookups are cached, or ``None`` to cache them forever.
+        Defaults to ``10``.
+    :type dns_cache_ttl: Optional[int]
+    :param compress: Whether or not to ask the server for compressed responses. Images are already compressed, so
+        asking for compression only costs time. Defaults to ``True``.
+    :type compress: bool
+    :raises: :class:`ValueError` if ``limit``, ``limit_per_host``, or ``keepalive_timeout`` is negative.
+    """
+
+    limit: int
+    """The maximum amount of open connections, or ``0`` for no limit."""
+
+    limit_per_host: int
+    """The maximum amount of open connections to one host, or ``0`` for no limit."""
+
+    keepalive_timeout: float
+    """How many seconds an idle connection is kept open, or ``0`` to close every connection after its response."""
+
+    dns_cache_ttl: Optional[int]
+    """How many seconds the results of DNS lookups are cached, or ``None`` to cache them forever."""
+
+    compress: bool
+    """Whether or not to ask the server for compressed responses."""
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15,
+        dns_cache_ttl: Optional[int] = 10,
+        compress: bool = True,
+    ):
+        if min(limit, limit_per_host, keepalive_timeout) < 0:
+            raise ValueError("The limits and the keepalive timeout cannot be negative.")
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.compress = compress
+
+    def connector(self) -> aiohttp.TCPConnector:
+        """Make a connector with the settings of the pool.
+
+        :return: The connector.
+        :rtype: aiohttp.TCPConnector
+        """
+        if self.keepalive_timeout:
+            keepalive = {"keepalive_timeout": self.keepalive_timeout}
+        else:
+            keepalive = {"force_close": True}
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+            **keepalive,
+        )
+
+    def session(self, **session_kwargs: Any) -> aiohttp.ClientSession:
+        """Make a session using a new connector of the pool.
+
+        :param session_kwargs: Optional keyword arguments to pass on to the :class:`aiohttp.ClientSession`.
+        :return: The session.
+        :rtype: aiohttp.ClientSession
+        """
+        if not self.compress:
+            # Without an Accept-Encoding header, aiohttp asks for gzip and deflate.
+            session_kwargs["headers"] = {"Accept-Encoding": "identity", **(session_kwargs.get("headers") or {})}
+        return aiohttp.ClientSession(connector=self.connector(), **session_kwargs)
+
+    def __repr__(self) -> str:
+        """Provide a string representation of the object.
+
+        :return: The string representation
+        :rtype: str
+        """
+        return (
+            f"{type(self).__name__}(limit={self.limit!r}, limit_per_host={self.limit_per_host!r}, "
+            f"keepalive_timeout={self.keepalive_timeout!r}, dns_cache_ttl={self.dns_cache_ttl!r}, "
+            f"compress={self.compress!r})"
+        )
+
+
+class ConnectionPools:
+    """The :class:`.ConnectionPool` of each kind of traffic of a :class:`.MangadexClient`. Requests to the API use
+    :attr:`.api`, requests to :data:`.uploads_url`, such as covers, use :attr:`.uploads`, and requests to any other
+    host, such as the MD@H nodes returned by :meth:`.Chapter.pages`, use :attr:`.images`.
+
+    .. versionadded:: 1.2
+
+    .. seealso:: The ``connection_pools`` parameter of :class:`.MangadexClient`.
+
+    :param api: The pool for the API. Defaults to a pool of ``100`` connections that are kept open for ``60`` seconds,
+        with DNS lookups cached for ``300`` seconds.
+    :type api: ConnectionPool
+    :param images: The pool for the MD@H nodes. Defaults to a pool of ``100`` connections with at most ``8`` per node
+        and no compression.
+    :type images: ConnectionPool
+    :param uploads: The pool for the uploads host. Defaults to a pool of ``100`` connections with no compression.
+    :type uploads: ConnectionPool
+    """
+
+    api: ConnectionPool
+    """The pool for the API."""
+
+    images: ConnectionPool
+    """The pool for the MD@H nodes and any other host."""
+
+    uploads: ConnectionPool
+    """The pool for the uploads host."""
+
+    def __init__(
+        self,
+        api: Optional[ConnectionPool] = None,
+        images: Optional[ConnectionPool] = None,
+        uploads: Optional[ConnectionPool] = None,
+    ):
+        self.api = api or ConnectionPool(keepalive_timeout=60, dns_cache_ttl=300)
+        self.images = images or ConnectionPool(limit=100, limit_per_host=8, compress=False)
+        self.uploads = uploads or ConnectionPool(compress=False)
+
+    def __repr__(self) -> str:
+        """Provide a string representation of the object.
+
+        :return: The string representation
+        :rtype: str
+        """
+        return f"{type(self).__name__}(api={self.api!r}, images={self.images!r}, uploads={self.uploads!r})"
@@ -111,6 +111,29 @@ ratelimit_data: List[PathRatelimit] = [
 .. versionchanged:: 0.3
 """
 
+cache_ttls: Dict[str, float] = {
+    "/author/{id}": 10 * 60,
+    "/chapter/{id}": 5 * 60,
+    "/cover/{id}": 10 * 60,
+    "/group/{id}": 10 * 60,
+    "/list/{id}": 5 * 60,
+    "/manga/{id}": 5 * 60,
+    "/manga/{id}/aggregate": 5 * 60,
+    "/manga/random": 0,
+    "/manga/read": 0,
+    "/manga/status": 0,
+    "/manga/tag": 60 * 60,
+    "/user/{id}": 10 * 60,
+    "/user/list": 0,
+    "/user/me": 0,
+}
+"""The default amount of seconds that responses from read-only routes are kept in a :class:`.ResponseCache`. Routes
+that return a different result every time, or that return the state of the logged in user, have a TTL of ``0``
+because they would otherwise match a route with a variable, such as ``/manga/random`` matching ``/manga/{id}``.
+
+.. versionadded:: 1.2
+"""
+
 routes: Dict[str, str] = {
     "activate_account": "/account/activate/{code}",
     "aggregate": "/manga/{id}/aggregate",
@@ -178,3 +201,9 @@ permission_model_mapping: Dict[str, str] = {
 
 .. versionadded:: 1.1
 """
+
+uploads_url: str = "https://uploads.mangadex.org"
+"""The base URL of the host serving uploaded files, such as covers.
+
+.. versionadded:: 1.2
+"""
@@ -1,4 +1,4 @@
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 
 
 class Demographic(Enum):
@@ -295,3 +295,21 @@ class TagMode(Enum):
 
     OR = "OR"
     """Manga is included/excluded if **any** tag is present."""
+
+
+class RequestPriority(IntEnum):
+    """An enum representing the priority of a request when it has to wait for a ratelimit. Requests with a higher
+    priority are sent before requests with a lower priority, and requests with the same priority are sent in the order
+    they were made.
+
+    .. versionadded:: 1.2
+    """
+
+    HIGH = 0
+    """A request that something is waiting on, such as a user interaction."""
+
+    NORMAL = 1
+    """The default priority."""
+
+    LOW = 2
+    """A request that can wait, such as a request made by a background crawl."""
@@ -70,7 +70,6 @@ class HTTPException(AsyncDexException, ClientResponseError):
         self.json = json
         if json and json.get("errors", None):
             self.json["errors"] = [AttrDict(item) for item in self.json["errors"]]
-        if self.json:
             primary_error = self.json["errors"][0]
             msg = "{primary_error.title}: {primary_error.detail}"
             if getattr(primary_error, "context", None):
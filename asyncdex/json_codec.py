@@ -0,0 +1,130 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Union
+
+
+class JSONCodec(ABC):
+    """An ABC representing a JSON library used by a :class:`.MangadexClient` to decode responses and encode request
+    bodies. Cannot be instantiated.
+
+    .. versionadded:: 1.2
+
+    .. seealso:: The ``json_codec`` parameter of :class:`.MangadexClient` and :func:`.default_json_codec`.
+    """
+
+    name: str
+    """The name of the JSON library."""
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document.
+
+        :param data: The document.
+        :type data: Union[bytes, str]
+        :raises: :class:`ValueError` if the document is not valid JSON.
+        :return: The decoded object.
+        :rtype: Any
+        """
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> str:
+        """Encode an object as a JSON document.
+
+        :param obj: The object.
+        :type obj: Any
+        :return: The document.
+        :rtype: str
+        """
+
+    def __repr__(self) -> str:
+        """Provide a string representation of the object.
+
+        :return: The string representation
+        :rtype: str
+        """
+        return f"{type(self).__name__}()"
+
+    def __reduce__(self):
+        # Codecs are pickled as their class, so that they can be sent to worker processes even if they hold a module.
+        return type(self), ()
+
+
+class StdlibJSONCodec(JSONCodec):
+    """A :class:`.JSONCodec` using the :mod:`json` module of the standard library. It is always available.
+
+    .. versionadded:: 1.2
+    """
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JSONCodec):
+    """A :class:`.JSONCodec` using `orjson <https://github.com/ijl/orjson>`_, which is several times faster than
+    :mod:`json`.
+
+    .. versionadded:: 1.2
+
+    :raises: :class:`RuntimeError` if orjson is not installed.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError:
+            raise RuntimeError(f"{type(self).__name__} requires orjson to be installed.") from None
+        self._orjson = orjson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self._orjson.dumps(obj).decode()
+
+
+class UjsonCodec(JSONCodec):
+    """A :class:`.JSONCodec` using `ujson <https://github.com/ultrajson/ultrajson>`_, which is faster than :mod:`json`.
+
+    .. versionadded:: 1.2
+
+    :raises: :class:`RuntimeError` if ujson is not installed.
+    """
+
+    name = "ujson"
+
+    def __init__(self):
+        try:
+            import ujson
+        except ImportError:
+            raise RuntimeError(f"{type(self).__name__} requires ujson to be installed.") from None
+        self._ujson = ujson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._ujson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self._ujson.dumps(obj)
+
+
+def default_json_codec() -> JSONCodec:
+    """Get the fastest :class:`.JSONCodec` that is installed: :class:`.OrjsonCodec`, then :class:`.UjsonCodec`, then
+    :class:`.StdlibJSONCodec`.
+
+    .. versionadded:: 1.2
+
+    :return: The codec.
+    :rtype: JSONCodec
+    """
+    for codec in (OrjsonCodec, UjsonCodec):
+        try:
+            return codec()
+        except RuntimeError:
+            pass
+    return StdlibJSONCodec()
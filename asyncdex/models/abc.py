@@ -1,13 +1,15 @@
 """Contains ABCs for the various models"""
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, TYPE_CHECKING, TypeVar
+from functools import partial
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, TYPE_CHECKING, Tuple, Type, TypeVar
 
 from aiohttp import ClientResponse
 
 from ..constants import routes
+from .fields import Field, compile_fields
 from ..exceptions import InvalidID, Missing
-from ..utils import copy_key_to_attribute, parse_relationships
+from ..utils import parse_relationships
 
 if TYPE_CHECKING:
     from ..client import MangadexClient
@@ -20,6 +22,10 @@ class Model(ABC):
 
     .. versionadded:: 0.2
 
+    .. versionchanged:: 1.2
+        Models use ``__slots__`` instead of a ``__dict__``, so attributes that are not documented cannot be set on
+        them. Subclasses that do not define ``__slots__`` get a ``__dict__`` as usual.
+
     :raises: :class:`.Missing` if there is no valid ID in the model after parsing provided data.
     :param data: The data received from the server. May be None if there is no data yet.
     :type data: Dict[str, Any]
@@ -34,6 +40,25 @@ class Model(ABC):
     client: "MangadexClient"
     """The client that created this model."""
 
+    __slots__ = ("client", "id", "version", "_raw", "__weakref__")
+
+    _batch_route: Optional[Tuple[str, str]] = None
+    # The permission and route name of the batch endpoint for the model, used to batch fetches.
+
+    _fields: Tuple[Field, ...] = ()
+    # The fields decoded from the attributes of the model by _parse_fields.
+
+    _field_map: Dict[str, Field] = {}
+    # The fields by the names of the attributes they set, made from _fields when the class is created.
+
+    _decode_fields: Callable[["Model", Dict[str, Any]], None]
+    # A function setting every field, compiled from _fields when the class is created.
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_map = {attribute: field for field in cls._fields for attribute in field.attributes}
+        cls._decode_fields = compile_fields(cls._fields)
+
     def __init__(
         self,
         client: "MangadexClient",
@@ -45,11 +70,27 @@ class Model(ABC):
         self.client = client
         self.id = id
         self.version = version
+        self._raw = None
+        # The JSON of the model while its fields are decoded lazily, ``False`` once the fields have been decoded, or
+        # ``None`` if the model was never parsed.
         if data:
             self.parse(data)
         if not self.id:
             raise Missing("id", type(self).__name__)
 
+    @classmethod
+    def _stub(cls: Type[_T], client: "MangadexClient", id: str) -> _T:
+        """Make a model that only has an ID, such as a relationship of another model, without going through
+        :meth:`.__init__` and :meth:`.parse`. Subclasses that set attributes in :meth:`.__init__` set them here too."""
+        if not id:
+            raise Missing("id", cls.__name__)
+        obj = cls.__new__(cls)
+        obj.client = client
+        obj.id = id
+        obj.version = 0
+        obj._raw = None
+        return obj
+
     @abstractmethod
     def parse(self, data: Dict[str, Any]):
         """Parse the data received from the server.
@@ -60,11 +101,63 @@ class Model(ABC):
         if "result" in data:
             assert data["result"] == "ok"
         if "data" in data:
-            copy_key_to_attribute(data["data"], "id", self)
-            if "attributes" in data["data"]:
-                copy_key_to_attribute(
-                    data["data"]["attributes"], "version", self, transformation=lambda num: int(num) if num else num
-                )
+            model_data = data["data"]
+            if "id" in model_data:
+                self.id = model_data["id"]
+            if "attributes" in model_data and "version" in model_data["attributes"]:
+                version = model_data["attributes"]["version"]
+                self.version = int(version) if version else version
+
+    def __getattr__(self, name: str) -> Any:
+        # This is only called when an attribute is not set. The fields of a lazily parsed model are decoded here the
+        # first time they are used.
+        field = type(self)._field_map.get(name)
+        if field is not None:
+            try:
+                data = object.__getattribute__(self, "_raw")
+            except AttributeError:
+                data = None
+            if data:
+                self._set_unset(field.decode(self, data))
+                try:
+                    return object.__getattribute__(self, name)
+                except AttributeError:
+                    pass
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def _set_unset(self, values: Dict[str, Any]):
+        """Set the attributes that are not set yet, so that decoding a field lazily does not replace values that were
+        changed after the model was parsed."""
+        for attribute, value in values.items():
+            try:
+                object.__getattribute__(self, attribute)
+            except AttributeError:
+                setattr(self, attribute, value)
+
+    def _parse_fields(self, data: Dict[str, Any]):
+        """Decode the :attr:`._fields` of the model from its JSON. If the client parses models lazily, the JSON is
+        kept instead, and each field is decoded the first time it is used."""
+        previous = self._raw
+        if self.client.lazy_parsing:
+            if previous is not None:
+                # The model was parsed before. Forget the fields that the new data has a value for, and decode the
+                # other fields from the previous data so that they are not lost.
+                for field in self._fields:
+                    if field.provided(data):
+                        for attribute in field.attributes:
+                            try:
+                                delattr(self, attribute)
+                            except AttributeError:
+                                pass
+                    elif previous:
+                        self._set_unset(field.decode(self, previous))
+            self._raw = data
+            return
+        if previous:
+            for field in self._fields:
+                self._set_unset(field.decode(self, previous))
+        self._decode_fields(data)
+        self._raw = False
 
     @abstractmethod
     async def fetch(self):
@@ -116,10 +209,24 @@ class Model(ABC):
         if type(self) != type(new_obj):
             raise ValueError(f"Expected 'new_obj' to be {type(self).__name__!r}, got {type(new_obj).__name__!r}.")
         if new_obj.version > self.version:
-            for attribute, value in vars(new_obj).items():
+            for attribute, value in new_obj._attributes():
                 if value != getattr(self, attribute, None):
                     setattr(self, attribute, value)
 
+    def _attributes(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over the names and values of the attributes that are set on the model, in its slots and in its
+        ``__dict__`` if it has one."""
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if name in ("__weakref__", "__dict__", "_raw"):
+                    continue
+                try:
+                    yield name, getattr(self, name)
+                except AttributeError:
+                    pass
+        if hasattr(self, "__dict__"):
+            yield from vars(self).items()
+
     def _parse_relationships(self, data: dict):
         parse_relationships(data, self)
 
@@ -130,10 +237,13 @@ class Model(ABC):
     async def _fetch(self, permission: Optional[str], route_name: str):
         if permission:
             self.client.user.permission_exception(permission, "GET", routes[route_name])
-        r = await self.client.request("GET", routes[route_name].format(id=self.id), add_includes=True)
-        self._check_404(r)
-        self.parse(await r.json())
-        r.close()
+        if self.client.auto_batch and self._batch_route:
+            await self.client._get_batch_loader(*self._batch_route).load(self, partial(self._fetch_single, route_name))
+        else:
+            await self._fetch_single(route_name)
+
+    async def _fetch_single(self, route_name: str):
+        self.parse(await self.client._get_json("GET", routes[route_name].format(id=self.id), add_includes=True))
 
     def __hash__(self):
         return hash((self.id, self.version, self.client))
@@ -1,13 +1,11 @@
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, Optional
 
 from .abc import Model
+from .fields import Field, MethodField
 from .manga_list import MangaList
 from .mixins import DatetimeMixin
 from ..constants import routes
-from ..utils import DefaultAttrDict, copy_key_to_attribute
-
-if TYPE_CHECKING:
-    from ..client import MangadexClient
+from ..utils import DefaultAttrDict, intern_string, return_none
 
 
 class Author(Model, DatetimeMixin):
@@ -19,51 +17,75 @@ class Author(Model, DatetimeMixin):
     .. versionadded:: 0.2
     """
 
+    __slots__ = ("name", "image", "_biographies", "_mangas", "created_at", "updated_at")
+
+    _batch_route = ("author.list", "author_list")
+
+    _fields = (
+        Field("name"),
+        Field("imageUrl", "image"),
+        MethodField(("_biographies",), "_decode_biographies", keys=("biography",)),
+        *DatetimeMixin._datetime_fields,
+    )
+
     name: str
     """The name of the author."""
 
     image: Optional[str]
     """An image of the author, if available."""
 
-    biographies: DefaultAttrDict[Optional[str]]
-    """A :class:`.DefaultAttrDict` holding the biographies of the author."""
+    @property
+    def biographies(self) -> DefaultAttrDict[Optional[str]]:
+        """A :class:`.DefaultAttrDict` holding the biographies of the author.
 
-    mangas: MangaList
-    """A list of all the mangas that belong to the author.
-    
-    .. note::
-        In order to efficiently get all mangas in one go, use:
-        
-        .. code-block:: python
-        
-            await author.load_mangas()
-    """
+        :rtype: DefaultAttrDict[Optional[str]]
+        """
+        try:
+            return self._biographies
+        except AttributeError:
+            self._biographies = DefaultAttrDict(default=return_none)
+            return self._biographies
 
-    def __init__(
-        self,
-        client: "MangadexClient",
-        *,
-        id: Optional[str] = None,
-        version: int = 0,
-        data: Optional[Dict[str, Any]] = None,
-    ):
-        self.mangas = MangaList(client)
-        self.biographies = DefaultAttrDict(default=lambda: None)
-        super().__init__(client, id=id, version=version, data=data)
+    @biographies.setter
+    def biographies(self, value: DefaultAttrDict[Optional[str]]):
+        self._biographies = value
+
+    @property
+    def mangas(self) -> MangaList:
+        """A list of all the mangas that belong to the author.
+
+        .. note::
+            In order to efficiently get all mangas in one go, use:
+
+            .. code-block:: python
+
+                await author.load_mangas()
+
+        :rtype: MangaList
+        """
+        try:
+            return self._mangas
+        except AttributeError:
+            self._mangas = MangaList(self.client)
+            return self._mangas
+
+    @mangas.setter
+    def mangas(self, value: MangaList):
+        self._mangas = value
 
     def parse(self, data: Dict[str, Any]):
         super().parse(data)
         if "data" in data and "attributes" in data["data"]:
-            attributes = data["data"]["attributes"]
-            copy_key_to_attribute(attributes, "name", self)
-            copy_key_to_attribute(attributes, "imageUrl", self, "image")
-            if "biography" in attributes and attributes["biography"]:
-                for item in attributes["biography"]:
-                    for key, value in item.items():
-                        self.biographies[key] = value
-            self._process_times(attributes)
+            self._parse_fields(data)
             self._parse_relationships(data)
 
+    def _decode_biographies(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        biographies = DefaultAttrDict(default=return_none)
+        for item in data["data"]["attributes"]["biography"] or []:
+            for key, value in item.items():
+                biographies[intern_string(key)] = value
+        return {"_biographies": biographies}
+
     async def fetch(self):
         """Fetch data about the author. |permission| ``author.view``
 
@@ -92,7 +114,7 @@ class Author(Model, DatetimeMixin):
         params = {"name": self.name, "version": self.version}
         self.client.raise_exception_if_not_authenticated("PUT", routes["author"])
         r = await self.client.request("PUT", routes["author"].format(id=self.id), json=params)
-        json = await r.json()
+        json = await self.client._json(r)
         r.close()
         obj = type(self)(self.client, data=json)
         self.transfer(obj)
@@ -9,11 +9,12 @@ from typing import Any, Dict, List, Optional, TYPE_CHECKING, Tuple
 from aiohttp import ClientError
 
 from .abc import GenericModelList, Model
+from .fields import Field, MethodField
 from .group import Group
 from .mixins import DatetimeMixin
 from .user import User
 from ..constants import invalid_folder_name_regex, routes
-from ..utils import copy_key_to_attribute
+from ..utils import intern_string, relationship_models
 
 logger = getLogger(__name__)
 
@@ -28,6 +29,38 @@ class Chapter(Model, DatetimeMixin):
     .. versionadded:: 0.3
     """
 
+    __slots__ = (
+        "volume",
+        "number",
+        "title",
+        "language",
+        "hash",
+        "page_names",
+        "data_saver_page_names",
+        "publish_time",
+        "manga",
+        "user",
+        "groups",
+        "read",
+        "created_at",
+        "updated_at",
+    )
+
+    _batch_route = ("chapter.list", "chapter_list")
+
+    _fields = (
+        Field("volume"),
+        Field("title"),
+        Field("chapter", "number"),
+        Field("translatedLanguage", "language", intern_string),
+        Field("hash"),
+        Field("data", "page_names"),
+        Field("dataSaver", "data_saver_page_names"),
+        Field("publishAt", "publish_time", datetime.fromisoformat),
+        *DatetimeMixin._datetime_fields,
+        MethodField(("manga", "user", "groups"), "_decode_relationships", relationships=True),
+    )
+
     volume: Optional[str]
     """The volume of the chapter. ``None`` if the chapter belongs to no volumes."""
 
@@ -95,6 +128,12 @@ class Chapter(Model, DatetimeMixin):
         self.read = False
         super().__init__(client, id=id, version=version, data=data)
 
+    @classmethod
+    def _stub(cls, client: "MangadexClient", id: str) -> "Chapter":
+        obj = super()._stub(client, id)
+        obj.read = False
+        return obj
+
     @property
     def name(self) -> str:
         """Returns a nicely formatted name based on available fields. Includes the volume number, chapter number,
@@ -149,11 +188,11 @@ class Chapter(Model, DatetimeMixin):
         """
         if not hasattr(self, "page_names"):
             await self.fetch()
-        r = await self.client.request(
-            "GET", routes["md@h"].format(chapterId=self.id), params={"forcePort443": ssl_only}
-        )
-        base_url = (await r.json())["baseUrl"]
-        r.close()
+        base_url = (
+            await self.client._get_json(
+                "GET", routes["md@h"].format(chapterId=self.id), params={"forcePort443": ssl_only}
+            )
+        )["baseUrl"]
         return [
             f"{base_url}/{'data-saver' if data_saver else 'data'}/{self.hash}/{filename}"
             for filename in (self.data_saver_page_names if data_saver else self.page_names)
@@ -299,35 +338,19 @@ class Chapter(Model, DatetimeMixin):
     def parse(self, data: Dict[str, Any]):
         super().parse(data)
         if "data" in data and "attributes" in data["data"]:
-            attributes = data["data"]["attributes"]
-            copy_key_to_attribute(attributes, "volume", self)
-            copy_key_to_attribute(attributes, "title", self)
-            copy_key_to_attribute(attributes, "chapter", self, "number")
-            copy_key_to_attribute(attributes, "translatedLanguage", self, "language")
-            copy_key_to_attribute(attributes, "hash", self)
-            copy_key_to_attribute(attributes, "data", self, "page_names")
-            copy_key_to_attribute(attributes, "dataSaver", self, "data_saver_page_names")
-            self._process_times(attributes)
-            self._parse_relationships(data)
-            if hasattr(self, "_users"):
-                self.user = self._users[0]
-                del self._users
-            if hasattr(self, "mangas"):
-                # This is needed to move the list of Mangas created by the parse_relationships function into a
-                # singular manga, since there can never be >1 manga per chapter.
-                self.mangas: List[Manga]
-                self.manga = self.mangas[0]
-                del self.mangas
-
-    def _process_times(self, attributes: Dict[str, str]):
-        super()._process_times(attributes)
-        copy_key_to_attribute(
-            attributes,
-            "publishAt",
-            self,
-            "publish_time",
-            transformation=lambda attrib: datetime.fromisoformat(attrib) if attrib else attrib,
-        )
+            self._parse_fields(data)
+
+    def _decode_relationships(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        relationships = relationship_models(data, self.client)
+        values = {}
+        if "groups" in relationships:
+            values["groups"] = relationships["groups"]
+        if "_users" in relationships:
+            values["user"] = relationships["_users"][0]
+        if "mangas" in relationships:
+            # There can never be more than one manga per chapter.
+            values["manga"] = relationships["mangas"][0]
+        return values
 
     async def fetch(self):
         """Fetch data about the chapter. |permission| ``chapter.view``
@@ -390,6 +413,6 @@ class Chapter(Model, DatetimeMixin):
         """
         r = await self.client.request("GET", routes["manga_read"].format(id=self.manga.id))
         self.manga._check_404(r)
-        json = await r.json()
+        json = await self.client._json(r)
         r.close()
         self.read = self.id in json["data"]
@@ -142,6 +142,7 @@ class ChapterList(ModelList[Chapter]):
         published_after: Optional[datetime] = None,
         order: Optional[MangaFeedListOrder] = None,
         limit: Optional[int] = None,
+        keyset: Optional[str] = None,
     ):
         """Gets the list of chapters.
 
@@ -187,6 +188,14 @@ class ChapterList(ModelList[Chapter]):
 
         :param limit: Only return up to this many chapters.
         :type limit: int
+        :param keyset: Page through the chapters by their ``createdAt`` or ``updatedAt`` attribute instead of by
+            offset, which is needed to get past the maximum offset of the API. Cannot be combined with ``order``.
+
+            .. versionadded:: 1.2
+
+            .. seealso:: :attr:`.Pager.keyset`
+
+        :type keyset: str
         """
         params = {}
         if languages:
@@ -205,6 +214,7 @@ class ChapterList(ModelList[Chapter]):
             params=params,
             limit_size=500,
             limit=limit,
+            keyset=keyset,
         ):
             item.manga = self.manga
             if item in self:
@@ -726,7 +736,7 @@ class ChapterList(ModelList[Chapter]):
         self.manga.client.raise_exception_if_not_authenticated("GET", routes["manga_read"])
         r = await self.manga.client.request("GET", routes["manga_read"].format(id=self.manga.id))
         self.manga._check_404(r)
-        json = await r.json()
+        json = await self.manga.client._json(r)
         r.close()
         self._update_read_data(json)
 
@@ -81,7 +81,7 @@ class ClientUser(User):
     async def fetch(self):
         """Fetch data about the client user."""
         r = await self.client.request("GET", routes["auth_check"])
-        json = await r.json()
+        json = await self.client._json(r)
         r.close()
         if not json["isAuthenticated"]:
             await self.client.logout(delete_tokens=False)
@@ -94,7 +94,7 @@ class ClientUser(User):
         """Fetch data about the client user from MangaDex servers. This will get the user's UUID. |auth|"""
         self.client.raise_exception_if_not_authenticated("GET", routes["logged_in_user"])
         r = await self.client.request("GET", routes["logged_in_user"])
-        json = await r.json()
+        json = await self.client._json(r)
         r.close()
         self.parse(data=json)
 
@@ -1,10 +1,10 @@
 from typing import Any, Dict, Optional, TYPE_CHECKING
 
 from .abc import Model
+from .fields import Field
 from .mixins import DatetimeMixin
 from .user import User
-from ..constants import routes
-from ..utils import copy_key_to_attribute
+from ..constants import routes, uploads_url
 
 if TYPE_CHECKING:
     from .manga import Manga
@@ -17,6 +17,10 @@ class CoverArt(Model, DatetimeMixin):
     .. versionadded:: 1.0
     """
 
+    _batch_route = ("cover.list", "cover_list")
+
+    _fields = (Field("name"), Field("fileName", "file_name"), Field("volume"), *DatetimeMixin._datetime_fields)
+
     description: str
     """The description of the cover art."""
 
@@ -40,7 +44,7 @@ class CoverArt(Model, DatetimeMixin):
         """
         if not hasattr(self, "file_name"):
             await self.fetch()
-        return f"https://uploads.mangadex.org/covers/{self.manga.id}/{self.file_name}"
+        return f"{uploads_url}/covers/{self.manga.id}/{self.file_name}"
 
     async def url_512(self) -> str:
         """Get the <=512 px URL to the cover.
@@ -61,11 +65,7 @@ class CoverArt(Model, DatetimeMixin):
     def parse(self, data: Dict[str, Any]):
         super().parse(data)
         if "data" in data and "attributes" in data["data"]:
-            attributes = data["data"]["attributes"]
-            copy_key_to_attribute(attributes, "name", self)
-            copy_key_to_attribute(attributes, "fileName", self, "file_name")
-            copy_key_to_attribute(attributes, "volume", self)
-            self._process_times(attributes)
+            self._parse_fields(data)
         self._parse_relationships(data)
         if hasattr(self, "_users"):
             self.user = self._users[0]
@@ -86,7 +86,7 @@ class CoverArt(Model, DatetimeMixin):
         params = {"volume": self.volume, "description": self.description, "version": self.version}
         self.client.raise_exception_if_not_authenticated("PUT", routes["cover"])
         r = await self.client.request("PUT", routes["cover"].format(id=self.id), json=params)
-        json = await r.json()
+        json = await self.client._json(r)
         r.close()
         obj = type(self)(self.client, data=json)
         self.transfer(obj)
@@ -3,13 +3,14 @@ from typing import Any, Dict, List, Optional
 
 from .abc import Model
 from .chapter import Chapter
+from .fields import Field, MethodField
 from .manga_list import MangaList
 from .pager import Pager
 from .user import User
 from ..constants import routes
 from ..enum import Visibility
 from ..list_orders import MangaFeedListOrder
-from ..utils import copy_key_to_attribute, return_date_string
+from ..utils import return_date_string
 
 
 class CustomList(Model):
@@ -18,6 +19,12 @@ class CustomList(Model):
     .. versionadded:: 0.5
     """
 
+    _fields = (
+        Field("name"),
+        Field("visibility", "visibility", Visibility),
+        MethodField(("owner",), "_decode_owner", keys=("owner",)),
+    )
+
     name: str
     """The name of the custom list."""
 
@@ -40,14 +47,12 @@ class CustomList(Model):
     def parse(self, data: Dict[str, Any]):
         super().parse(data)
         if "data" in data and "attributes" in data["data"]:
-            attributes = data["data"]["attributes"]
-            copy_key_to_attribute(attributes, "name", self)
-            copy_key_to_attribute(attributes, "visibility", self, transformation=lambda item: Visibility(item))
-            copy_key_to_attribute(
-                attributes, "owner", self, transformation=lambda item: User(self.client, data={"data": item})
-            )
+            self._parse_fields(data)
             self._parse_relationships(data)
 
+    def _decode_owner(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {"owner": User(self.client, data={"data": data["data"]["attributes"]["owner"]})}
+
     async def fetch(self):
         """Fetch data about the list."""
         await self._fetch(None, "list")
@@ -0,0 +1,309 @@
+"""Contains the field descriptions used to decode the attributes of models."""
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, TYPE_CHECKING, Tuple, Type
+
+from ..utils import intern_string
+
+if TYPE_CHECKING:
+    from .abc import Model
+    from ..client import MangadexClient
+    from ..json_codec import JSONCodec
+
+_missing = object()
+
+
+class Field:
+    """A field of a model that is copied from a key of the ``attributes`` of the model's JSON, similar to
+    :func:`.copy_key_to_attribute`.
+
+    .. versionadded:: 1.2
+
+    :param key: The key in the attributes.
+    :type key: str
+    :param attribute: The name of the attribute to set. Defaults to the key.
+    :type attribute: str
+    :param converter: A callable applied to the value if it is not empty, such as an enum class.
+    :type converter: Callable[[Any], Any]
+    :param default: The value to use if the key is missing. If not given, the attribute is not set if the key is
+        missing.
+    :type default: Any
+    """
+
+    __slots__ = ("key", "attribute", "converter", "default")
+
+    key: str
+    """The key in the attributes."""
+
+    attribute: str
+    """The name of the attribute to set."""
+
+    converter: Optional[Callable[[Any], Any]]
+    """A callable applied to the value if it is not empty."""
+
+    default: Any
+    """The value to use if the key is missing."""
+
+    def __init__(
+        self,
+        key: str,
+        attribute: Optional[str] = None,
+        converter: Optional[Callable[[Any], Any]] = None,
+        *,
+        default: Any = _missing,
+    ):
+        self.key = key
+        self.attribute = attribute or key
+        self.converter = converter
+        self.default = default
+
+    @property
+    def attributes(self) -> Tuple[str, ...]:
+        """The names of the attributes set by the field.
+
+        :rtype: Tuple[str, ...]
+        """
+        return (self.attribute,)
+
+    def provided(self, data: Dict[str, Any]) -> bool:
+        """Check if the data has a value for the field.
+
+        :param data: The JSON of the model.
+        :type data: Dict[str, Any]
+        :return: Whether or not decoding the data sets the field.
+        :rtype: bool
+        """
+        return self.key in data["data"]["attributes"] or self.default is not _missing
+
+    def decode(self, model: "Model", data: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode the field from the data.
+
+        :param model: The model the data belongs to.
+        :type model: Model
+        :param data: The JSON of the model.
+        :type data: Dict[str, Any]
+        :return: A dictionary of attribute names to values, which is empty if the data has no value for the field.
+        :rtype: Dict[str, Any]
+        """
+        value = data["data"]["attributes"].get(self.key, self.default)
+        if value is _missing:
+            return {}
+        if value and self.converter:
+            value = self.converter(value)
+        return {self.attribute: value}
+
+    def source(self, index: int, namespace: Dict[str, Any]) -> List[str]:
+        """Make the lines of Python code that decode the field for :func:`.compile_fields`. The code has ``self``,
+        ``data``, and ``attributes`` (the attributes of the model's JSON) as local variables.
+
+        :param index: The position of the field, used to give the names added to the namespace unique names.
+        :type index: int
+        :param namespace: The globals of the compiled function. Objects used by the code, such as the converter,
+            are added to it.
+        :type namespace: Dict[str, Any]
+        :return: The lines of code.
+        :rtype: List[str]
+        """
+        assert self.attribute.isidentifier(), f"Invalid attribute name {self.attribute!r}"
+        if self.default is _missing:
+            lines = [f"if {self.key!r} in attributes:", f"    value = attributes[{self.key!r}]"]
+            indent = "    "
+        else:
+            namespace[f"default_{index}"] = self.default
+            lines = [f"value = attributes.get({self.key!r}, default_{index})"]
+            indent = ""
+        if self.converter:
+            namespace[f"converter_{index}"] = self.converter
+            lines.append(f"{indent}self.{self.attribute} = converter_{index}(value) if value else value")
+        else:
+            lines.append(f"{indent}self.{self.attribute} = value")
+        return lines
+
+    def __repr__(self) -> str:
+        """Provide a string representation of the object.
+
+        :return: The string representation
+        :rtype: str
+        """
+        return f"{type(self).__name__}(key={self.key!r}, attribute={self.attribute!r})"
+
+
+class MethodField(Field):
+    """A field decoded by a method of the model, for values that need more than one key or more work than a
+    converter, such as the relationships of a model.
+
+    .. versionadded:: 1.2
+
+    :param attributes: The names of the attributes set by the method.
+    :type attributes: Tuple[str, ...]
+    :param method: The name of the method. It is given the JSON of the model and returns a dictionary of attribute
+        names to values.
+    :type method: str
+    :param keys: The keys in the attributes that the method uses. Defaults to no keys.
+    :type keys: Tuple[str, ...]
+    :param relationships: Whether or not the method uses the relationships of the model. Defaults to ``False``.
+    :type relationships: bool
+    """
+
+    __slots__ = ("keys", "method", "relationships", "_attributes")
+
+    keys: Tuple[str, ...]
+    """The keys in the attributes that the method uses."""
+
+    method: str
+    """The name of the method."""
+
+    relationships: bool
+    """Whether or not the method uses the relationships of the model."""
+
+    def __init__(
+        self, attributes: Tuple[str, ...], method: str, *, keys: Tuple[str, ...] = (), relationships: bool = False
+    ):
+        super().__init__(keys[0] if keys else method, attributes[0])
+        self._attributes = attributes
+        self.keys = keys
+        self.method = method
+        self.relationships = relationships
+
+    @property
+    def attributes(self) -> Tuple[str, ...]:
+        return self._attributes
+
+    def provided(self, data: Dict[str, Any]) -> bool:
+        if self.relationships and "relationships" in data:
+            return True
+        attributes = data["data"]["attributes"]
+        return any(key in attributes for key in self.keys)
+
+    def decode(self, model: "Model", data: Dict[str, Any]) -> Dict[str, Any]:
+        if not self.provided(data):
+            return {}
+        return getattr(model, self.method)(data)
+
+    def source(self, index: int, namespace: Dict[str, Any]) -> List[str]:
+        conditions = [f"{key!r} in attributes" for key in self.keys]
+        if self.relationships:
+            conditions.append("'relationships' in data")
+        return [
+            f"if {' or '.join(conditions) or 'False'}:",
+            f"    for attribute, value in self.{self.method}(data).items():",
+            "        setattr(self, attribute, value)",
+        ]
+
+    def __repr__(self) -> str:
+        """Provide a string representation of the object.
+
+        :return: The string representation
+        :rtype: str
+        """
+        return f"{type(self).__name__}(attributes={self.attributes!r}, method={self.method!r})"
+
+
+def compile_fields(fields: Tuple[Field, ...]) -> Callable[["Model", Dict[str, Any]], None]:
+    """Compile the descriptions of the fields of a model into one function that sets every field from the JSON of the
+    model. The function does the same as calling :meth:`.Field.decode` for each field and setting the attributes,
+    but without looking up the keys, attribute names, and converters of the fields each time.
+
+    .. versionadded:: 1.2
+
+    :param fields: The fields of the model.
+    :type fields: Tuple[Field, ...]
+    :return: A function taking the model and its JSON.
+    :rtype: Callable[[Model, Dict[str, Any]], None]
+    """
+    namespace: Dict[str, Any] = {}
+    lines = ["def decode_fields(self, data):", "    attributes = data['data']['attributes']"]
+    for index, field in enumerate(fields):
+        lines.extend(f"    {line}" for line in field.source(index, namespace))
+    exec("\n".join(lines), namespace)
+    return namespace["decode_fields"]
+
+
+class ModelRecord(NamedTuple):
+    """The result of a model decoded by :func:`.decode_records`, which can be pickled to send it from a worker process
+    to the main process.
+
+    .. versionadded:: 1.2
+    """
+
+    model: Type["Model"]
+    """The model class the record is for."""
+
+    data: Dict[str, Any]
+    """The JSON of the model, without the attributes that are already decoded in :attr:`.values`."""
+
+    values: Dict[str, Any]
+    """The names and values of the attributes set by the :class:`.Field` objects of the model."""
+
+    @property
+    def id(self) -> str:
+        """The ID of the model.
+
+        :rtype: str
+        """
+        return self.data["data"]["id"]
+
+    def to_model(self, client: "MangadexClient") -> "Model":
+        """Make the model from the record, parsing the rest of the JSON like :meth:`.Model.parse` does.
+
+        :param client: The client of the model.
+        :type client: MangadexClient
+        :return: The model, from the identity map of the client if it is enabled.
+        :rtype: Model
+        """
+        obj = client._model(self.model, self.id, self.data)
+        for attribute, value in self.values.items():
+            setattr(obj, attribute, value)
+        return obj
+
+
+def make_record(model: Type["Model"], item: Dict[str, Any], keep: Iterable[str] = ()) -> ModelRecord:
+    """Decode the :class:`.Field` objects of a model from its JSON into a :class:`.ModelRecord`. Fields that need the
+    model, such as relationships, are left in the JSON to be decoded by :meth:`.ModelRecord.to_model`.
+
+    .. versionadded:: 1.2
+
+    :param model: The model class.
+    :type model: Type[Model]
+    :param item: The JSON of the model.
+    :type item: Dict[str, Any]
+    :param keep: The keys of attributes that are kept in the JSON of the record even if they are decoded, such as the
+        attributes a :class:`.Pager` orders its results by.
+    :type keep: Iterable[str]
+    :return: The record.
+    :rtype: ModelRecord
+    """
+    if "attributes" not in item["data"]:
+        return ModelRecord(model, item, {})
+    attributes = dict(item["data"]["attributes"])
+    values = {}
+    for field in model._fields:
+        # Strings are interned per process, so interned fields are decoded in the process the model is made in.
+        if type(field) is Field and field.converter is not intern_string:
+            values.update(field.decode(None, item))
+            if field.key not in keep:
+                attributes.pop(field.key, None)
+    return ModelRecord(model, {**item, "data": {**item["data"], "attributes": attributes}}, values)
+
+
+def decode_records(
+    model: Optional[Type["Model"]], body: bytes, codec: "JSONCodec", keep: Tuple[str, ...] = ()
+) -> Dict[str, Any]:
+    """Decode a page of results of a :class:`.Pager`, turning each result into a :class:`.ModelRecord`. This is run
+    in the executor of a Pager, such as a :class:`concurrent.futures.ProcessPoolExecutor`.
+
+    .. versionadded:: 1.2
+
+    :param model: The model class of the results, or ``None`` to only decode the JSON.
+    :type model: Optional[Type[Model]]
+    :param body: The body of the response.
+    :type body: bytes
+    :param codec: The codec to decode the body with.
+    :type codec: JSONCodec
+    :param keep: The keys of attributes that are kept in the JSON of the records. See :func:`.make_record`.
+    :type keep: Tuple[str, ...]
+    :return: The JSON of the page, with a list of records as the results if a model was given.
+    :rtype: Dict[str, Any]
+    """
+    page = codec.loads(body)
+    if model is not None and page:
+        page["results"] = [make_record(model, item, keep) if item else item for item in page["results"]]
+    return page
@@ -1,10 +1,10 @@
 from typing import Any, Dict, TYPE_CHECKING
 
 from .abc import GenericModelList, Model
+from .fields import Field, MethodField
 from .mixins import DatetimeMixin
 from .user import User
 from ..constants import routes
-from ..utils import copy_key_to_attribute
 
 if TYPE_CHECKING:
     from .chapter import Chapter
@@ -16,6 +16,16 @@ class Group(Model, DatetimeMixin):
     .. versionadded:: 0.3
     """
 
+    __slots__ = ("name", "leader", "members", "_chapters", "_users", "created_at", "updated_at")
+
+    _batch_route = ("scanlation_group.list", "group_list")
+
+    _fields = (
+        Field("name"),
+        MethodField(("leader", "members"), "_decode_users", keys=("leader", "members")),
+        *DatetimeMixin._datetime_fields,
+    )
+
     name: str
     """The name of the group."""
 
@@ -25,29 +35,39 @@ class Group(Model, DatetimeMixin):
     members: GenericModelList[User]
     """Users who are members of the group."""
 
-    chapters: GenericModelList["Chapter"]
-    """A list of chapters uploaded by the group.
-    
-    .. deprecated:: 1.0
-        MangaDex will no longer send chapters back. The chapter list will always be empty.
-    """
+    @property
+    def chapters(self) -> GenericModelList["Chapter"]:
+        """A list of chapters uploaded by the group.
+
+        .. deprecated:: 1.0
+            MangaDex will no longer send chapters back. The chapter list will always be empty.
+
+        :rtype: GenericModelList[Chapter]
+        """
+        try:
+            return self._chapters
+        except AttributeError:
+            self._chapters = GenericModelList()
+            return self._chapters
+
+    @chapters.setter
+    def chapters(self, value: GenericModelList["Chapter"]):
+        self._chapters = value
 
     def parse(self, data: Dict[str, Any]):
         super().parse(data)
         if "data" in data and "attributes" in data["data"]:
-            attributes = data["data"]["attributes"]
-            copy_key_to_attribute(attributes, "name", self)
-            copy_key_to_attribute(
-                attributes, "leader", self, transformation=lambda attrib: User(self.client, data=attrib)
-            )
-            if "members" in attributes and attributes["members"]:
-                self.members = GenericModelList(User(self.client, data=member) for member in attributes["members"])
-            self._process_times(attributes)
+            self._parse_fields(data)
         self._parse_relationships(data)
-        if hasattr(self, "users"):
-            del self.users
-        if not hasattr(self, "chapters"):
-            self.chapters = GenericModelList()
+
+    def _decode_users(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        attributes = data["data"]["attributes"]
+        values = {}
+        if "leader" in attributes:
+            values["leader"] = User(self.client, data=attributes["leader"])
+        if attributes.get("members"):
+            values["members"] = GenericModelList(User(self.client, data=member) for member in attributes["members"])
+        return values
 
     async def load_chapters(self):
         """Shortcut method that calls :meth:`.MangadexClient.batch_chapters` with the chapters that belong to the group.
@@ -80,7 +100,7 @@ class Group(Model, DatetimeMixin):
         }
         self.client.raise_exception_if_not_authenticated("PUT", routes["group"])
         r = await self.client.request("PUT", routes["group"].format(id=self.id), json=params)
-        json = await r.json()
+        json = await self.client._json(r)
         r.close()
         obj = type(self)(self.client, data=json)
         self.transfer(obj)
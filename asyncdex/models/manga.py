@@ -7,18 +7,24 @@ from .chapter_list import ChapterList
 from .cover_art import CoverArt
 from .cover_list import CoverList
 from .custom_list import CustomList
+from .fields import Field, MethodField
 from .mixins import DatetimeMixin
 from .tag import Tag
 from .title import TitleList
 from ..constants import link_name_to_attribute_mapping, routes
 from ..enum import ContentRating, Demographic, FollowStatus, MangaStatus
-from ..utils import DefaultAttrDict, copy_key_to_attribute
+from ..utils import DefaultAttrDict, copy_key_to_attribute, intern_string, relationship_models, return_none
 
 if TYPE_CHECKING:
     from ..client import MangadexClient
     from .author import Author
 
 
+def _manga_status(value: str) -> MangaStatus:
+    # The API has sent the misspelled "hitaus" for manga on hiatus.
+    return MangaStatus("hiatus" if value == "hitaus" else value)
+
+
 @dataclass
 class MangaLinks:
     """An object representing the various link types for mangas on MangaDex.
@@ -195,15 +201,49 @@ class Manga(Model, DatetimeMixin):
     .. versionadded:: 0.2
     """
 
-    titles: DefaultAttrDict[TitleList]
-    """A :class:`.DefaultAttrDict` holding the titles of the manga."""
-
-    descriptions: DefaultAttrDict[Optional[str]]
-    """A :class:`.DefaultAttrDict` holding the descriptions of the manga.
-    
-    .. note::
-        If a language is missing a description, ``None`` will be returned.
-    """
+    __slots__ = (
+        "_titles",
+        "_descriptions",
+        "original_language",
+        "locked",
+        "last_volume",
+        "last_chapter",
+        "demographic",
+        "status",
+        "year",
+        "rating",
+        "_tags",
+        "authors",
+        "artists",
+        "_chapters",
+        "reading_status",
+        "_links",
+        "_cover",
+        "_cover_list",
+        "created_at",
+        "updated_at",
+    )
+    # The lists and dictionaries of the manga are only made when they are first used, so that relationship stubs stay
+    # small.
+
+    _batch_route = ("manga.list", "search")
+
+    _fields = (
+        MethodField(("_titles",), "_decode_titles", keys=("title", "altTitles")),
+        MethodField(("_descriptions",), "_decode_descriptions", keys=("description",)),
+        Field("isLocked", "locked", default=False),
+        Field("originalLanguage", "original_language", intern_string),
+        Field("lastVolume", "last_volume"),
+        Field("lastChapter", "last_chapter"),
+        Field("publicationDemographic", "demographic", Demographic),
+        Field("status", "status", _manga_status),
+        Field("year", "year", int),
+        Field("contentRating", "rating", ContentRating),
+        *DatetimeMixin._datetime_fields,
+        MethodField(("_tags",), "_decode_tags", keys=("tags",)),
+        MethodField(("_links",), "_decode_links", keys=("links",)),
+        MethodField(("authors", "artists", "_cover"), "_decode_relationships", relationships=True),
+    )
 
     original_language: str
     """The original language that the manga was released in."""
@@ -237,9 +277,6 @@ class Manga(Model, DatetimeMixin):
     rating: ContentRating
     """The manga's content rating."""
 
-    tags: GenericModelList[Tag]
-    """A list of :class:`.Tag` objects that represent the manga's tags. A manga without tags will have an empty list."""
-
     authors: GenericModelList["Author"]
     """A list of :class:`.Author` objects that represent the manga's authors.
     
@@ -258,36 +295,12 @@ class Manga(Model, DatetimeMixin):
         In order to efficiently get all authors and artists in one go, use :meth:`.load_authors`.
     """
 
-    chapters: ChapterList
-    """A :class:`.ChapterList` representing the chapters of the manga.
-    
-    .. versionadded:: 0.3
-    """
-
     reading_status: Optional[FollowStatus]
     """A value of :class:`.FollowStatus` representing the logged in user's reading status.
     
     .. versionadded:: 0.5
     """
 
-    links: MangaLinks
-    """An instance of :class:`.MangaLinks` with the manga's links.
-    
-    .. versionadded:: 0.5
-    """
-
-    cover: Optional[CoverArt] = None
-    """The cover of the manga, if one exists.
-
-    .. versionadded:: 1.0
-    """
-
-    covers: CoverList
-    """An instance of :class:`.CoverList` allowing easy retrieval of manga covers.
-    
-    .. versionadded:: 1.0
-    """
-
     def __init__(
         self,
         client: "MangadexClient",
@@ -296,71 +309,184 @@ class Manga(Model, DatetimeMixin):
         version: int = 0,
         data: Optional[Dict[str, Any]] = None,
     ):
-        self.tags = GenericModelList()
-        self.titles = DefaultAttrDict(default=lambda: TitleList())
-        self.descriptions = DefaultAttrDict(default=lambda: None)
-        self.chapters = ChapterList(self)
         self.reading_status = None
-        self.links = MangaLinks()
         super().__init__(client, id=id, version=version, data=data)
 
-    def _process_titles(self, title_dict: Dict[str, str]):
-        for key, value in title_dict.items():
-            self.titles[key].append(value)
+    @classmethod
+    def _stub(cls, client: "MangadexClient", id: str) -> "Manga":
+        obj = super()._stub(client, id)
+        obj.reading_status = None
+        return obj
+
+    @property
+    def titles(self) -> DefaultAttrDict[TitleList]:
+        """A :class:`.DefaultAttrDict` holding the titles of the manga.
+
+        :rtype: DefaultAttrDict[TitleList]
+        """
+        try:
+            return self._titles
+        except AttributeError:
+            self._titles = DefaultAttrDict(default=TitleList)
+            return self._titles
+
+    @titles.setter
+    def titles(self, value: DefaultAttrDict[TitleList]):
+        self._titles = value
+
+    @property
+    def descriptions(self) -> DefaultAttrDict[Optional[str]]:
+        """A :class:`.DefaultAttrDict` holding the descriptions of the manga.
+
+        .. note::
+            If a language is missing a description, ``None`` will be returned.
+
+        :rtype: DefaultAttrDict[Optional[str]]
+        """
+        try:
+            return self._descriptions
+        except AttributeError:
+            self._descriptions = DefaultAttrDict(default=return_none)
+            return self._descriptions
+
+    @descriptions.setter
+    def descriptions(self, value: DefaultAttrDict[Optional[str]]):
+        self._descriptions = value
+
+    @property
+    def tags(self) -> GenericModelList[Tag]:
+        """A list of :class:`.Tag` objects that represent the manga's tags. A manga without tags will have an empty
+        list.
+
+        :rtype: GenericModelList[Tag]
+        """
+        try:
+            return self._tags
+        except AttributeError:
+            self._tags = GenericModelList()
+            return self._tags
+
+    @tags.setter
+    def tags(self, value: GenericModelList[Tag]):
+        self._tags = value
+
+    @property
+    def chapters(self) -> ChapterList:
+        """A :class:`.ChapterList` representing the chapters of the manga.
+
+        .. versionadded:: 0.3
+
+        :rtype: ChapterList
+        """
+        try:
+            return self._chapters
+        except AttributeError:
+            self._chapters = ChapterList(self)
+            return self._chapters
+
+    @chapters.setter
+    def chapters(self, value: ChapterList):
+        self._chapters = value
+
+    @property
+    def links(self) -> MangaLinks:
+        """An instance of :class:`.MangaLinks` with the manga's links.
+
+        .. versionadded:: 0.5
+
+        :rtype: MangaLinks
+        """
+        try:
+            return self._links
+        except AttributeError:
+            self._links = MangaLinks()
+            return self._links
+
+    @links.setter
+    def links(self, value: MangaLinks):
+        self._links = value
+
+    @property
+    def covers(self) -> CoverList:
+        """An instance of :class:`.CoverList` allowing easy retrieval of manga covers.
+
+        .. versionadded:: 1.0
+
+        :rtype: CoverList
+        """
+        try:
+            return self._cover_list
+        except AttributeError:
+            self._cover_list = CoverList(self)
+            return self._cover_list
+
+    @covers.setter
+    def covers(self, value: CoverList):
+        self._cover_list = value
+
+    @property
+    def cover(self) -> Optional[CoverArt]:
+        """The cover of the manga, if one exists.
+
+        .. versionadded:: 1.0
+
+        :rtype: Optional[CoverArt]
+        """
+        try:
+            return self._cover
+        except AttributeError:
+            return None
+
+    @cover.setter
+    def cover(self, value: Optional[CoverArt]):
+        self._cover = value
 
     def parse(self, data: Dict[str, Any]):
         super().parse(data)
         if "data" in data and "attributes" in data["data"]:
-            attributes = data["data"]["attributes"]
-            if "title" in attributes and attributes["title"]:
-                self._process_titles(attributes["title"])
-            if "altTitles" in attributes and attributes["altTitles"]:
-                for item in attributes["altTitles"]:
-                    self._process_titles(item)
-            if "description" in attributes and attributes["description"]:
-                for key, value in attributes["description"].items():
-                    self.descriptions[key] = value
-            copy_key_to_attribute(attributes, "isLocked", self, "locked", default=False)
-            copy_key_to_attribute(attributes, "originalLanguage", self, "original_language")
-            copy_key_to_attribute(attributes, "lastVolume", self, "last_volume")
-            copy_key_to_attribute(attributes, "lastChapter", self, "last_chapter")
-            copy_key_to_attribute(
-                attributes,
-                "publicationDemographic",
-                self,
-                "demographic",
-                transformation=lambda attrib: Demographic(attrib) if attrib else attrib,
-            )
-            if "status" in attributes and attributes["status"] == "hitaus":
-                attributes["status"] = "hiatus"
-            copy_key_to_attribute(
-                attributes, "status", self, transformation=lambda attrib: MangaStatus(attrib) if attrib else attrib
-            )
-            copy_key_to_attribute(attributes, "year", self, transformation=lambda num: int(num) if num else num)
-            copy_key_to_attribute(
-                attributes,
-                "contentRating",
-                self,
-                "rating",
-                transformation=lambda attrib: ContentRating(attrib) if attrib else attrib,
-            )
-            self._process_times(attributes)
-            if "tags" in attributes and attributes["tags"]:
-                for tag in attributes["tags"]:
-                    assert tag["id"], "Tag ID missing"
-                    tag_obj = Tag(self.client, data={"result": "ok", "data": tag})
-                    cached_tag = self.client.tag_cache.setdefault(tag_obj.id, tag_obj)
-                    cached_tag.transfer(tag_obj)
-                    self.tags.append(cached_tag)
-            if "links" in attributes and attributes["links"]:
-                links = attributes["links"]
-                self.links.parse(links)
-            self._parse_relationships(data)
-            self.chapters = ChapterList(self)
-            if hasattr(self, "_covers"):
-                self.cover = self._covers[0]
-                self.cover.manga = self
-                del self._covers
+            self._parse_fields(data)
+
+    def _decode_titles(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        attributes = data["data"]["attributes"]
+        titles = DefaultAttrDict(default=TitleList)
+        for title_dict in [attributes.get("title") or {}, *(attributes.get("altTitles") or [])]:
+            for key, value in title_dict.items():
+                titles[intern_string(key)].append(value)
+        return {"_titles": titles}
+
+    def _decode_descriptions(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        descriptions = DefaultAttrDict(default=return_none)
+        for key, value in (data["data"]["attributes"]["description"] or {}).items():
+            descriptions[intern_string(key)] = value
+        return {"_descriptions": descriptions}
+
+    def _decode_tags(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        tags = GenericModelList()
+        for tag in data["data"]["attributes"]["tags"] or []:
+            assert tag["id"], "Tag ID missing"
+            tag_obj = Tag(self.client, data={"result": "ok", "data": tag})
+            cached_tag = self.client.tag_cache.setdefault(tag_obj.id, tag_obj)
+            cached_tag.transfer(tag_obj)
+            tags.append(cached_tag)
+        return {"_tags": tags}
+
+    def _decode_links(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        links = MangaLinks()
+        links.parse(data["data"]["attributes"]["links"] or {})
+        return {"_links": links}
+
+    def _decode_relationships(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        relationships = relationship_models(data, self.client)
+        values = {}
+        if "authors" in relationships:
+            values["authors"] = relationships["authors"]
+        if "artists" in relationships:
+            values["artists"] = relationships["artists"]
+        if "_covers" in relationships:
+            cover = relationships["_covers"][0]
+            cover.manga = self
+            values["_cover"] = cover
+        return values
 
     async def fetch(self):
         """Fetch data about the manga. |permission| ``manga.view``
@@ -398,7 +524,7 @@ class Manga(Model, DatetimeMixin):
         r = await self.client.request("GET", routes["aggregate"].format(id=self.id), params=params)
         self._check_404(r)
         ma = MangaAggregate()
-        ma.parse(await r.json())
+        ma.parse(await self.client._json(r))
         r.close()
         return ma
 
@@ -409,7 +535,7 @@ class Manga(Model, DatetimeMixin):
         """
         self.client.raise_exception_if_not_authenticated("GET", routes["manga_read_status"])
         r = await self.client.request("GET", routes["manga_read_status"].format(id=self.id))
-        json = await r.json()
+        json = await self.client._json(r)
         r.close()
         self.reading_status = FollowStatus(json["status"]) if json["status"] else None
 
@@ -494,7 +620,7 @@ class Manga(Model, DatetimeMixin):
             params["year"] = self.year
         self.client.raise_exception_if_not_authenticated("PUT", routes["manga"])
         r = await self.client.request("PUT", routes["manga"].format(id=self.id), json=params)
-        json = await r.json()
+        json = await self.client._json(r)
         r.close()
         manga_obj = type(self)(self.client, data=json)
         self.transfer(manga_obj)
@@ -30,7 +30,7 @@ class MangaList(ModelList["Manga"]):
         """Get the reading status of all manga in the list. |auth|"""
         self.client.raise_exception_if_not_authenticated("GET", routes["logged_user_manga_status"])
         r = await self.client.request("GET", routes["logged_user_manga_status"])
-        json = await r.json()
+        json = await self.client._json(r)
         r.close()
         map = self.id_map()
         for uuid, val in json["statuses"].items():
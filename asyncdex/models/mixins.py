@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Dict, Optional, TypeVar
+from typing import Optional, TypeVar
 
-from ..utils import copy_key_to_attribute
+from .fields import Field
 
 _T = TypeVar("_T", bound="DatetimeMixin")
 
@@ -12,6 +12,15 @@ class DatetimeMixin:
     .. versionadded:: 0.2
     """
 
+    __slots__ = ()
+    # Models using the mixin add ``created_at`` and ``updated_at`` to their own slots, and _datetime_fields to their
+    # fields.
+
+    _datetime_fields = (
+        Field("createdAt", "created_at", datetime.fromisoformat),
+        Field("updatedAt", "updated_at", datetime.fromisoformat),
+    )
+
     created_at: datetime
     """A :class:`datetime.datetime` representing the object's creation time.
 
@@ -47,22 +56,6 @@ class DatetimeMixin:
         """
         return self.updated_at or self.created_at
 
-    def _process_times(self, attributes: Dict[str, str]):
-        copy_key_to_attribute(
-            attributes,
-            "createdAt",
-            self,
-            "created_at",
-            transformation=lambda attrib: datetime.fromisoformat(attrib) if attrib else attrib,
-        )
-        copy_key_to_attribute(
-            attributes,
-            "updatedAt",
-            self,
-            "updated_at",
-            transformation=lambda attrib: datetime.fromisoformat(attrib) if attrib else attrib,
-        )
-
     def __lt__(self: _T, other: _T) -> bool:
         """Compares the two object's creation times to find if the current model's creation time is less than the
         other model's creation time.
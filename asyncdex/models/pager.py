@@ -1,14 +1,171 @@
 import asyncio
 from collections import deque
-from math import ceil
-from typing import Any, AsyncIterator, Generic, MutableMapping, Optional, TYPE_CHECKING, Type, TypeVar
+from concurrent.futures import Executor
+from functools import cmp_to_key
+from heapq import heappop, heappush
+from operator import itemgetter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    MutableMapping,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from natsort import natsort_keygen, ns
 
 from .abc import GenericModelList, Model, ModelList
+from .fields import ModelRecord, decode_records
+from ..enum import RequestPriority
+from ..utils import batched, filter_concurrent, map_concurrent, return_date_string
 
 if TYPE_CHECKING:
     from ..client import MangadexClient
 
 _ModelT = TypeVar("_ModelT", bound=Model)
+_T = TypeVar("_T")
+_RT = TypeVar("_RT")
+
+
+@dataclass()
+class Page(Generic[_T]):
+    """A page of results from a :class:`.Pager`, returned by :meth:`.Pager.pages`.
+
+    .. versionadded:: 1.2
+    """
+
+    items: List[_T]
+    """The items of the page. These are models, or the JSON of the results if :attr:`.Pager.raw` is ``True``. If
+    the Pager also has an :attr:`.Pager.executor`, the results are :class:`.ModelRecord` objects instead."""
+
+    offset: int
+    """The offset of the first item of the page."""
+
+    limit: int
+    """The maximum amount of items in the page."""
+
+    total: Optional[int]
+    """The total amount of results reported by the API, or ``None`` if it is unknown, such as for the pages of a
+    Pager split into :attr:`.Pager.shards`."""
+
+
+@dataclass()
+class PagerCheckpoint:
+    """The progress of a :class:`.Pager`, returned by :meth:`.Pager.checkpoint`. A new Pager made with
+    :meth:`.Pager.from_checkpoint` continues where the Pager stopped, without requesting the completed pages again.
+
+    .. versionadded:: 1.2
+    """
+
+    url: str
+    """The URL the Pager paginates against."""
+
+    params: Dict[str, Any]
+    """The parameters of the Pager, without the parameters the Pager manages itself."""
+
+    limit_size: int
+    """The maximum limit for each request."""
+
+    param_size: int
+    """How many parameters can be included in a given request."""
+
+    limit: Optional[int]
+    """The maximum amount of items the Pager returns."""
+
+    keyset: Optional[str]
+    """The timestamp attribute the Pager pages by, or ``None`` if it pages by offset."""
+
+    raw: bool
+    """Whether the Pager returns the JSON of every result instead of a model."""
+
+    start: int
+    """The offset of the first item of the Pager."""
+
+    offset: int
+    """The offset of the next page to request. The pages before it are completed. When paging by :attr:`.keyset`,
+    this is the offset from the :attr:`.watermark`."""
+
+    returned: int
+    """How many items the Pager returned."""
+
+    total: Optional[int] = None
+    """The total amount of results reported by the API in the last page, or ``None`` if no page was requested."""
+
+    watermark: Optional[datetime] = None
+    """The value of the ``*Since`` parameter for the next page when paging by :attr:`.keyset`."""
+
+    seen: Dict[str, datetime] = field(default_factory=dict)
+    """The IDs and timestamps of the items returned at the :attr:`.watermark`, which the next page can repeat."""
+
+    pending: List[Dict[str, Any]] = field(default_factory=list)
+    """The JSON of the items of the last requested page that were not returned yet."""
+
+    pending_offset: Optional[int] = None
+    """The offset of the first item in :attr:`.pending`."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the checkpoint to a dictionary that can be serialized as JSON, as long as the values of
+        :attr:`.params` can be.
+
+        :return: The dictionary.
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "url": self.url,
+            "params": self.params,
+            "limit_size": self.limit_size,
+            "param_size": self.param_size,
+            "limit": self.limit,
+            "keyset": self.keyset,
+            "raw": self.raw,
+            "start": self.start,
+            "offset": self.offset,
+            "returned": self.returned,
+            "total": self.total,
+            "watermark": return_date_string(self.watermark) if self.watermark else None,
+            "seen": {key: return_date_string(value) for key, value in self.seen.items()},
+            "pending": self.pending,
+            "pending_offset": self.pending_offset,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PagerCheckpoint":
+        """Create the checkpoint from a dictionary made by :meth:`.to_dict`.
+
+        :param data: The dictionary.
+        :type data: Dict[str, Any]
+        :return: The checkpoint.
+        :rtype: PagerCheckpoint
+        """
+        return cls(
+            url=data["url"],
+            params=data["params"],
+            limit_size=data["limit_size"],
+            param_size=data["param_size"],
+            limit=data.get("limit"),
+            keyset=data.get("keyset"),
+            raw=data.get("raw", False),
+            start=data["start"],
+            offset=data["offset"],
+            returned=data["returned"],
+            total=data.get("total"),
+            watermark=datetime.strptime(data["watermark"], "%Y-%m-%dT%H:%M:%S") if data.get("watermark") else None,
+            seen={key: datetime.strptime(value, "%Y-%m-%dT%H:%M:%S") for key, value in data.get("seen", {}).items()},
+            pending=data.get("pending", []),
+            pending_offset=data.get("pending_offset"),
+        )
 
 
 class Pager(AsyncIterator[_ModelT], Generic[_ModelT]):
@@ -18,6 +175,50 @@ class Pager(AsyncIterator[_ModelT], Generic[_ModelT]):
 
     :param limit_size: The maximum limit for each request. Defaults to ``100``.
     :type limit_size: int
+    :param priority: The priority of the Pager's requests if they have to wait for a ratelimit. Defaults to
+        :attr:`.RequestPriority.NORMAL`.
+
+        .. versionadded:: 1.2
+
+    :type priority: RequestPriority
+    :param max_in_flight: The maximum amount of pages to request ahead of the items that have been returned. Defaults
+        to ``5``.
+
+        .. versionadded:: 1.2
+
+    :type max_in_flight: int
+    :param keyset: The timestamp attribute to page by, either ``createdAt`` or ``updatedAt``. If given, the Pager
+        orders the results by the attribute and moves the matching ``*Since`` parameter forward after every page
+        instead of increasing the offset, so that it can go past the maximum offset of the API. Pages are requested one
+        at a time in this mode. Defaults to ``None``, which pages by offset.
+
+        .. versionadded:: 1.2
+
+    :type keyset: str
+    :param raw: Whether to return the JSON of every result instead of a model. If the Pager has an ``executor``, the
+        results are returned as :class:`.ModelRecord` objects instead. Defaults to ``False``.
+
+        .. versionadded:: 1.2
+
+    :type raw: bool
+    :param executor: An executor to decode the pages in, such as a :class:`concurrent.futures.ProcessPoolExecutor`.
+        If given, each page is decoded by :func:`.decode_records` in the executor, which also decodes the attributes
+        of the results into :class:`.ModelRecord` objects, and only the models are made on the event loop. This
+        spreads the work of large crawls over more than one CPU core. Defaults to the
+        :attr:`.MangadexClient.pager_executor` of the client.
+
+        .. versionadded:: 1.2
+
+    :type executor: Executor
+
+    .. versionchanged:: 1.2
+        The progress of a Pager can be saved with :meth:`.checkpoint`, and a new Pager can continue from it with
+        :meth:`.from_checkpoint`.
+
+    :raises: :class:`ValueError` if ``keyset`` is not ``createdAt`` or ``updatedAt``, if an order is given in
+        ``params`` together with ``keyset``, if the parameters cannot be split to fit in ``param_size``, or if the
+        parameters are split into :attr:`.shards` and an order is given that the results of the shards cannot be merged
+        in, such as ``title``.
     """
 
     url: str
@@ -48,6 +249,56 @@ class Pager(AsyncIterator[_ModelT], Generic[_ModelT]):
     """How many parameters can be included in a given request.
     
     .. versionadded:: 1.0
+
+    .. versionchanged:: 1.2
+        If there are more parameters than this, the largest list parameters are split into :attr:`.shards` instead of
+        raising :class:`ValueError`.
+    """
+
+    shards: List["Pager[_ModelT]"]
+    """The Pagers that the Pager is split into when its list parameters do not fit in one request. Each shard has a
+    part of the largest list parameters. The shards are run at the same time, and their results are merged without
+    duplicates and in the requested order, if an order is given. Shards can be merged in the order of ``chapter``,
+    ``volume``, ``year``, and the timestamps. This is empty if the Pager is not split.
+
+    .. versionadded:: 1.2
+    """
+
+    priority: RequestPriority
+    """The priority of the Pager's requests if they have to wait for a ratelimit.
+
+    .. versionadded:: 1.2
+    """
+
+    keyset: Optional[str]
+    """The timestamp attribute the Pager pages by, or ``None`` if it pages by offset.
+
+    .. versionadded:: 1.2
+    """
+
+    watermark: Optional[datetime]
+    """The value of the ``*Since`` parameter for the next page when paging by :attr:`.keyset`.
+
+    .. versionadded:: 1.2
+    """
+
+    raw: bool
+    """Whether the Pager returns the JSON of every result instead of a model, which skips parsing the results.
+
+    .. versionadded:: 1.2
+    """
+
+    max_in_flight: int
+    """The maximum amount of pages to request ahead of the items that have been returned. Pages are requested as
+    earlier pages are used up, so only this many pages are held in memory at once.
+
+    .. versionadded:: 1.2
+    """
+
+    executor: Optional[Executor]
+    """The executor the pages are decoded in, or ``None`` if they are decoded by the client.
+
+    .. versionadded:: 1.2
     """
 
     def __init__(
@@ -60,6 +311,11 @@ class Pager(AsyncIterator[_ModelT], Generic[_ModelT]):
         param_size: int = 150,
         limit_size: int = 100,
         limit: Optional[int] = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+        max_in_flight: int = 5,
+        keyset: Optional[str] = None,
+        raw: bool = False,
+        executor: Optional[Executor] = None,
     ):
         self.url = url
         self.model = model
@@ -70,73 +326,378 @@ class Pager(AsyncIterator[_ModelT], Generic[_ModelT]):
         self.params.setdefault("offset", 0)
         self.params["limit"] = limit_size
         self.param_size = param_size
+        self.priority = priority
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight has to be at least 1.")
+        self.max_in_flight = max_in_flight
+        self.keyset = keyset
+        self.watermark = None
+        self._seen: Dict[str, datetime] = {}
+        # The IDs and timestamps of the items returned at or after the watermark, which the next page can repeat.
+        if keyset is not None:
+            if keyset not in self._keyset_attributes:
+                raise ValueError(f"Keyset pagination is only possible with {', '.join(self._keyset_attributes)}.")
+            if any(key == "order" or key.startswith("order[") for key in self.params):
+                raise ValueError("Keyset pagination orders by the keyset attribute, so no other order can be given.")
+            self.params[f"order[{keyset}]"] = "asc"
+            since = self.params.pop(f"{keyset}Since", None)
+            if since:
+                self.watermark = datetime.strptime(since, "%Y-%m-%dT%H:%M:%S")
         if self.limit and self.params["limit"] > self.limit:
             self.params["limit"] = self.limit
+        self._start = self.params["offset"]
+        self._next_offset = self.params["offset"]
+        # The offset of the first page that has not been taken by the iterator, when paging by offset.
+        self._total: Optional[int] = None
         self._queue = deque()
         self._reqs = deque()
+        self._offsets = deque()
+        # The offsets of the pages that have not been requested yet. Pages are requested from here when there is room
+        # in the window of requests.
         self._started_parallel = None
         # A queue that fills after network requests. This is used to only the return the first of a lot of responses
         # on the initial request, and return more items afterwards.
         self._done = False
-        # We want to check the parameters to get the total length in order to distribute resources effectively.
+        self._closed = False
+        self.raw = raw
+        self.executor = executor if executor is not None else getattr(client, "pager_executor", None)
+        self._current_page: Optional[Page[Dict[str, Any]]] = None
+        # The page that the items in the queue came from.
+        self._merged: Optional[AsyncIterator[Dict[str, Any]]] = None
+        self.shards: List[Pager[_ModelT]] = []
+        param_sets = self._split_params(self.params)
+        if len(param_sets) > 1:
+            unmergeable = [name for name, _ in self._order() if name not in self._merge_orders]
+            if unmergeable:
+                raise ValueError(f"The results of shards cannot be merged in the order of {', '.join(unmergeable)}.")
+            self.shards = [self._make_shard(item) for item in param_sets]
+
+    def _split_params(self, params: MutableMapping[str, Any]) -> List[MutableMapping[str, Any]]:
+        """Split the largest list parameter until every set of parameters fits in one request."""
         single_params = 0
         iterator_params = {}
-        for key, value in self.params.items():
+        for key, value in params.items():
             if not isinstance(value, str) and hasattr(value, "__iter__"):
                 iterator_params[key] = list(value)
             else:
                 single_params += 1
         remaining_params = self.param_size - single_params
         leftover = sum(len(item) for item in iterator_params.values())
-        pagers_needed = ceil(leftover / remaining_params)
-        if pagers_needed > 1:
-            largest = sorted(iterator_params.items(), key=lambda i: i[1])[0]
+        if leftover <= remaining_params:
+            return [params]
+        key, values = max(iterator_params.items(), key=lambda i: len(i[1]))
+        shard_size = remaining_params - (leftover - len(values))
+        if shard_size < 1:
             raise ValueError(
                 "There are more parameters specified than the amount that can be safely handled by the "
-                f"API.\nLargest parameter: {largest[0]} with {largest[1]} items"
+                f"API.\nLargest parameter: {key} with {len(values)} items"
             )
+        param_sets = []
+        for start in range(0, len(values), shard_size):
+            param_sets.extend(self._split_params({**params, key: values[start : start + shard_size]}))
+        return param_sets
+
+    def _make_shard(self, params: MutableMapping[str, Any]) -> "Pager[_ModelT]":
+        shard = type(self)(
+            self.url,
+            self.model,
+            self.client,
+            params=params,
+            param_size=self.param_size,
+            limit_size=self.params["limit"],
+            limit=self.limit,
+            priority=self.priority,
+            max_in_flight=self.max_in_flight,
+            raw=True,
+            executor=self.executor,
+        )
+        # The parameters have already been set up for keyset pagination.
+        shard.keyset = self.keyset
+        shard.watermark = self.watermark
+        return shard
+
+    def _order(self) -> List[Tuple[str, bool]]:
+        """Get the attributes the results are ordered by, and whether or not each one is in descending order."""
+        return [
+            (key[len("order[") : -1], value == "desc")
+            for key, value in self.params.items()
+            if key.startswith("order[") and key.endswith("]")
+        ]
+
+    def _order_key(self) -> Optional[Callable[[Dict[str, Any]], Any]]:
+        """Make a sort key that puts the results in the order requested in the parameters, if an order was given."""
+        order = [(*self._merge_orders[name], descending) for name, descending in self._order()]
+        if not order:
+            return None
+
+        def compare(first: Dict[str, Any], second: Dict[str, Any]) -> int:
+            for attribute, convert, descending in order:
+                first_value = self._item_json(first)["data"]["attributes"].get(attribute)
+                second_value = self._item_json(second)["data"]["attributes"].get(attribute)
+                first_value = None if first_value is None else convert(first_value)
+                second_value = None if second_value is None else convert(second_value)
+                if first_value == second_value:
+                    continue
+                if first_value is None or (second_value is not None and first_value < second_value):
+                    return 1 if descending else -1
+                return -1 if descending else 1
+            return 0
+
+        return cmp_to_key(compare)
+
+    async def _merge_shards(self) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over the results of every shard, without duplicates. If an order was given, the results of the
+        shards are merged in that order. Otherwise, the shards are returned one after another. All shards request their
+        first pages at the same time."""
+        heads = [asyncio.ensure_future(shard.__anext__()) for shard in self.shards]
+        key = self._order_key()
+        seen = set()
+        try:
+            if key is None:
+                for index, shard in enumerate(self.shards):
+                    while True:
+                        try:
+                            item = await heads[index]
+                        except StopAsyncIteration:
+                            break
+                        heads[index] = asyncio.ensure_future(shard.__anext__())
+                        item_id = self._item_json(item)["data"]["id"]
+                        if item_id not in seen:
+                            seen.add(item_id)
+                            yield item
+            else:
+                heap = []
+                for index, head in enumerate(heads):
+                    try:
+                        item = await head
+                    except StopAsyncIteration:
+                        continue
+                    heappush(heap, (key(item), index, item))
+                while heap:
+                    _, index, item = heappop(heap)
+                    heads[index] = asyncio.ensure_future(self.shards[index].__anext__())
+                    item_id = self._item_json(item)["data"]["id"]
+                    if item_id not in seen:
+                        seen.add(item_id)
+                        yield item
+                    try:
+                        next_item = await heads[index]
+                    except StopAsyncIteration:
+                        continue
+                    heappush(heap, (key(next_item), index, next_item))
+        finally:
+            for head in heads:
+                head.cancel()
+            await asyncio.gather(*heads, return_exceptions=True)
+            await asyncio.gather(*(shard.aclose() for shard in self.shards), return_exceptions=True)
 
     def __aiter__(self) -> AsyncIterator[_ModelT]:
-        """Return an async iterator (itself)
+        """Return an async iterator over the items of the Pager.
+
+        .. versionchanged:: 1.2
+            The iterator is a wrapper around the Pager instead of the Pager itself. When the iterator is closed or
+            garbage collected, such as after breaking out of an ``async for`` loop, the page requests in flight are
+            cancelled. Iterating over the Pager again requests those pages again and continues where the previous loop
+            stopped.
+
+        :return: An async iterator.
+        :rtype: AsyncIterator[Model]
+        """
+        return self._iterate()
 
-        :return: The Pager class.
+    async def _iterate(self) -> AsyncIterator[_ModelT]:
+        try:
+            while True:
+                try:
+                    item = await self.__anext__()
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            self._cancel_requests()
+
+    async def __aenter__(self) -> "Pager[_ModelT]":
+        """Allow the Pager to be used with ``async with`` syntax, which calls :meth:`.aclose` on exit.
+
+        .. versionadded:: 1.2
+
+        :return: The Pager.
         :rtype: Pager
         """
         return self
 
-    async def _extract_item(self, task: asyncio.Task):
-        items = await task
-        for item in items:
-            self._queue.append(item)
+    async def __aexit__(
+        self, exc_type: Optional[Type[BaseException]], exc_val: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ):
+        """Exit the Pager, calling :meth:`.aclose`.
+
+        .. versionadded:: 1.2
+        """
+        await self.aclose()
+
+    def _cancel_requests(self):
+        """Cancel the page requests that have not finished, and put their offsets back so that they can be requested
+        again. Finished pages before the first unfinished one are kept so that the items stay in order."""
+        # The requests of shards are left running, since the shards are merged by tasks waiting on their results.
+        kept = 0
+        while kept < len(self._reqs) and self._reqs[kept][1].done():
+            kept += 1
+        while len(self._reqs) > kept:
+            offset, task = self._reqs.pop()
+            task.cancel()
+            self._offsets.appendleft(offset)
+
+    async def aclose(self):
+        """Stop the Pager. Page requests in flight are cancelled, and no more items will be returned.
+
+        .. versionadded:: 1.2
+        """
+        self._closed = True
+        if self._merged is not None:
+            await self._merged.aclose()
+        elif self.shards:
+            await asyncio.gather(*(shard.aclose() for shard in self.shards))
+        self._offsets.clear()
+        self._queue.clear()
+        tasks = [task for _, task in self._reqs]
+        self._reqs.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-    async def _do_request(self, offset=None):
-        offset = offset or self.params["offset"]
-        r = await self.client.request("GET", self.url, params={**self.params, "offset": offset}, add_includes=True)
+    def _fill_window(self):
+        while self._offsets and len(self._reqs) < self.max_in_flight:
+            offset = self._offsets.popleft()
+            self._reqs.append((offset, asyncio.create_task(self._do_request(offset))))
+
+    _keyset_attributes = ("createdAt", "updatedAt")
+
+    # The orders that the results of shards can be merged in, with the attribute holding the value of each result and
+    # a function that turns the value into a sort key. Chapter and volume numbers are strings, but the API orders them
+    # by their numeric value. Timestamps without the time zone sort in the same order as the times.
+    _merge_orders: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+        "chapter": ("chapter", natsort_keygen(alg=ns.FLOAT)),
+        "volume": ("volume", natsort_keygen(alg=ns.FLOAT)),
+        "createdAt": ("createdAt", itemgetter(slice(19))),
+        "updatedAt": ("updatedAt", itemgetter(slice(19))),
+        "publishAt": ("publishAt", itemgetter(slice(19))),
+        "publishedAt": ("publishAt", itemgetter(slice(19))),
+        "year": ("year", int),
+    }
+
+    @staticmethod
+    def _parse_timestamp(value: str) -> datetime:
+        return datetime.strptime(value[:19], "%Y-%m-%dT%H:%M:%S")
+
+    @staticmethod
+    def _item_json(item: Union[Dict[str, Any], ModelRecord]) -> Dict[str, Any]:
+        return item.data if isinstance(item, ModelRecord) else item
+
+    def _record_keep(self) -> Tuple[str, ...]:
+        """Get the attributes that the Pager uses to order its results, which are kept in the JSON of records."""
+        keep = [self._merge_orders.get(name, (name,))[0] for name, _ in self._order()]
+        if self.keyset:
+            keep.append(self.keyset)
+        return tuple(keep)
+
+    async def _get_page_json(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        r = await self.client.request("GET", self.url, params=params, add_includes=True, priority=self.priority)
         if r.status == 204:
-            self._done = True
-            raise StopAsyncIteration
-        json = await r.json()
+            r.close()
+            return None
+        if self.executor is None:
+            json = await self.client._json(r)
+        else:
+            body = await self.client._read(r)
+            json = await asyncio.get_running_loop().run_in_executor(
+                self.executor, decode_records, self.model, body, self.client.json_codec, self._record_keep()
+            )
         r.close()
+        return json
+
+    async def _do_keyset_request(self) -> Optional["Page[Dict[str, Any]]"]:
+        params = dict(self.params)
+        if self.watermark is not None:
+            # After a page was returned, go back a second in case the API does not include items made at exactly the
+            # watermark. Items that were already returned are skipped. A watermark given by the caller is used as is.
+            since = self.watermark - timedelta(seconds=1) if self._seen else self.watermark
+            params[f"{self.keyset}Since"] = return_date_string(since)
+        json = await self._get_page_json(params)
+        if json is None:
+            self._done = True
+            return None
+        results = [item for item in json["results"] if item]
+        page = Page([], self.params["offset"], self.params["limit"], json.get("total"))
+        for item in results:
+            item_json = self._item_json(item)
+            item_id = item_json["data"]["id"]
+            if item_id not in self._seen:
+                page.items.append(item)
+                self._seen[item_id] = self._parse_timestamp(item_json["data"]["attributes"][self.keyset])
+        if len(json["results"]) < self.params["limit"]:
+            self._done = True
+            return page
+        last = self._parse_timestamp(self._item_json(results[-1])["data"]["attributes"][self.keyset])
+        if self.watermark is None or last > self.watermark:
+            self.watermark = last
+            self.params["offset"] = 0
+            cutoff = last - timedelta(seconds=1)
+            self._seen = {key: value for key, value in self._seen.items() if value >= cutoff}
+        else:
+            # The whole page had the same timestamp, so the watermark cannot move. Page through the items with the
+            # timestamp with the offset instead.
+            self.params["offset"] += self.params["limit"]
+        return page
+
+    async def _do_request(self, offset: int) -> Optional["Page[Dict[str, Any]]"]:
+        json = await self._get_page_json({**self.params, "offset": offset})
+        if json is None:
+            self._done = True
+            return None
         if not self._started_parallel:
             self._started_parallel = True
-            for item in json["results"]:
-                if item:
-                    self._queue.append(self.model(self.client, data=item))
-            if json["total"] <= self.params["offset"] + self.params["limit"]:
-                self._done = True
+            end = json["total"]
+            if self.limit is not None and self.limit > 0:
+                end = min(end, self._start + self.limit)
+            self._offsets.extend(range(self.params["offset"] + self.params["limit"], end, self.params["limit"]))
+            self._fill_window()
+            self._done = True
+        return Page([item for item in json["results"] if item], offset, self.params["limit"], json["total"])
+
+    async def _next_page(self) -> Optional["Page[Dict[str, Any]]"]:
+        """Get the next page of results as JSON, or ``None`` if there are no pages left."""
+        if self._closed:
+            return None
+        if not self._done:
+            if self.keyset:
+                page = await self._do_keyset_request()
             else:
-                self.params["offset"] += self.params["limit"]
-                limit_left = json["total"]
-                if self.limit is not None and self.limit > 0:
-                    limit_left = self.limit
-                extra = int(ceil((limit_left - self.params["limit"]) / self.params["limit"]))
-                for i in range(extra):
-                    self._reqs.append(
-                        asyncio.create_task(self._do_request(offset=self.params["offset"] + self.params["limit"] * i))
-                    )
-                self._done = True
+                page = await self._do_request(self.params["offset"])
         else:
-            return [self.model(self.client, data=item) for item in json["results"]]
+            self._fill_window()
+            if not self._reqs:
+                return None
+            task = self._reqs[0][1]
+            try:
+                page = await task
+            except asyncio.CancelledError:
+                if self._closed and task.cancelled():
+                    return None
+                raise
+            self._reqs.popleft()
+            self._fill_window()
+        if page is not None:
+            self._next_offset = page.offset + page.limit
+            self._total = page.total
+        return page
+
+    def _convert(self, item: Union[Dict[str, Any], ModelRecord]) -> Union[_ModelT, Dict[str, Any], ModelRecord]:
+        if self.raw:
+            return item
+        if isinstance(item, ModelRecord):
+            return item.to_model(self.client)
+        return self.client._model(self.model, item["data"]["id"], item)
 
     async def __anext__(self) -> _ModelT:
         """Return a model from the queue. If there are no items remaining, a request is made to fetch the next set of
@@ -148,24 +709,286 @@ class Pager(AsyncIterator[_ModelT], Generic[_ModelT]):
         .. versionchanged:: 0.5
             This method will fully respect limits even if the API does not.
 
+        .. versionchanged:: 1.2
+            Only up to :attr:`.max_in_flight` pages are requested ahead of the returned items, instead of requesting
+            every page after the first request.
+
+        .. versionchanged:: 1.2
+            Items of a Pager split into :attr:`.shards` come from the shards, without duplicates.
+
         :return: The new model.
         :rtype: Model
         """
+        if self._closed:
+            raise StopAsyncIteration
         if self.limit and self.returned >= self.limit:
+            self._cancel_requests()
             raise StopAsyncIteration
-        if len(self._queue) == 0:
-            if self._done:
-                if len(self._reqs) > 0:
-                    await self._extract_item(self._reqs.popleft())
-                else:
+        if self.shards:
+            if self._merged is None:
+                self._merged = self._merge_shards()
+            item = await self._merged.__anext__()
+        else:
+            while len(self._queue) == 0:
+                page = await self._next_page()
+                if page is None:
                     raise StopAsyncIteration
-            else:
-                await self._do_request(self.params["offset"])
+                self._current_page = page
+                self._queue.extend(page.items)
+            item = self._queue.popleft()
         self.returned += 1
+        return self._convert(item)
+
+    async def pages(self) -> AsyncIterator["Page[Union[_ModelT, Dict[str, Any]]]"]:
+        """Iterate over the Pager one page at a time instead of one item at a time.
+
+        .. versionadded:: 1.2
+
+        Usage:
+
+        .. code-block:: python
+
+            async for page in client.get_chapters(manga=manga_id).pages():
+                print(f"Got {len(page.items)} of {page.total} chapters at offset {page.offset}")
+
+        .. note::
+            Items that were already returned by iterating over the Pager are not returned again. If the Pager was
+            partly iterated over, the first page only has the remaining items of the page it stopped at.
+
+        :return: An async iterator of :class:`.Page` objects. The items of the pages are models, or the JSON of the
+            results if :attr:`.raw` is ``True``.
+        :rtype: AsyncIterator[Page]
+        """
         try:
-            return self._queue.popleft()
-        except IndexError:
-            raise StopAsyncIteration
+            if self.shards:
+                # The results of the shards are merged, so they are grouped into pages again.
+                page = Page([], 0, self.params["limit"], None)
+                async for item in self:
+                    page.items.append(item)
+                    if len(page.items) == page.limit:
+                        yield page
+                        page = Page([], page.offset + page.limit, page.limit, None)
+                if page.items:
+                    yield page
+                return
+            if self._queue:
+                current = self._current_page
+                items = [self._convert(item) for item in self._queue]
+                self.returned += len(items)
+                self._queue.clear()
+                yield Page(items, current.offset + len(current.items) - len(items), current.limit, current.total)
+            while not (self.limit and self.returned >= self.limit):
+                page = await self._next_page()
+                if page is None:
+                    return
+                items = page.items[: self.limit - self.returned] if self.limit else page.items
+                self.returned += len(items)
+                yield Page([self._convert(item) for item in items], page.offset, page.limit, page.total)
+        finally:
+            self._cancel_requests()
+
+    def map_concurrent(
+        self, function: Callable[[_ModelT], Awaitable[_RT]], limit: int = 5, *, ordered: bool = True
+    ) -> AsyncIterator[_RT]:
+        """Run a coroutine function on every item of the Pager, with up to ``limit`` items being processed at the same
+        time, and iterate over the results. Pages keep being requested while the items are processed.
+
+        .. versionadded:: 1.2
+
+        Usage:
+
+        .. code-block:: python
+
+            async for manga in client.get_mangas().map_concurrent(lambda manga: manga.aggregate(), limit=10):
+                ...
+
+        .. seealso:: :func:`.map_concurrent`
+
+        :param function: The coroutine function to run on every item.
+        :type function: Callable[[Model], Awaitable[R]]
+        :param limit: The maximum amount of items to process at the same time. Defaults to ``5``.
+        :type limit: int
+        :param ordered: Whether to return the results in the order of the items. Defaults to ``True``.
+        :type ordered: bool
+        :return: An async iterator of the results.
+        :rtype: AsyncIterator[R]
+        """
+        return map_concurrent(self, function, limit, ordered=ordered)
+
+    def filter(
+        self, predicate: Callable[[_ModelT], Union[bool, Awaitable[bool]]], limit: int = 5, *, ordered: bool = True
+    ) -> AsyncIterator[_ModelT]:
+        """Iterate over the items of the Pager for which a predicate is true. If the predicate is a coroutine
+        function, up to ``limit`` items are checked at the same time.
+
+        .. versionadded:: 1.2
+
+        .. seealso:: :func:`.filter_concurrent`
+
+        :param predicate: The function deciding if an item is kept. It can be a normal function or a coroutine
+            function.
+        :type predicate: Callable[[Model], Union[bool, Awaitable[bool]]]
+        :param limit: The maximum amount of items to check at the same time. Defaults to ``5``.
+        :type limit: int
+        :param ordered: Whether to return the items in their original order. Defaults to ``True``.
+        :type ordered: bool
+        :return: An async iterator of the kept items.
+        :rtype: AsyncIterator[Model]
+        """
+        return filter_concurrent(self, predicate, limit, ordered=ordered)
+
+    def batched(self, size: int) -> AsyncIterator[List[_ModelT]]:
+        """Iterate over the items of the Pager in lists of ``size`` items. The last list can be shorter. Unlike
+        :meth:`.pages`, the size of the lists does not depend on the limit of the requests.
+
+        .. versionadded:: 1.2
+
+        .. seealso:: :func:`.batched`
+
+        :param size: The amount of items in each list.
+        :type size: int
+        :return: An async iterator of the lists.
+        :rtype: AsyncIterator[List[Model]]
+        """
+        return batched(self, size)
+
+    def checkpoint(self) -> PagerCheckpoint:
+        """Save the progress of the Pager, so that a new Pager made with :meth:`.from_checkpoint` can continue where
+        the Pager stopped, such as after the program is restarted.
+
+        .. versionadded:: 1.2
+
+        Usage:
+
+        .. code-block:: python
+
+            pager = client.get_mangas()
+            async for manga in pager:
+                ...
+                with open("checkpoint.json", "w") as file:
+                    json.dump(pager.checkpoint().to_dict(), file)
+
+            # Later:
+            with open("checkpoint.json") as file:
+                checkpoint = PagerCheckpoint.from_dict(json.load(file))
+            async for manga in Pager.from_checkpoint(client, Manga, checkpoint):
+                ...
+
+        .. note::
+            Pages that were requested ahead of the returned items are not part of the checkpoint, and are requested
+            again by the new Pager. The items of the current page that were not returned yet are kept in the
+            checkpoint. If the Pager has an :attr:`.executor`, those items are requested again instead.
+
+        :return: The checkpoint.
+        :rtype: PagerCheckpoint
+        :raises: :class:`ValueError` if the Pager is split into :attr:`.shards`, since the progress of merging the
+            shards cannot be saved, or if the Pager has an :attr:`.executor`, pages by :attr:`.keyset`, and has items
+            of the current page that were not returned yet.
+        """
+        if self.shards:
+            raise ValueError("A Pager split into shards cannot be checkpointed.")
+        params = {key: value for key, value in self.params.items() if key not in ("offset", "limit")}
+        if self.keyset:
+            del params[f"order[{self.keyset}]"]
+        pending = list(self._queue)
+        pending_offset = None
+        offset = self.params["offset"] if self.keyset else self._next_offset
+        if pending:
+            pending_offset = self._current_page.offset + len(self._current_page.items) - len(pending)
+            if isinstance(pending[0], ModelRecord):
+                # Records cannot be turned back into JSON, so the items are requested again from their offset.
+                if self.keyset:
+                    raise ValueError(
+                        "A Pager paging by keyset with records left in its current page cannot be checkpointed."
+                    )
+                offset = pending_offset
+                pending = []
+                pending_offset = None
+        return PagerCheckpoint(
+            url=self.url,
+            params=params,
+            limit_size=self.params["limit"],
+            param_size=self.param_size,
+            limit=self.limit,
+            keyset=self.keyset,
+            raw=self.raw,
+            start=self._start,
+            offset=offset,
+            returned=self.returned,
+            total=self._total,
+            watermark=self.watermark,
+            seen=dict(self._seen),
+            pending=pending,
+            pending_offset=pending_offset,
+        )
+
+    @classmethod
+    def from_checkpoint(
+        cls,
+        client: "MangadexClient",
+        model: Type[_ModelT],
+        checkpoint: PagerCheckpoint,
+        *,
+        priority: RequestPriority = RequestPriority.NORMAL,
+        max_in_flight: int = 5,
+        executor: Optional[Executor] = None,
+    ) -> "Pager[_ModelT]":
+        """Make a Pager that continues from a checkpoint made with :meth:`.checkpoint`. The pages that were completed
+        when the checkpoint was made are not requested again.
+
+        .. versionadded:: 1.2
+
+        :param client: The client to make requests with.
+        :type client: MangadexClient
+        :param model: The subclass of :class:`.Model` to transform the results into.
+        :type model: Type[Model]
+        :param checkpoint: The checkpoint.
+        :type checkpoint: PagerCheckpoint
+        :param priority: The priority of the Pager's requests if they have to wait for a ratelimit. Defaults to
+            :attr:`.RequestPriority.NORMAL`.
+        :type priority: RequestPriority
+        :param max_in_flight: The maximum amount of pages to request ahead of the items that have been returned.
+            Defaults to ``5``.
+        :type max_in_flight: int
+        :param executor: An executor to decode the pages in. Defaults to the :attr:`.MangadexClient.pager_executor` of
+            the client. See the ``executor`` parameter of :class:`.Pager`.
+        :type executor: Executor
+        :return: The Pager.
+        :rtype: Pager
+        """
+        pager = cls(
+            checkpoint.url,
+            model,
+            client,
+            params={**checkpoint.params, "offset": checkpoint.offset},
+            param_size=checkpoint.param_size,
+            limit_size=checkpoint.limit_size,
+            limit=checkpoint.limit,
+            priority=priority,
+            max_in_flight=max_in_flight,
+            keyset=checkpoint.keyset,
+            raw=checkpoint.raw,
+            executor=executor,
+        )
+        pager._start = checkpoint.start
+        pager.returned = checkpoint.returned
+        pager._total = checkpoint.total
+        pager.watermark = checkpoint.watermark
+        pager._seen = dict(checkpoint.seen)
+        if checkpoint.pending:
+            pager._current_page = Page(
+                list(checkpoint.pending), checkpoint.pending_offset, checkpoint.limit_size, checkpoint.total
+            )
+            pager._queue.extend(checkpoint.pending)
+        if not checkpoint.keyset and checkpoint.total is not None:
+            # The total is already known, so the pages left can be requested at the same time from the start.
+            end = checkpoint.total
+            if checkpoint.limit is not None and checkpoint.limit > 0:
+                end = min(end, checkpoint.start + checkpoint.limit)
+            pager._offsets.extend(range(checkpoint.offset, end, checkpoint.limit_size))
+            pager._started_parallel = True
+            pager._done = True
+        return pager
 
     def __repr__(self) -> str:
         """Provide a string representation of the object.
@@ -182,6 +1005,9 @@ class Pager(AsyncIterator[_ModelT], Generic[_ModelT]):
             If :attr:`.model` is :class:`.Manga`, this method will return :class:`.MangaList`. Otherwise, this method
             will return a :class:`.GenericModelList`.
 
+        .. versionchanged:: 1.2
+            If :attr:`.raw` is ``True``, this method returns a :class:`list` of the JSON of the results.
+
         :return: A :class:`.ModelList` with the total models.
 
             .. versionchanged:: 0.5
@@ -192,7 +1018,9 @@ class Pager(AsyncIterator[_ModelT], Generic[_ModelT]):
         from .manga import Manga
         from .manga_list import MangaList
 
-        if issubclass(self.model, Manga):
+        if self.raw:
+            return [item async for item in self]
+        elif issubclass(self.model, Manga):
             return MangaList(self.client, entries=[item async for item in self])
         else:
             return GenericModelList([item async for item in self])
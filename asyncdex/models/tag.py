@@ -48,6 +48,13 @@ class Tag(Model):
         self.descriptions = DefaultAttrDict(default=lambda: None)
         super().__init__(client, id=id, version=version, data=data)
 
+    @classmethod
+    def _stub(cls, client: "MangadexClient", id: str) -> "Tag":
+        obj = super()._stub(client, id)
+        obj.names = DefaultAttrDict(default=lambda: None)
+        obj.descriptions = DefaultAttrDict(default=lambda: None)
+        return obj
+
     def parse(self, data: Dict[str, Any]):
         super().parse(data)
         if "data" in data and "attributes" in data["data"]:
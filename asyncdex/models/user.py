@@ -1,7 +1,7 @@
 from typing import Any, Dict, TYPE_CHECKING
 
 from .abc import GenericModelList, Model
-from ..utils import copy_key_to_attribute
+from .fields import Field
 
 if TYPE_CHECKING:
     from .chapter import Chapter
@@ -13,26 +13,39 @@ class User(Model):
     .. versionadded:: 0.3
     """
 
+    __slots__ = ("username", "_chapters")
+
+    _fields = (Field("username"),)
+
     username: str
     """THe user's username."""
 
-    chapters: GenericModelList["Chapter"]
-    """The chapters the user uploaded.
-    
-    .. deprecated:: 1.0
-        MangaDex will no longer send chapters back. The chapter list will always be empty.
-    """
+    @property
+    def chapters(self) -> GenericModelList["Chapter"]:
+        """The chapters the user uploaded.
+
+        .. deprecated:: 1.0
+            MangaDex will no longer send chapters back. The chapter list will always be empty.
+
+        :rtype: GenericModelList[Chapter]
+        """
+        try:
+            return self._chapters
+        except AttributeError:
+            self._chapters = GenericModelList()
+            return self._chapters
+
+    @chapters.setter
+    def chapters(self, value: GenericModelList["Chapter"]):
+        self._chapters = value
 
     def parse(self, data: Dict[str, Any]):
         super().parse(data)
         if "id" in data:
             self.id = data["id"]
         if "data" in data and "attributes" in data["data"]:
-            attributes = data["data"]["attributes"]
-            copy_key_to_attribute(attributes, "username", self)
+            self._parse_fields(data)
         self._parse_relationships(data)
-        if not hasattr(self, "chapters"):
-            self.chapters = GenericModelList()
 
     async def load_chapters(self):
         """Shortcut method that calls :meth:`.MangadexClient.batch_chapters` with the chapters that belong to the user.
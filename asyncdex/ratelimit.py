@@ -1,31 +1,205 @@
 import asyncio
+import json
+import os
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from heapq import heappop, heappush
+from itertools import count
 from logging import getLogger
 from math import ceil
 from re import Pattern
-from typing import Dict, Optional, Tuple
+from threading import Lock
+from time import monotonic, time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
 
 import aiohttp
 
+from .enum import RequestPriority
+from .utils import RouteTable
+
 logger = getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 @dataclass(frozen=True)
 class Path:
     """A Path object representing a various path."""
 
     name: str
-    """The name of the path. This will be the value provided by :attr:`.Ratelimit.path`."""
+    """The name of the path. This will be the value provided by :attr:`.Ratelimit.path`.
+
+    .. versionchanged:: 1.2
+        The name is used as the route template to match paths against, with variables wrapped in curly braces,
+        such as ``/action/{id}``.
+    """
     path_regex: Pattern
-    """A compiled regex pattern matching the path, used when the path has a variable, such as ``/action/{id}``."""
+    """A compiled regex pattern matching the path, used when the path has a variable, such as ``/action/{id}``.
+
+    .. deprecated:: 1.2
+        The regex is no longer used to match paths. See :attr:`.name`.
+    """
     method: Optional[str] = None
     """The HTTP method for the path. Leave None if ratelimit applies to all methods."""
 
 
+@dataclass()
+class RatelimitState:
+    """The state of a ratelimit that is stored inside of a :class:`.RatelimitBackend`.
+
+    .. versionadded:: 1.2
+    """
+
+    used: int = 0
+    """Analogous to :attr:`.PathRatelimit.ratelimit_used`."""
+
+    expires: datetime = datetime.min
+    """Analogous to :attr:`.PathRatelimit.ratelimit_expires`."""
+
+    theoretical_arrival: float = 0.0
+    """The UNIX timestamp when the next permit of a :class:`.GlobalRatelimit` is available."""
+
+    pending: Dict[str, Tuple[int, float]] = field(default_factory=dict)
+    """The amount of requests of each client that have used the ratelimit but have not received a response yet, with
+    the UNIX timestamp of when the client last changed the state. The keys identify the client and its process."""
+
+
+class RatelimitBackend(ABC):
+    """An ABC representing a place to store ratelimit state, so that the state can be shared between multiple
+    clients. Cannot be instantiated.
+
+    .. versionadded:: 1.2
+    """
+
+    poll_interval: float = 0.5
+    """Requests waiting for a ratelimit will check the state at least once every this many seconds, since the state
+    can be changed by other clients without notifying the waiting requests."""
+
+    @abstractmethod
+    def modify(self, key: str, function: Callable[[RatelimitState], _T]) -> _T:
+        """Atomically modify the state of a ratelimit. No other client sharing the backend can read or modify the
+        state while the function is running, so the function should be fast and should not do any I/O.
+
+        :param key: The name of the ratelimit.
+        :type key: str
+        :param function: A function that is given the current state of the ratelimit and modifies it in place.
+        :type function: Callable[[RatelimitState], Any]
+        :return: The return value of the function.
+        :rtype: Any
+        """
+
+
+class MemoryRatelimitBackend(RatelimitBackend):
+    """A :class:`.RatelimitBackend` that stores state in memory. Pass the same instance to multiple clients in the
+    same process to share the ratelimits between them.
+
+    .. versionadded:: 1.2
+    """
+
+    def __init__(self):
+        self._states: Dict[str, RatelimitState] = {}
+        self._lock = Lock()
+
+    def modify(self, key: str, function: Callable[[RatelimitState], _T]) -> _T:
+        with self._lock:
+            return function(self._states.setdefault(key, RatelimitState()))
+
+    def __repr__(self) -> str:
+        """Provide a string representation of the object.
+
+        :return: The string representation
+        :rtype: str
+        """
+        return f"{type(self).__name__}({self._states!r})"
+
+
+class FileRatelimitBackend(RatelimitBackend):
+    """A :class:`.RatelimitBackend` that stores state in a file guarded by a file lock. Pass the same file path to
+    clients running in different processes on the same machine to share the ratelimits between them.
+
+    .. versionadded:: 1.2
+
+    .. note::
+        This backend relies on :func:`fcntl.flock`, so it is only available on POSIX systems.
+
+    .. warning::
+        :meth:`.modify` blocks the event loop while it waits for the file lock and reads and writes the file, since the
+        ratelimits are checked synchronously. This happens at least once for every request made by a client using the
+        backend. Other clients only hold the lock while they update the small state file, so the wait is short, but
+        the file should be on a local disk and not on a network file system.
+
+    :param path: The path to the state file. It will be created if it does not exist.
+    :type path: Union[str, os.PathLike]
+    """
+
+    path: str
+    """The path to the state file."""
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        try:
+            import fcntl
+        except ImportError:
+            raise RuntimeError(f"{type(self).__name__} is only available on POSIX systems.") from None
+        self._fcntl = fcntl
+        self.path = os.fspath(path)
+        self._lock = Lock()
+
+    @staticmethod
+    def _load_state(data: Dict[str, Any]) -> RatelimitState:
+        return RatelimitState(
+            used=data["used"],
+            expires=datetime.utcfromtimestamp(data["expires"]) if data["expires"] is not None else datetime.min,
+            theoretical_arrival=data["theoretical_arrival"],
+            pending={key: tuple(value) for key, value in data.get("pending", {}).items()},
+        )
+
+    @staticmethod
+    def _dump_state(state: RatelimitState) -> Dict[str, Any]:
+        return {
+            "used": state.used,
+            "expires": (state.expires - datetime(1970, 1, 1)).total_seconds()
+            if state.expires != datetime.min
+            else None,
+            "theoretical_arrival": state.theoretical_arrival,
+            "pending": state.pending,
+        }
+
+    def modify(self, key: str, function: Callable[[RatelimitState], _T]) -> _T:
+        with self._lock, open(self.path, "a+", encoding="utf-8") as file:
+            self._fcntl.flock(file, self._fcntl.LOCK_EX)
+            try:
+                file.seek(0)
+                contents = file.read()
+                data = json.loads(contents) if contents else {}
+                state = self._load_state(data[key]) if key in data else RatelimitState()
+                return_val = function(state)
+                data[key] = self._dump_state(state)
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps(data))
+                file.flush()
+                return return_val
+            finally:
+                self._fcntl.flock(file, self._fcntl.LOCK_UN)
+
+    def __repr__(self) -> str:
+        """Provide a string representation of the object.
+
+        :return: The string representation
+        :rtype: str
+        """
+        return f"{type(self).__name__}(path={self.path!r})"
+
+
 @dataclass()
 class PathRatelimit:
-    """An object that allows the request method to check the ratelimit before making a response."""
+    """An object that allows the request method to check the ratelimit before making a response.
+
+    .. versionchanged:: 1.2
+        Requests that cannot be made right away wait in a queue ordered by :class:`.RequestPriority` and are released
+        one by one as soon as the ratelimit has room for them, instead of sleeping for an estimated amount of time.
+    """
 
     path: Path
     """A :class:`~.Path` object."""
@@ -36,10 +210,26 @@ class PathRatelimit:
     ratelimit_expires: datetime = field(default=datetime.min, init=False)
     """Analogous to :attr:`.Ratelimit.ratelimit_expires`"""
     ratelimit_used: int = field(default=0, init=False)
-    """How many times the path has been called since the last ratelimit expire."""
+    """How many times the path has been called since the last ratelimit expire.
+
+    .. versionchanged:: 1.2
+        This includes requests that have been allowed through but have not received a response yet.
+    """
     ratelimit_enqueued: int = field(default=0, init=False)
-    """How many requests are currently sleeping. This is used to up the sleep time to prevent a number of requests 
-    more than double the ``ratelimit_time`` amount of requests."""
+    """How many requests are currently waiting for the ratelimit to free up."""
+    backend: Optional[RatelimitBackend] = field(default=None, init=False, compare=False)
+    """The :class:`.RatelimitBackend` holding the shared state of the ratelimit. If ``None``, the state is only
+    stored in the object itself. This is set by :meth:`.Ratelimits.add`.
+
+    .. versionadded:: 1.2
+    """
+    _waiters: List[Tuple[int, int, "asyncio.Future[None]"]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _waiter_counter: Iterator[int] = field(default_factory=count, init=False, repr=False, compare=False)
+    _pending: int = field(default=0, init=False, repr=False, compare=False)
+    _other_pending: int = field(default=0, init=False, repr=False, compare=False)
+    _timer: Optional[asyncio.TimerHandle] = field(default=None, init=False, repr=False, compare=False)
 
     def time_until_expire(self) -> timedelta:
         """Returns a :class:`datetime.timedelta` representing the amount of seconds for the ratelimit to expire."""
@@ -48,67 +238,311 @@ class PathRatelimit:
     def can_call(self, method: str) -> bool:
         """Returns whether or not this route can be used right now.
 
+        .. versionchanged:: 1.2
+            Returns ``False`` if other requests are already waiting for the ratelimit.
+
         :param method: The HTTP method being used.
         :type method: str
         :return: Whether or not this route can be used without ratelimit.
         :rtype: bool
         """
         if self.path.method == method or self.path.method is None:
+            if self.ratelimit_enqueued:
+                return False
             return self.ratelimit_used < self.ratelimit_amount or self.time_until_expire() < timedelta(microseconds=-1)
         else:
             return True
 
     def expire(self):
         """Expire the ratelimit."""
-        self.ratelimit_used = 0
+        self.ratelimit_used = self._pending + self._other_pending
         self.ratelimit_expires = datetime.min
 
+    def _shared(self, operation: Callable[[], _T]) -> _T:
+        """Run an operation that reads and modifies :attr:`.ratelimit_used` and :attr:`.ratelimit_expires` against the
+        shared state of the ratelimit."""
+        if self.backend is None:
+            return operation()
+
+        def run(state: RatelimitState) -> _T:
+            now = time()
+            # The object is copied into forked processes, so the process ID is part of the key.
+            owner = f"{os.getpid()}-{id(self)}"
+            # Clients that have not changed the state for a whole ratelimit window have most likely stopped.
+            state.pending = {
+                key: value
+                for key, value in state.pending.items()
+                if key != owner and now - value[1] < self.ratelimit_time
+            }
+            self._other_pending = sum(amount for amount, _ in state.pending.values())
+            self.ratelimit_used, self.ratelimit_expires = state.used, state.expires
+            return_val = operation()
+            state.used, state.expires = self.ratelimit_used, self.ratelimit_expires
+            if self._pending:
+                state.pending[owner] = (self._pending, now)
+            return return_val
+
+        return self.backend.modify(f"{self.path.method or '*'} {self.path.name}", run)
+
+    def _reserve(self) -> bool:
+        return self._shared(self._reserve_local)
+
+    def _reserve_local(self) -> bool:
+        if self.ratelimit_expires != datetime.min and self.time_until_expire() < timedelta(microseconds=-1):
+            self.expire()
+        if self.ratelimit_used >= self.ratelimit_amount:
+            return False
+        if self.ratelimit_expires == datetime.min:
+            self.ratelimit_expires = datetime.utcnow() + timedelta(seconds=self.ratelimit_time)
+        self.ratelimit_used += 1
+        self._pending += 1
+        return True
+
+    def _release_waiters(self):
+        self._timer = None
+        while self._waiters:
+            future = self._waiters[0][2]
+            if future.done():  # The waiter was cancelled.
+                heappop(self._waiters)
+                continue
+            if not self._reserve():
+                break
+            heappop(self._waiters)
+            self.ratelimit_enqueued -= 1
+            future.set_result(None)
+        self._schedule_release()
+
+    def _schedule_release(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._waiters:
+            return
+        delay = None
+        if self.ratelimit_expires != datetime.min:
+            delay = max(self.time_until_expire().total_seconds(), 0)
+        # If the ratelimit has no expiry time, the budget is held by requests that have not received a response
+        # yet, so the waiters will be released by :meth:`.update` instead. Other clients sharing the backend will
+        # not call our :meth:`.update` though.
+        if self.backend is not None:
+            delay = min(delay, self.backend.poll_interval) if delay is not None else self.backend.poll_interval
+        if delay is not None:
+            self._timer = asyncio.get_running_loop().call_later(delay, self._release_waiters)
+
+    def try_acquire(self) -> bool:
+        """Use the ratelimit if it can be used right now without waiting.
+
+        .. versionadded:: 1.2
+
+        :return: Whether or not the ratelimit was used.
+        :rtype: bool
+        """
+        return not self._waiters and self._reserve()
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.NORMAL):
+        """Use the ratelimit, waiting in the queue if the ratelimit cannot be used right now.
+
+        .. versionadded:: 1.2
+
+        :param priority: The priority of the request. Defaults to :attr:`.RequestPriority.NORMAL`.
+        :type priority: RequestPriority
+        """
+        if self.try_acquire():
+            return
+        future = asyncio.get_running_loop().create_future()
+        heappush(self._waiters, (priority, next(self._waiter_counter), future))
+        self.ratelimit_enqueued += 1
+        if self._timer is None:
+            self._schedule_release()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                # We were released at the same time we were cancelled, so give the slot to the next waiter.
+                self.abandon()
+            else:
+                self.ratelimit_enqueued -= 1
+            raise
+
+    def abandon(self):
+        """Give back a use of the ratelimit that will not receive a response, such as when a request fails to connect.
+
+        .. versionadded:: 1.2
+        """
+        self._pending = max(self._pending - 1, 0)
+
+        def give_back():
+            self.ratelimit_used = max(self.ratelimit_used - 1, 0)
+
+        self._shared(give_back)
+        if self._waiters:
+            self._release_waiters()
+
     def update(self, response: aiohttp.ClientResponse):
         """Update the path's ratelimit based on the headers.
 
+        .. versionchanged:: 1.2
+            Waiting requests are released if the headers show that the ratelimit has room for them.
+
         :param response: The response object.
         :type response: aiohttp.ClientResponse
         """
         headers = response.headers
-        if self.ratelimit_expires == datetime.min:
-            self.ratelimit_expires = datetime.utcnow() + timedelta(seconds=self.ratelimit_time)
+        self._pending = max(self._pending - 1, 0)
         if headers.get("x-ratelimit-limit", ""):
             self.ratelimit_amount = int(headers["x-ratelimit-limit"])
-        if headers.get("x-ratelimit-retry-after", ""):
-            new_ratelimit = datetime.utcfromtimestamp(int(headers["x-ratelimit-retry-after"]))
-            if new_ratelimit > self.ratelimit_expires:
-                self.ratelimit_expires = new_ratelimit
-        if headers.get("x-ratelimit-remaining", ""):
-            self.ratelimit_used = self.ratelimit_amount - int(headers["x-ratelimit-remaining"])
-        else:
-            self.ratelimit_used += 1
+
+        def apply_headers():
+            if self.ratelimit_expires == datetime.min:
+                self.ratelimit_expires = datetime.utcnow() + timedelta(seconds=self.ratelimit_time)
+            if headers.get("x-ratelimit-retry-after", ""):
+                new_ratelimit = datetime.utcfromtimestamp(int(headers["x-ratelimit-retry-after"]))
+                if new_ratelimit > self.ratelimit_expires:
+                    self.ratelimit_expires = new_ratelimit
+            if headers.get("x-ratelimit-remaining", ""):
+                # The server does not know about the requests that are still in flight, including other clients'.
+                self.ratelimit_used = (
+                    self.ratelimit_amount - int(headers["x-ratelimit-remaining"]) + self._pending + self._other_pending
+                )
+
+        self._shared(apply_headers)
+        if self._waiters:
+            self._release_waiters()
+
+
+class GlobalRatelimit:
+    """A limiter for the global (shared between all routes) ratelimit of the MangaDex API. The limiter is implemented
+    using the Generic Cell Rate Algorithm (a token bucket), meaning that permits are handed out by reserving a time
+    slot instead of holding a lock, so a request waiting for its slot never blocks other requests.
+
+    .. versionadded:: 1.2
+
+    :param rate: The amount of requests that can be made per second. Defaults to ``5``.
+    :type rate: float
+    :param burst: The amount of requests that can be made at once before requests are spaced out. Defaults to ``1``,
+        which spaces out requests at exactly the allowed rate.
+    :type burst: int
+    :param backend: The :class:`.RatelimitBackend` to store the state of the limiter in, so that the rate is shared
+        with other clients using the same backend. Defaults to ``None``, which only stores the state in the object.
+    :type backend: RatelimitBackend
+    """
+
+    rate: float
+    """The amount of requests that can be made per second."""
+
+    burst: int
+    """The amount of requests that can be made at once before requests are spaced out."""
+
+    backend: Optional[RatelimitBackend]
+    """The :class:`.RatelimitBackend` holding the state of the limiter."""
+
+    def __init__(self, rate: float = 5, burst: int = 1, backend: Optional[RatelimitBackend] = None):
+        if rate <= 0:
+            raise ValueError("The rate must be greater than 0.")
+        if burst < 1:
+            raise ValueError("The burst must be at least 1.")
+        self.rate = rate
+        self.burst = burst
+        self.backend = backend
+        self._theoretical_arrival = 0.0
+
+    def reserve(self) -> float:
+        """Reserve a permit.
+
+        :return: The amount of seconds to wait until the reserved permit can be used. Will be ``0`` if the permit can
+            be used right away.
+        :rtype: float
+        """
+        if self.backend is None:
+            delay, self._theoretical_arrival = self._schedule(self._theoretical_arrival, monotonic())
+            return delay
+
+        def run(state: RatelimitState) -> float:
+            # Different processes do not share a monotonic clock.
+            delay, state.theoretical_arrival = self._schedule(state.theoretical_arrival, time())
+            return delay
+
+        return self.backend.modify("global", run)
+
+    def _schedule(self, theoretical_arrival: float, now: float) -> Tuple[float, float]:
+        interval = 1 / self.rate
+        arrival = max(theoretical_arrival, now)
+        return max(arrival - interval * (self.burst - 1) - now, 0), arrival + interval
+
+    async def acquire(self):
+        """Wait until a permit is available."""
+        delay = self.reserve()
+        if delay > 0:
+            logger.debug("Sleeping for %s seconds for the global ratelimit.", delay)
+            await asyncio.sleep(delay)
+
+    def __repr__(self) -> str:
+        """Provide a string representation of the object.
+
+        :return: The string representation
+        :rtype: str
+        """
+        return f"{type(self).__name__}(rate={self.rate!r}, burst={self.burst!r})"
 
 
 class Ratelimits:
     """An object holding all of the various ratelimits.
 
+    .. versionchanged:: 1.2
+        Paths are matched using an index of the route templates given by :attr:`.Path.name` instead of scanning every
+        regex. A template only matches a path with the same amount of segments, literal segments are preferred over
+        variable segments, and ratelimits for a specific method are preferred over ratelimits for all methods.
+
     :param ratelimits: The :class:`.PathRatelimit` object.
     :type ratelimits: PathRatelimit
+    :param backend: The :class:`.RatelimitBackend` to store the state of the ratelimits in. Defaults to ``None``,
+        which only stores the state in the ratelimit objects.
+
+        .. versionadded:: 1.2
+
+    :type backend: RatelimitBackend
+    """
+
+    backend: Optional[RatelimitBackend]
+    """The :class:`.RatelimitBackend` that is given to every ratelimit added.
+
+    .. versionadded:: 1.2
+    """
+
+    ratelimit_dictionary: Dict[Path, PathRatelimit]
+    """A dictionary where the keys are :class:`.Path` objects and the values are :class:`~.PathRatelimit` objects.
+
+    .. versionchanged:: 1.2
+        The keys were changed from regex patterns to :class:`.Path` objects, so ratelimits for the same path but
+        different methods no longer overwrite each other.
     """
 
-    ratelimit_dictionary: Dict[Pattern, PathRatelimit]
-    """A dictionary where the keys are regex patterns representing the paths and the values are 
-    :class:`~.PathRatelimit` objects."""
+    _memo_size = 4096
 
-    def __init__(self, *ratelimits: PathRatelimit):
+    def __init__(self, *ratelimits: PathRatelimit, backend: Optional[RatelimitBackend] = None):
+        self.backend = backend
         self.ratelimit_dictionary = {}
-        self._check_lock = asyncio.Lock()
-        self._enqueue_lock = asyncio.Lock()
+        self._routes: RouteTable[Dict[Optional[str], PathRatelimit]] = RouteTable()
+        self._memo: Dict[Tuple[str, str], Optional[PathRatelimit]] = {}
         for item in ratelimits:
             self.add(item)
 
     def add(self, obj: PathRatelimit):
         """Add a new ratelimit. If the path is the same as an existing path, it will be overwritten.
 
+        .. versionchanged:: 1.2
+            The object's :attr:`.PathRatelimit.backend` is set to :attr:`.backend`.
+
         :param obj: The new ratelimit object to add.
         :type obj: PathRatelimit
         """
-        self.ratelimit_dictionary[obj.path.path_regex] = obj
+        obj.backend = self.backend
+        self.ratelimit_dictionary[obj.path] = obj
+        methods = self._routes.get(obj.path.name)
+        if methods is None:
+            self._routes[obj.path.name] = methods = {}
+        methods[obj.path.method] = obj
+        self._memo.clear()
 
     def remove(self, obj: PathRatelimit):
         """Remove a ratelimit.
@@ -116,7 +550,42 @@ class Ratelimits:
         :param obj: The new ratelimit object to remove.
         :type obj: PathRatelimit
         """
-        self.ratelimit_dictionary.pop(obj.path.path_regex)
+        self.ratelimit_dictionary.pop(obj.path)
+        methods = self._routes[obj.path.name]
+        del methods[obj.path.method]
+        if not methods:
+            del self._routes[obj.path.name]
+        self._memo.clear()
+
+    def find(self, url: str, method: str) -> Optional[PathRatelimit]:
+        """Find the ratelimit that applies to a path.
+
+        .. versionadded:: 1.2
+
+        :param url: The path, starting with ``/``
+        :type url: str
+        :param method: The HTTP method being used.
+        :type method: str
+        :return: The :class:`~.PathRatelimit` object if found.
+        :rtype: Optional[PathRatelimit]
+        """
+        path = url.partition("?")[0]
+        key = (path, method)
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        ratelimit_obj = None
+        for methods in self._routes.match(path):
+            ratelimit_obj = methods.get(method) or methods.get(None)
+            if ratelimit_obj is not None:
+                break
+        if len(self._memo) >= self._memo_size:
+            # Paths usually contain UUIDs, so a full memo is more likely to be full of paths that won't be seen again
+            # than paths that will.
+            self._memo.clear()
+        self._memo[key] = ratelimit_obj
+        return ratelimit_obj
 
     async def check(self, url: str, method: str) -> Tuple[float, Optional[PathRatelimit]]:
         """Check if a path is ratelimited.
@@ -129,48 +598,47 @@ class Ratelimits:
             ratelimit as well as the :class:`~.PathRatelimit` object if found.
         :rtype: float
         """
-        # We want to check with priority.
-        # For example, ``/url/x/something`` matches both ``/url/{id}`` and ``/url/{id}/something``.
-        # We want to match the second one because that is how API ratelimits work.
-        ratelimit_obj = None
-        obj_priority = 0  # Actually just the number of slashes in the regex
-        async with self._check_lock:
-            for regex, obj in self.ratelimit_dictionary.items():
-                if regex.match(url):
-                    count = regex.pattern.count("/")
-                    if count > obj_priority:
-                        obj_priority = count
-                        ratelimit_obj = obj
-            if ratelimit_obj is None:
-                return -1, ratelimit_obj
-            if ratelimit_obj.can_call(method):
-                return -1, ratelimit_obj
-            return (
-                ceil(
-                    ratelimit_obj.time_until_expire().total_seconds()
-                    + (ratelimit_obj.ratelimit_time * ((ratelimit_obj.ratelimit_enqueued // 60)) + 1)
-                ),
-                ratelimit_obj,
-            )
-
-    async def sleep(self, url: str, method: str) -> Optional[PathRatelimit]:
-        """Helper function that sleeps the amount of time returned by :meth:`.check`.
+        ratelimit_obj = self.find(url, method)
+        if ratelimit_obj is None:
+            return -1, ratelimit_obj
+        if ratelimit_obj.can_call(method):
+            return -1, ratelimit_obj
+        # Every full ratelimit's worth of requests waiting ahead of us pushes us back another ratelimit window.
+        windows_ahead = ratelimit_obj.ratelimit_enqueued // max(ratelimit_obj.ratelimit_amount, 1)
+        return (
+            max(
+                ceil(ratelimit_obj.time_until_expire().total_seconds() + ratelimit_obj.ratelimit_time * windows_ahead),
+                0,
+            ),
+            ratelimit_obj,
+        )
+
+    async def sleep(
+        self, url: str, method: str, priority: RequestPriority = RequestPriority.NORMAL
+    ) -> Optional[PathRatelimit]:
+        """Helper function that waits until the ratelimit for the path can be used, and then uses it.
+
+        .. versionchanged:: 1.2
+            The function waits in the queue of the :class:`~.PathRatelimit` object instead of sleeping the amount of
+            time returned by :meth:`.check`.
 
         :param url: The path, starting with ``/``
         :type url: str
         :param method: The HTTP method being used.
         :type method: str
+        :param priority: The priority of the request. Defaults to :attr:`.RequestPriority.NORMAL`.
+
+            .. versionadded:: 1.2
+
+        :type priority: RequestPriority
         :return: The :class:`~.PathRatelimit` object if found
         :rtype: :class:`~.PathRatelimit`
         """
-        time_to_sleep, return_val = await self.check(url, method)
-        if return_val and time_to_sleep > 0:
-            async with self._enqueue_lock:
-                return_val.ratelimit_enqueued += 1
-            logger.warning("Sleeping for %s seconds.", time_to_sleep)
-            await asyncio.sleep(time_to_sleep)
-            async with self._enqueue_lock:
-                return_val.ratelimit_enqueued -= 1
+        return_val = self.find(url, method)
+        if return_val:
+            if not return_val.try_acquire():
+                logger.warning("Waiting for the ratelimit on %s to free up.", return_val.path.name)
+                await return_val.acquire(priority)
         return return_val
 
     def __repr__(self) -> str:
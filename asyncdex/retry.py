@@ -0,0 +1,237 @@
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from logging import getLogger
+from random import random
+from time import monotonic, time
+from typing import Deque, Dict, Mapping, Optional
+
+from .constants import routes
+from .utils import RouteTable
+
+logger = getLogger(__name__)
+
+_route_table: RouteTable[str] = RouteTable()
+for _template in routes.values():
+    if _template.startswith("/"):
+        _route_table[_template] = _template
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Get the amount of seconds a response asks the client to wait before retrying.
+
+    Both the standard ``Retry-After`` header, which is either an amount of seconds or an HTTP date, and the
+    ``X-RateLimit-Retry-After`` header sent by the MangaDex API, which is a UNIX timestamp, are supported.
+
+    .. versionadded:: 1.2
+
+    :param headers: The headers of the response.
+    :type headers: Mapping[str, str]
+    :return: The amount of seconds to wait, or ``None`` if the response has neither header.
+    :rtype: Optional[float]
+    """
+    value = headers.get("Retry-After", "")
+    if value:
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            try:
+                date = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                pass
+            else:
+                if date.tzinfo is None:
+                    date = date.replace(tzinfo=timezone.utc)
+                return max((date - datetime.now(timezone.utc)).total_seconds(), 0)
+    value = headers.get("X-RateLimit-Retry-After", "")
+    if value:
+        try:
+            return max(float(value) - time(), 0)
+        except ValueError:
+            pass
+    return None
+
+
+class RetryBudget:
+    """A limit on the amount of retries made for a route, relative to the amount of requests made to it.
+
+    Retries are allowed as long as the amount of retries made in the last ``window`` seconds is below ``minimum``
+    plus ``ratio`` times the amount of requests made in the same period. When a route starts failing for every
+    request, this stops each request from multiplying the load on the API by the amount of retries.
+
+    .. versionadded:: 1.2
+
+    :param ratio: The amount of retries allowed per request. Defaults to ``0.2``.
+    :type ratio: float
+    :param minimum: The amount of retries that are always allowed in a window. Defaults to ``10``.
+    :type minimum: int
+    :param window: The length of the window in seconds. Defaults to ``10``.
+    :type window: float
+    """
+
+    ratio: float
+    """The amount of retries allowed per request."""
+
+    minimum: int
+    """The amount of retries that are always allowed in a window."""
+
+    window: float
+    """The length of the window in seconds."""
+
+    def __init__(self, ratio: float = 0.2, minimum: int = 10, window: float = 10):
+        self.ratio = ratio
+        self.minimum = minimum
+        self.window = window
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+
+    def _prune(self, now: float):
+        cutoff = now - self.window
+        for timestamps in (self._requests, self._retries):
+            while timestamps and timestamps[0] < cutoff:
+                timestamps.popleft()
+
+    def deposit(self):
+        """Record a request."""
+        now = monotonic()
+        self._prune(now)
+        self._requests.append(now)
+
+    def withdraw(self) -> bool:
+        """Record a retry if the budget allows it.
+
+        :return: Whether or not the retry is allowed.
+        :rtype: bool
+        """
+        now = monotonic()
+        self._prune(now)
+        if len(self._retries) >= self.minimum + self.ratio * len(self._requests):
+            return False
+        self._retries.append(now)
+        return True
+
+    def __repr__(self) -> str:
+        """Provide a string representation of the object.
+
+        :return: The string representation
+        :rtype: str
+        """
+        return f"{type(self).__name__}(ratio={self.ratio!r}, minimum={self.minimum!r}, window={self.window!r})"
+
+
+class RetryPolicy:
+    """The policy deciding how long to wait between retries of a failed request, and whether a route has retries left
+    in its :class:`.RetryBudget`.
+
+    The delay before retry ``n`` (starting at ``0``) is ``min(max_delay, base_delay * multiplier ** n)``, of which a
+    random part up to ``jitter`` is removed so that clients that failed at the same time do not retry at the same
+    time. If the response says how long to wait with a ``Retry-After`` header, that time is used instead, with up to
+    ``base_delay * jitter`` seconds added to it.
+
+    .. versionadded:: 1.2
+
+    .. seealso:: The ``retry_policy`` parameter of :class:`.MangadexClient`.
+
+    :param base_delay: The delay before the first retry in seconds. Defaults to ``0.5``.
+    :type base_delay: float
+    :param multiplier: The factor the delay grows by after every retry. Defaults to ``2``.
+    :type multiplier: float
+    :param max_delay: The maximum delay in seconds, not counting delays given by ``Retry-After``. Defaults to ``30``.
+    :type max_delay: float
+    :param jitter: The fraction of the delay that is randomized, between ``0`` (no jitter) and ``1`` (a delay
+        anywhere between ``0`` and the full delay). Defaults to ``1``.
+    :type jitter: float
+    :param budget_ratio: The ``ratio`` of the :class:`.RetryBudget` of each route. Defaults to ``0.2``.
+    :type budget_ratio: float
+    :param budget_minimum: The ``minimum`` of the :class:`.RetryBudget` of each route. Defaults to ``10``.
+    :type budget_minimum: int
+    :param budget_window: The ``window`` of the :class:`.RetryBudget` of each route. Defaults to ``10``.
+    :type budget_window: float
+    :raises: :class:`ValueError` if ``jitter`` is not between ``0`` and ``1``.
+    """
+
+    base_delay: float
+    """The delay before the first retry in seconds."""
+
+    multiplier: float
+    """The factor the delay grows by after every retry."""
+
+    max_delay: float
+    """The maximum delay in seconds, not counting delays given by ``Retry-After``."""
+
+    jitter: float
+    """The fraction of the delay that is randomized."""
+
+    budget_ratio: float
+    """The ``ratio`` of the :class:`.RetryBudget` of each route."""
+
+    budget_minimum: int
+    """The ``minimum`` of the :class:`.RetryBudget` of each route."""
+
+    budget_window: float
+    """The ``window`` of the :class:`.RetryBudget` of each route."""
+
+    budgets: Dict[str, RetryBudget]
+    """The retry budgets of the routes that requests have been made to, keyed by route template."""
+
+    def __init__(
+        self,
+        base_delay: float = 0.5,
+        multiplier: float = 2,
+        max_delay: float = 30,
+        jitter: float = 1,
+        *,
+        budget_ratio: float = 0.2,
+        budget_minimum: int = 10,
+        budget_window: float = 10,
+    ):
+        if not 0 <= jitter <= 1:
+            raise ValueError("The jitter has to be between 0 and 1.")
+        self.base_delay = base_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.budget_ratio = budget_ratio
+        self.budget_minimum = budget_minimum
+        self.budget_window = budget_window
+        self.budgets = {}
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Get the amount of seconds to wait before a retry.
+
+        :param attempt: The number of the retry, starting at ``0``.
+        :type attempt: int
+        :param retry_after: The amount of seconds the response asked to wait, if any.
+        :type retry_after: Optional[float]
+        :return: The amount of seconds to wait.
+        :rtype: float
+        """
+        if retry_after is not None:
+            return retry_after + random() * self.base_delay * self.jitter
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** attempt)
+        return delay * (1 - self.jitter * random())
+
+    def budget(self, path: str) -> RetryBudget:
+        """Get the retry budget of the route matching a path.
+
+        :param path: The path, starting with ``/``. Any query string is ignored.
+        :type path: str
+        :return: The retry budget of the route. Paths that do not match a known route get a budget of their own.
+        :rtype: RetryBudget
+        """
+        route = next(_route_table.match(path), None) or path.partition("?")[0]
+        budget = self.budgets.get(route)
+        if budget is None:
+            budget = self.budgets[route] = RetryBudget(self.budget_ratio, self.budget_minimum, self.budget_window)
+        return budget
+
+    def __repr__(self) -> str:
+        """Provide a string representation of the object.
+
+        :return: The string representation
+        :rtype: str
+        """
+        return (
+            f"{type(self).__name__}(base_delay={self.base_delay!r}, multiplier={self.multiplier!r}, "
+            f"max_delay={self.max_delay!r}, jitter={self.jitter!r})"
+        )
@@ -0,0 +1,184 @@
+import json
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from logging import getLogger
+from typing import Any, Dict, Optional, Union
+
+logger = getLogger(__name__)
+
+_epoch = datetime(1970, 1, 1)
+
+
+@dataclass()
+class StoredTokens:
+    """The tokens of a logged in client, as kept by a :class:`.TokenStore`.
+
+    .. versionadded:: 1.2
+    """
+
+    refresh_token: str
+    """The refresh token."""
+
+    session_token: Optional[str] = None
+    """The session token."""
+
+    session_token_acquired: Optional[datetime] = None
+    """The UTC time when the session token was obtained."""
+
+    refresh_token_acquired: Optional[datetime] = None
+    """The UTC time when the refresh token was obtained."""
+
+    username: Optional[str] = None
+    """The username of the user the tokens belong to, if known."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the tokens to a dictionary that can be serialized as JSON.
+
+        :return: The dictionary.
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "refresh_token": self.refresh_token,
+            "session_token": self.session_token,
+            "session_token_acquired": (self.session_token_acquired - _epoch).total_seconds()
+            if self.session_token_acquired
+            else None,
+            "refresh_token_acquired": (self.refresh_token_acquired - _epoch).total_seconds()
+            if self.refresh_token_acquired
+            else None,
+            "username": self.username,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StoredTokens":
+        """Create the tokens from a dictionary made by :meth:`.to_dict`.
+
+        :param data: The dictionary.
+        :type data: Dict[str, Any]
+        :return: The tokens.
+        :rtype: StoredTokens
+        """
+        return cls(
+            refresh_token=data["refresh_token"],
+            session_token=data.get("session_token"),
+            session_token_acquired=datetime.utcfromtimestamp(data["session_token_acquired"])
+            if data.get("session_token_acquired") is not None
+            else None,
+            refresh_token_acquired=datetime.utcfromtimestamp(data["refresh_token_acquired"])
+            if data.get("refresh_token_acquired") is not None
+            else None,
+            username=data.get("username"),
+        )
+
+
+class TokenStore(ABC):
+    """An ABC representing a place to keep the tokens of a client, so that a new client can start with the tokens of
+    a previous one instead of logging in again. Cannot be instantiated.
+
+    .. versionadded:: 1.2
+
+    .. seealso:: The ``token_store`` parameter of :class:`.MangadexClient`.
+    """
+
+    @abstractmethod
+    def load(self) -> Optional[StoredTokens]:
+        """Load the stored tokens.
+
+        :return: The tokens, or ``None`` if no tokens are stored.
+        :rtype: Optional[StoredTokens]
+        """
+
+    @abstractmethod
+    def save(self, tokens: StoredTokens):
+        """Store tokens, replacing any previously stored tokens.
+
+        :param tokens: The tokens to store.
+        :type tokens: StoredTokens
+        """
+
+    @abstractmethod
+    def clear(self):
+        """Remove the stored tokens."""
+
+
+class MemoryTokenStore(TokenStore):
+    """A :class:`.TokenStore` that keeps the tokens in memory. Pass the same instance to clients created one after
+    another in the same process to skip logging in.
+
+    .. versionadded:: 1.2
+    """
+
+    def __init__(self):
+        self._tokens: Optional[StoredTokens] = None
+
+    def load(self) -> Optional[StoredTokens]:
+        return self._tokens
+
+    def save(self, tokens: StoredTokens):
+        self._tokens = tokens
+
+    def clear(self):
+        self._tokens = None
+
+    def __repr__(self) -> str:
+        """Provide a string representation of the object.
+
+        :return: The string representation
+        :rtype: str
+        """
+        return f"{type(self).__name__}()"
+
+
+class FileTokenStore(TokenStore):
+    """A :class:`.TokenStore` that keeps the tokens in a JSON file, so that they survive the process exiting.
+
+    .. versionadded:: 1.2
+
+    .. warning::
+        The file gives full access to the account until the refresh token expires. It is created so that only the
+        current user can read it, but it should still be kept somewhere private.
+
+    :param path: The path to the token file. It will be created when tokens are first saved.
+    :type path: Union[str, os.PathLike]
+    """
+
+    path: str
+    """The path to the token file."""
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = os.fspath(path)
+
+    def load(self) -> Optional[StoredTokens]:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return StoredTokens.from_dict(json.load(file))
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable token file %s: %s", self.path, e)
+            return None
+
+    def save(self, tokens: StoredTokens):
+        # Write to a temporary file and replace the token file with it, so that other processes never read a partly
+        # written file.
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "w", encoding="utf-8") as file:
+            json.dump(tokens.to_dict(), file)
+        os.replace(temp_path, self.path)
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __repr__(self) -> str:
+        """Provide a string representation of the object.
+
+        :return: The string representation
+        :rtype: str
+        """
+        return f"{type(self).__name__}(path={self.path!r})"
@@ -1,16 +1,41 @@
-from collections import defaultdict
+import asyncio
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, Generic, Iterable, List, Mapping, Optional, TYPE_CHECKING, Tuple, TypeVar, Union
+from functools import lru_cache
+from inspect import isawaitable
+from sys import intern
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from .enum import Relationship
 
 if TYPE_CHECKING:
+    from .client import MangadexClient
     from .models.abc import GenericModelList, Model
 
 _KT = TypeVar("_KT")
 _VT = TypeVar("_VT")
 _T = TypeVar("_T")
+_RT = TypeVar("_RT")
 
 
 def remove_prefix(prefix: str, string: str) -> str:
@@ -115,6 +140,29 @@ class DefaultAttrDict(AttrDict[_VT], Generic[_VT]):
         return value
 
 
+def return_none() -> None:
+    """Return ``None``. This is used as the default of :class:`.DefaultAttrDict` objects whose missing values are
+    ``None``, so that they share one function instead of each making a lambda.
+
+    .. versionadded:: 1.2
+    """
+    return None
+
+
+def intern_string(value: Optional[str]) -> Optional[str]:
+    """Intern a string with :func:`sys.intern`, so that models holding the same string, such as a language code,
+    share one object. ``None`` and empty strings are returned as is.
+
+    .. versionadded:: 1.2
+
+    :param value: The string.
+    :type value: Optional[str]
+    :return: The interned string.
+    :rtype: Optional[str]
+    """
+    return intern(value) if value else value
+
+
 class _Sentinel:
     __slots__ = ()
 
@@ -128,6 +176,157 @@ class _Sentinel:
 _sentinel = _Sentinel()
 
 
+class _RouteNode:
+    __slots__ = ("children", "wildcard", "value")
+
+    def __init__(self):
+        self.children: Dict[str, "_RouteNode"] = {}
+        self.wildcard: Optional["_RouteNode"] = None
+        self.value: Any = _sentinel
+
+
+class RouteTable(Generic[_VT]):
+    """A table mapping route templates, such as ``/chapter/{id}/read``, to values. The templates are stored in a trie
+    of path segments, so finding the templates matching a path takes time proportional to the amount of segments in
+    the path instead of the amount of templates in the table.
+
+    A segment wrapped in curly braces (such as ``{id}``) matches any single segment of a path. When multiple templates
+    match a path, literal segments are preferred over variable segments.
+
+    .. versionadded:: 1.2
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self):
+        self._root = _RouteNode()
+        self._size = 0
+
+    @staticmethod
+    def _split(path: str) -> List[str]:
+        return path.partition("?")[0].strip("/").split("/")
+
+    @staticmethod
+    def _is_variable(segment: str) -> bool:
+        return segment.startswith("{") and segment.endswith("}")
+
+    def _find_node(self, template: str, create: bool = False) -> Optional[_RouteNode]:
+        node = self._root
+        for segment in self._split(template):
+            if self._is_variable(segment):
+                if node.wildcard is None:
+                    if not create:
+                        return None
+                    node.wildcard = _RouteNode()
+                node = node.wildcard
+            else:
+                if segment not in node.children:
+                    if not create:
+                        return None
+                    node.children[segment] = _RouteNode()
+                node = node.children[segment]
+        return node
+
+    def __setitem__(self, template: str, value: _VT):
+        """Set the value for a route template.
+
+        :param template: The route template.
+        :type template: str
+        :param value: The value to store.
+        :type value: Any
+        """
+        node = self._find_node(template, create=True)
+        if node.value is _sentinel:
+            self._size += 1
+        node.value = value
+
+    def __getitem__(self, template: str) -> _VT:
+        """Get the value stored for a route template. This does not match paths against the templates, see
+        :meth:`.match` for that.
+
+        :param template: The route template.
+        :type template: str
+        :raises: :class:`KeyError` if the template is not in the table.
+        :return: The value for the template.
+        :rtype: Any
+        """
+        node = self._find_node(template)
+        if node is None or node.value is _sentinel:
+            raise KeyError(template)
+        return node.value
+
+    def __delitem__(self, template: str):
+        """Remove a route template from the table.
+
+        :param template: The route template.
+        :type template: str
+        :raises: :class:`KeyError` if the template is not in the table.
+        """
+        node = self._find_node(template)
+        if node is None or node.value is _sentinel:
+            raise KeyError(template)
+        node.value = _sentinel
+        self._size -= 1
+
+    def __contains__(self, template: str) -> bool:
+        """Check if a route template is in the table.
+
+        :param template: The route template.
+        :type template: str
+        :return: Whether or not the template is in the table.
+        :rtype: bool
+        """
+        node = self._find_node(template)
+        return node is not None and node.value is not _sentinel
+
+    def __len__(self) -> int:
+        """Return the amount of route templates in the table.
+
+        :return: The amount of templates.
+        :rtype: int
+        """
+        return self._size
+
+    def get(self, template: str, default: Optional[_VT] = None) -> Optional[_VT]:
+        """Get the value stored for a route template, or a default if the template is not in the table.
+
+        :param template: The route template.
+        :type template: str
+        :param default: The value to return if the template is not in the table.
+        :type default: Any
+        :return: The value for the template or the default.
+        :rtype: Any
+        """
+        try:
+            return self[template]
+        except KeyError:
+            return default
+
+    def match(self, path: str) -> Iterator[_VT]:
+        """Find the values of all templates that match a path, most specific template first. Any query string in the
+        path is ignored.
+
+        :param path: The path, starting with ``/``.
+        :type path: str
+        :return: An iterator of the values of the matching templates.
+        :rtype: Iterator[Any]
+        """
+        segments = self._split(path)
+        stack = [(self._root, 0)]
+        while stack:
+            node, index = stack.pop()
+            if index == len(segments):
+                if node.value is not _sentinel:
+                    yield node.value
+                continue
+            # The stack is LIFO, so push the wildcard first in order to try the literal segment first.
+            if node.wildcard is not None:
+                stack.append((node.wildcard, index + 1))
+            child = node.children.get(segments[index])
+            if child is not None:
+                stack.append((child, index + 1))
+
+
 def copy_key_to_attribute(
     source_dict: dict,
     key: str,
@@ -176,63 +375,84 @@ def parse_relationships(data: dict, obj: "Model"):
     .. versionchanged:: 0.3
         Added support for :class:`.Chapter`, :class:`.User, and :class:`.Group` objects.
 
+    .. versionchanged:: 1.2
+        Relationships that the model has no attribute for are skipped.
+
+    .. versionchanged:: 1.2
+        The models come from the identity map of the client if it is enabled.
+
     :param data: The raw data received from the API.
     :type data: dict
     :param obj: The object to add the models to.
     :type obj: Model
     """
+    model = type(obj)
+    # Models without __slots__ have a __dict__ and take every relationship. Slotted models only take the relationships
+    # they have a slot or a property for.
+    takes_all = hasattr(obj, "__dict__")
+    for key, value in relationship_models(data, obj.client).items():
+        if takes_all or hasattr(model, key):
+            setattr(obj, key, value)
+
+
+def relationship_models(data: dict, client: "MangadexClient") -> Dict[str, "GenericModelList[Model]"]:
+    """Make the models for the relationships in the data of a model, without adding them to the model.
+
+    .. versionadded:: 1.2
+
+    :param data: The raw data received from the API.
+    :type data: dict
+    :param client: The client to make the models with.
+    :type client: MangadexClient
+    :return: A dictionary of the attribute names used by :func:`.parse_relationships` to lists of models.
+    :rtype: Dict[str, GenericModelList[Model]]
+    """
+    if "relationships" not in data:
+        return {}
+    list_type, table = _relationship_table()
+    relationship_data = defaultdict(list_type)
     # Notes for future contributors: As of May 7, the MangaDex API has a quirk where it sends the same relationship
     # (same UUID and same type) multiple times. Until this bug is fixed, I had to check that each UUID was unique.
+    seen = set()
+    for relationship in data["relationships"]:
+        assert "id" in relationship, "Missing ID."
+        relationship_id = relationship["id"]
+        relationship_type = relationship["type"]
+        if relationship_type not in table:
+            # Raise ValueError for types that do not exist, and skip types that are not parsed.
+            Relationship(relationship_type)
+            continue
+        attribute, model = table[relationship_type]
+        if (attribute, relationship_id) in seen:
+            continue
+        seen.add((attribute, relationship_id))
+        if "attributes" in relationship:
+            obj = client._model(model, relationship_id, {"data": relationship})
+        else:
+            # Most relationships are only an ID and a type, so the model is made without parsing anything.
+            obj = client._model(model, relationship_id)
+        relationship_data[attribute].append(obj)
+    return relationship_data
+
+
+@lru_cache(maxsize=None)
+def _relationship_table() -> Tuple[type, Dict[str, Tuple[str, Type["Model"]]]]:
+    # The models are imported here since they import this module. The table maps the types of relationships to the
+    # attribute names used by parse_relationships and the model classes.
     from .models.abc import GenericModelList
     from .models import Manga, Author, Chapter, User, Group, CoverArt
 
-    relationship_data = defaultdict(GenericModelList)
-    seen_uuids = defaultdict(list)
-    if "relationships" in data:
-        for relationship in data["relationships"]:
-            assert "id" in relationship, "Missing ID."
-            relationship_id = relationship["id"]
-            relationship_type = Relationship(relationship["type"])
-            relationship_data_dict = {"data": relationship}
-            if relationship_type == Relationship.MANGA:
-                dupe_list = seen_uuids["mangas"]
-                if relationship_id not in dupe_list:
-                    relationship_data["mangas"].append(Manga(obj.client, data=relationship_data_dict))
-                    dupe_list.append(relationship_id)
-            elif relationship_type == Relationship.AUTHOR:
-                dupe_list = seen_uuids["authors"]
-                if relationship_id not in dupe_list:
-                    relationship_data["authors"].append(Author(obj.client, data=relationship_data_dict))
-                    dupe_list.append(relationship_id)
-            elif relationship_type == Relationship.ARTIST:
-                dupe_list = seen_uuids["artists"]
-                if relationship_id not in dupe_list:
-                    relationship_data["artists"].append(Author(obj.client, data=relationship_data_dict))
-                    dupe_list.append(relationship_id)
-            elif relationship_type == Relationship.CHAPTER:
-                dupe_list = seen_uuids["chapters"]
-                if relationship_id not in dupe_list:
-                    relationship_data["chapters"].append(Chapter(obj.client, data=relationship_data_dict))
-                    dupe_list.append(relationship_id)
-            elif relationship_type == Relationship.USER:
-                dupe_list = seen_uuids["users"]
-                if relationship_id not in dupe_list:
-                    relationship_data["_users"].append(User(obj.client, data=relationship_data_dict))
-                    # Why `_users`? Because we never want a variable called users. All objects returning user
-                    # relationships will not have a variable called users.
-                    dupe_list.append(relationship_id)
-            elif relationship_type == Relationship.SCANLATION_GROUP:
-                dupe_list = seen_uuids["groups"]
-                if relationship_id not in dupe_list:
-                    relationship_data["groups"].append(Group(obj.client, data=relationship_data_dict))
-                    dupe_list.append(relationship_id)
-            elif relationship_type == Relationship.COVER_ART:
-                dupe_list = seen_uuids["covers"]
-                if relationship_id not in dupe_list:
-                    relationship_data["_covers"].append(CoverArt(obj.client, data=relationship_data_dict))
-                    dupe_list.append(relationship_id)
-    for key, value in relationship_data.items():
-        setattr(obj, key, value)
+    return GenericModelList, {
+        Relationship.MANGA.value: ("mangas", Manga),
+        Relationship.AUTHOR.value: ("authors", Author),
+        Relationship.ARTIST.value: ("artists", Author),
+        Relationship.CHAPTER.value: ("chapters", Chapter),
+        # Why `_users`? Because we never want a variable called users. All objects returning user relationships will
+        # not have a variable called users.
+        Relationship.USER.value: ("_users", User),
+        Relationship.SCANLATION_GROUP.value: ("groups", Group),
+        Relationship.COVER_ART.value: ("_covers", CoverArt),
+    }
 
 
 @dataclass(frozen=True)
@@ -317,3 +537,139 @@ def return_date_string(datetime_obj: datetime):
     :rtype: str
     """
     return datetime_obj.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+async def map_concurrent(
+    iterable: AsyncIterable[_T], function: Callable[[_T], Awaitable[_RT]], limit: int = 5, *, ordered: bool = True
+) -> AsyncIterator[_RT]:
+    """Run a coroutine function on every item of an async iterable, with up to ``limit`` items being processed at the
+    same time, and iterate over the results.
+
+    .. versionadded:: 1.2
+
+    Usage:
+
+    .. code-block:: python
+
+        async for aggregate in map_concurrent(client.get_mangas(), lambda manga: manga.aggregate(), limit=10):
+            ...
+
+    .. note::
+        When the iterator is closed, such as after breaking out of an ``async for`` loop over it, the items being
+        processed are cancelled and the iterable is closed if it can be.
+
+    :param iterable: The items to process.
+    :type iterable: AsyncIterable[T]
+    :param function: The coroutine function to run on every item.
+    :type function: Callable[[T], Awaitable[R]]
+    :param limit: The maximum amount of items to process at the same time. Defaults to ``5``.
+    :type limit: int
+    :param ordered: Whether to return the results in the order of the items. If ``True``, a slow item holds back the
+        items after it, and items whose results are waiting to be returned count towards ``limit``. If ``False``, the
+        results are returned as soon as they are ready. Defaults to ``True``.
+    :type ordered: bool
+    :return: An async iterator of the results.
+    :rtype: AsyncIterator[R]
+    :raises: :class:`ValueError` if ``limit`` is less than ``1``.
+    """
+    if limit < 1:
+        raise ValueError("The limit has to be at least 1.")
+    iterator = iterable.__aiter__()
+    tasks: Deque["asyncio.Future[_RT]"] = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(tasks) < limit:
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    tasks.append(asyncio.ensure_future(function(item)))
+            if not tasks:
+                return
+            if ordered:
+                yield await tasks[0]
+                tasks.popleft()
+            else:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in [task for task in tasks if task in done]:
+                    tasks.remove(task)
+                    yield task.result()
+    finally:
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if hasattr(iterator, "aclose"):
+            await iterator.aclose()
+
+
+async def filter_concurrent(
+    iterable: AsyncIterable[_T],
+    predicate: Callable[[_T], Union[bool, Awaitable[bool]]],
+    limit: int = 5,
+    *,
+    ordered: bool = True,
+) -> AsyncIterator[_T]:
+    """Iterate over the items of an async iterable for which a predicate is true. If the predicate returns an
+    awaitable, such as a coroutine, up to ``limit`` items are checked at the same time.
+
+    .. versionadded:: 1.2
+
+    :param iterable: The items to filter.
+    :type iterable: AsyncIterable[T]
+    :param predicate: The function deciding if an item is kept. It can be a normal function or a coroutine function.
+    :type predicate: Callable[[T], Union[bool, Awaitable[bool]]]
+    :param limit: The maximum amount of items to check at the same time. Defaults to ``5``.
+    :type limit: int
+    :param ordered: Whether to return the items in their original order. Defaults to ``True``.
+    :type ordered: bool
+    :return: An async iterator of the kept items.
+    :rtype: AsyncIterator[T]
+    :raises: :class:`ValueError` if ``limit`` is less than ``1``.
+    """
+
+    async def check(item: _T) -> Tuple[_T, bool]:
+        result = predicate(item)
+        if isawaitable(result):
+            result = await result
+        return item, result
+
+    results = map_concurrent(iterable, check, limit, ordered=ordered)
+    try:
+        async for item, keep in results:
+            if keep:
+                yield item
+    finally:
+        await results.aclose()
+
+
+async def batched(iterable: AsyncIterable[_T], size: int) -> AsyncIterator[List[_T]]:
+    """Group the items of an async iterable into lists of ``size`` items. The last list can be shorter.
+
+    .. versionadded:: 1.2
+
+    :param iterable: The items to group.
+    :type iterable: AsyncIterable[T]
+    :param size: The amount of items in each list.
+    :type size: int
+    :return: An async iterator of the lists.
+    :rtype: AsyncIterator[List[T]]
+    :raises: :class:`ValueError` if ``size`` is less than ``1``.
+    """
+    if size < 1:
+        raise ValueError("The size has to be at least 1.")
+    iterator = iterable.__aiter__()
+    batch = []
+    try:
+        async for item in iterator:
+            batch.append(item)
+            if len(batch) == size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    finally:
+        if hasattr(iterator, "aclose"):
+            await iterator.aclose()
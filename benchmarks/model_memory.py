@@ -0,0 +1,74 @@
+"""Measure the memory used by each model object.
+
+Run with ``python benchmarks/model_memory.py [count]`` from the root of the repository.
+"""
+import asyncio
+import gc
+import sys
+import tracemalloc
+from os.path import abspath, dirname
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from asyncdex import Author, Chapter, Group, Manga, MangadexClient, User  # noqa: E402
+
+
+def chapter_data(index: int) -> Dict[str, Any]:
+    return {
+        "result": "ok",
+        "data": {
+            "id": f"00000000-0000-0000-0000-{index:012}",
+            "type": "chapter",
+            "attributes": {
+                "volume": str(index // 10),
+                "chapter": str(index),
+                "title": None,
+                "translatedLanguage": "en",
+                "hash": "0123456789abcdef0123456789abcdef",
+                "data": [f"x{page}-0123456789abcdef0123456789abcdef.png" for page in range(20)],
+                "dataSaver": [f"x{page}-0123456789abcdef0123456789abcdef.jpg" for page in range(20)],
+                "publishAt": "2021-05-30T00:00:00+00:00",
+                "createdAt": "2021-05-30T00:00:00+00:00",
+                "updatedAt": "2021-05-30T00:00:00+00:00",
+                "version": 1,
+            },
+        },
+        "relationships": [
+            {"id": "11111111-0000-0000-0000-000000000000", "type": "manga"},
+            {"id": "22222222-0000-0000-0000-000000000000", "type": "scanlation_group"},
+            {"id": "33333333-0000-0000-0000-000000000000", "type": "user"},
+        ],
+    }
+
+
+def stub_data(index: int) -> Dict[str, Any]:
+    return {"data": {"id": f"00000000-0000-0000-0000-{index:012}"}}
+
+
+def measure(name: str, factory: Callable[[int], Any], count: int):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects: List[Any] = [factory(index) for index in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{name:<16} {(after - before) / count:>10.0f} bytes/object")
+    del objects
+
+
+async def main(count: int = 20000):
+    client = MangadexClient()
+    # The JSON is built up front so that only the models are measured.
+    chapters = [chapter_data(index) for index in range(count)]
+    stubs = [stub_data(index) for index in range(count)]
+    measure("Chapter", lambda index: Chapter(client, data=chapters[index]), count)
+    measure("Manga stub", lambda index: Manga(client, data=stubs[index]), count)
+    measure("Author stub", lambda index: Author(client, data=stubs[index]), count)
+    measure("Group stub", lambda index: Group(client, data=stubs[index]), count)
+    measure("User stub", lambda index: User(client, data=stubs[index]), count)
+    await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*map(int, sys.argv[1:2])))
@@ -0,0 +1,98 @@
+"""Measure how fast the chapters of feed pages are parsed into models.
+
+Run with ``python benchmarks/parse_throughput.py [pages] [--lazy] [--no-relationships]`` from the root of the
+repository. With ``--lazy``, the client parses models lazily and the benchmark reads every attribute of each chapter
+once, so that the decoding is included in the time. With ``--no-relationships``, the chapters have no relationships, so
+that only the attributes are measured.
+"""
+import asyncio
+import sys
+import time
+from os.path import abspath, dirname
+from typing import Any, Dict, List
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from asyncdex import Chapter, MangadexClient  # noqa: E402
+
+page_size = 500
+attributes = ("volume", "number", "title", "language", "hash", "page_names", "publish_time", "manga", "user", "groups")
+
+
+def chapter_data(index: int, relationships: bool) -> Dict[str, Any]:
+    data = {
+        "result": "ok",
+        "data": {
+            "id": f"00000000-0000-0000-0000-{index:012}",
+            "type": "chapter",
+            "attributes": {
+                "volume": str(index // 10),
+                "chapter": str(index),
+                "title": f"Chapter {index}",
+                "translatedLanguage": "en",
+                "hash": "0123456789abcdef0123456789abcdef",
+                "data": [f"x{page}-0123456789abcdef0123456789abcdef.png" for page in range(20)],
+                "dataSaver": [f"x{page}-0123456789abcdef0123456789abcdef.jpg" for page in range(20)],
+                "publishAt": "2021-05-30T00:00:00+00:00",
+                "createdAt": "2021-05-30T00:00:00+00:00",
+                "updatedAt": "2021-05-30T00:00:00+00:00",
+                "version": 1,
+            },
+        },
+        "relationships": [
+            {"id": "11111111-0000-0000-0000-000000000000", "type": "manga"},
+            {"id": f"22222222-0000-0000-0000-{index % 7:012}", "type": "scanlation_group"},
+            {"id": f"33333333-0000-0000-0000-{index % 13:012}", "type": "user"},
+        ],
+    }
+    if not relationships:
+        del data["relationships"]
+    return data
+
+
+def feed_page(number: int, relationships: bool) -> Dict[str, Any]:
+    start = number * page_size
+    return {
+        "results": [chapter_data(index, relationships) for index in range(start, start + page_size)],
+        "limit": page_size,
+        "offset": start,
+        "total": 10000,
+    }
+
+
+def parse_page(client: MangadexClient, page: Dict[str, Any], read: bool) -> List[Chapter]:
+    chapters = [Chapter(client, data=item) for item in page["results"]]
+    if read:
+        for chapter in chapters:
+            for attribute in attributes:
+                getattr(chapter, attribute)
+    return chapters
+
+
+async def main(count: int = 20, lazy: bool = False, relationships: bool = True):
+    client = MangadexClient(lazy_parsing=True) if lazy else MangadexClient()
+    # The JSON is built up front so that only the parsing is measured.
+    pages = [feed_page(number, relationships) for number in range(count)]
+    best = float("inf")
+    for _ in range(15):
+        start = time.perf_counter()
+        for page in pages:
+            parse_page(client, page, lazy)
+        best = min(best, time.perf_counter() - start)
+    await client.close()
+    print(
+        f"{'Lazy' if lazy else 'Eager'} parsing of {page_size} chapter pages"
+        f"{'' if relationships else ' without relationships'}"
+    )
+    print(f"{best / count * 1000:>10.2f} ms/page")
+    print(f"{count * page_size / best:>10.0f} chapters/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            *map(int, [arg for arg in sys.argv[1:2] if not arg.startswith("--")]),
+            lazy="--lazy" in sys.argv,
+            relationships="--no-relationships" not in sys.argv,
+        )
+    )
@@ -1,8 +1,11 @@
 import logging
 import os
-from typing import Any, Dict, Union
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Union
 
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 logging.getLogger("vcr").setLevel(logging.WARNING)
 
@@ -39,3 +42,20 @@ def password():
 @pytest.fixture
 def refresh_token():
     return os.environ.get("asyncdex_refresh_token", "refresh")
+
+
+@asynccontextmanager
+async def _start_mock_api(app: web.Application) -> AsyncIterator[str]:
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield str(server.make_url("")).rstrip("/")
+    finally:
+        await server.close()
+
+
+@pytest.fixture
+def mock_api():
+    """A local server standing in for the MangaDex API. Use ``async with mock_api(app) as url`` to run the
+    :class:`aiohttp.web.Application` and pass the URL as the client's ``api_url``."""
+    return _start_mock_api
@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+
+from asyncdex.cache import ResponseCache
+
+
+def make_response(**headers):
+    return SimpleNamespace(headers=headers)
+
+
+class TestResponseCache:
+    def test_ttl_for(self):
+        cache = ResponseCache()
+        assert cache.ttl_for("/manga/abc") > 0
+        assert cache.ttl_for("/manga/abc?includes[]=author") > 0
+        assert cache.ttl_for("/manga/random") == 0
+        assert cache.ttl_for("/manga") == 0
+
+    def test_hit_and_miss(self):
+        cache = ResponseCache({"/manga/{id}": 60})
+        response = make_response()
+        assert cache.lookup((None, "/manga/a")) is None
+        cache.store((None, "/manga/a"), response, b"{}", 60)
+        assert cache.lookup((None, "/manga/a")) is response
+        assert cache.lookup(("user", "/manga/a")) is None
+        assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+    def test_expired(self):
+        cache = ResponseCache({"/manga/{id}": 60})
+        cache.store((None, "/manga/a"), make_response(), b"{}", 0)
+        cache.store((None, "/manga/b"), make_response(ETag='"b"'), b"{}", 0)
+        assert cache.lookup((None, "/manga/a")) is None
+        assert cache.lookup((None, "/manga/b")) is None
+        # Expired entries with validators are kept for revalidation.
+        assert len(cache) == 1
+        assert cache.get((None, "/manga/b")).validators() == {"If-None-Match": '"b"'}
+        assert cache.revalidated((None, "/manga/b"), 60) is not None
+        assert cache.lookup((None, "/manga/b")) is not None
+
+    def test_lru_eviction(self):
+        cache = ResponseCache({"/manga/{id}": 60}, max_entries=2)
+        for name in "abc":
+            cache.store((None, f"/manga/{name}"), make_response(), b"{}", 60)
+            cache.get((None, "/manga/a"))
+        assert cache.get((None, "/manga/b")) is None
+        assert cache.get((None, "/manga/a")) is not None
+        assert cache.stats.evictions == 1
+
+    def test_byte_limit(self):
+        cache = ResponseCache({"/manga/{id}": 60}, max_bytes=10)
+        cache.store((None, "/manga/a"), make_response(), b"x" * 6, 60)
+        cache.store((None, "/manga/b"), make_response(), b"x" * 6, 60)
+        assert len(cache) == 1
+        assert cache.size == 6
+        cache.store((None, "/manga/c"), make_response(), b"x" * 11, 60)
+        assert cache.get((None, "/manga/c")) is None
+
+    def test_invalidate(self):
+        cache = ResponseCache({"/manga/{id}": 60})
+        cache.store((None, "/manga/a"), make_response(), b"{}", 60)
+        cache.store(("user", "/manga/a?includes[]=author"), make_response(), b"{}", 60)
+        cache.store((None, "/manga/b"), make_response(), b"{}", 60)
+        assert cache.invalidate("/manga/a") == 2
+        assert cache.invalidate_route("/manga/{id}") == 1
+        assert len(cache) == 0
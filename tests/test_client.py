@@ -1,10 +1,22 @@
-from datetime import datetime
+import asyncio
+import gc
+from datetime import datetime, timedelta
 from os.path import abspath, join
-from typing import Optional
+from types import SimpleNamespace
+from typing import List, Optional
 
+import aiohttp
 import pytest
+from aiohttp import web
 
 from asyncdex import Author, Chapter, Group, Manga, MangadexClient, Unauthorized
+from asyncdex.batching import BatchLoader
+from asyncdex.cache import ResponseCache
+from asyncdex.connection import ConnectionPool, ConnectionPools
+from asyncdex.constants import uploads_url
+from asyncdex.exceptions import HTTPException
+from asyncdex.retry import RetryPolicy
+from asyncdex.token_store import MemoryTokenStore, StoredTokens
 
 
 class TestConstructor:
@@ -493,3 +505,397 @@ class TestJSON:
             assert not client.password
             assert client.refresh_token
             assert not client.session_token
+
+
+class TestCoalescing:
+    @staticmethod
+    def make_app(calls: List[str]) -> web.Application:
+        async def manga(request: web.Request):
+            calls.append(request.match_info["id"])
+            await asyncio.sleep(0.05)
+            return web.json_response(
+                {"result": "ok", "data": {"id": request.match_info["id"], "attributes": {"title": {"en": "Title"}}}}
+            )
+
+        app = web.Application()
+        app.router.add_get("/manga/{id}", manga)
+        return app
+
+    @pytest.mark.asyncio
+    async def test_coalesced(self, mock_api):
+        calls = []
+        async with mock_api(self.make_app(calls)) as url, MangadexClient(api_url=url, coalesce_requests=True) as client:
+            mangas = [client.get_manga("a") for _ in range(5)] + [client.get_manga("b")]
+            await asyncio.gather(*[manga.fetch() for manga in mangas])
+            assert sorted(calls) == ["a", "b"]
+            assert all(manga.titles.en.primary == "Title" for manga in mangas)
+            await mangas[0].fetch()
+            assert sorted(calls) == ["a", "a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_json_key_identity(self):
+        keys = []
+
+        async def single_flight(key, fetch):
+            keys.append(key)
+
+        async with MangadexClient(username="user", password="password", coalesce_requests=True) as client:
+            client._single_flight = single_flight
+            await client._get_json("GET", "https://api.mangadex.org/manga/a")
+            await client._get_json("GET", "https://api.mangadex.org/manga/a", with_auth=False)
+        assert [key[2] for key in keys] == ["user", None]
+
+    @pytest.mark.asyncio
+    async def test_not_coalesced(self, mock_api):
+        calls = []
+        async with mock_api(self.make_app(calls)) as url, MangadexClient(api_url=url) as client:
+            await asyncio.gather(*[client.get_manga("a").fetch() for _ in range(3)])
+            assert calls == ["a", "a", "a"]
+
+
+class TestAutoBatch:
+    @staticmethod
+    def make_app(list_calls: List[List[str]], single_calls: List[str]) -> web.Application:
+        def entry(manga_id: str):
+            return {"result": "ok", "data": {"id": manga_id, "attributes": {"title": {"en": "Title"}}}}
+
+        async def manga_list(request: web.Request):
+            ids = [value for key, value in request.query.items() if key.startswith("ids")]
+            list_calls.append(ids)
+            return web.json_response({"results": [entry(item) for item in ids if item != "hidden"]})
+
+        async def manga(request: web.Request):
+            single_calls.append(request.match_info["id"])
+            return web.json_response(entry(request.match_info["id"]))
+
+        app = web.Application()
+        app.router.add_get("/manga", manga_list)
+        app.router.add_get("/manga/{id}", manga)
+        return app
+
+    @pytest.mark.asyncio
+    async def test_batched(self, mock_api):
+        list_calls, single_calls = [], []
+        async with mock_api(self.make_app(list_calls, single_calls)) as url, MangadexClient(
+            api_url=url, auto_batch=True
+        ) as client:
+            mangas = [client.get_manga(manga_id) for manga_id in ("a", "b", "c", "hidden")]
+            await asyncio.gather(*[manga.fetch() for manga in mangas])
+            assert len(list_calls) == 1
+            assert sorted(list_calls[0]) == ["a", "b", "c", "hidden"]
+            assert single_calls == ["hidden"]
+            assert all(manga.titles.en.primary == "Title" for manga in mangas)
+
+    @pytest.mark.asyncio
+    async def test_close(self):
+        started = asyncio.Event()
+
+        async def do_batch(*args):
+            started.set()
+            await asyncio.sleep(10)
+
+        loader = BatchLoader(SimpleNamespace(_do_batch=do_batch), "manga.view", "manga")
+        load = asyncio.ensure_future(loader.load(SimpleNamespace(id="a"), None))
+        await started.wait()
+        gc.collect()
+        assert len(loader._tasks) == 1
+        await loader.close()
+        with pytest.raises(asyncio.CancelledError):
+            await load
+        assert not loader._tasks
+
+    @pytest.mark.asyncio
+    async def test_not_batched(self, mock_api):
+        list_calls, single_calls = [], []
+        async with mock_api(self.make_app(list_calls, single_calls)) as url, MangadexClient(api_url=url) as client:
+            await asyncio.gather(*[client.get_manga(manga_id).fetch() for manga_id in ("a", "b")])
+            assert list_calls == []
+            assert sorted(single_calls) == ["a", "b"]
+
+
+class TestCache:
+    @staticmethod
+    def make_app(calls: List[str]) -> web.Application:
+        async def manga(request: web.Request):
+            calls.append(request.headers.get("If-None-Match", ""))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304)
+            return web.json_response(
+                {"result": "ok", "data": {"id": request.match_info["id"], "attributes": {"title": {"en": "Title"}}}},
+                headers={"ETag": '"v1"'},
+            )
+
+        async def update(request: web.Request):
+            return web.json_response({"result": "ok"})
+
+        app = web.Application()
+        app.router.add_get("/manga/{id}", manga)
+        app.router.add_post("/manga/{id}/follow", update)
+        app.router.add_put("/manga/{id}", update)
+        return app
+
+    @pytest.mark.asyncio
+    async def test_cached(self, mock_api):
+        calls = []
+        cache = ResponseCache({"/manga/{id}": 60})
+        async with mock_api(self.make_app(calls)) as url, MangadexClient(api_url=url, cache=cache) as client:
+            for _ in range(3):
+                await client.get_manga("a").fetch()
+            assert calls == [""]
+            assert cache.stats.hits == 2
+            assert b'"Title"' in next(iter(cache._entries.values())).body
+            await client.request("PUT", "/manga/a", json={})
+            assert len(cache) == 0
+            await client.get_manga("a").fetch()
+            assert calls == ["", ""]
+
+    @pytest.mark.asyncio
+    async def test_revalidate(self, mock_api):
+        calls = []
+        cache = ResponseCache({"/manga/{id}": 60})
+        async with mock_api(self.make_app(calls)) as url, MangadexClient(api_url=url, cache=cache) as client:
+            await client.get_manga("a").fetch()
+            next(iter(cache._entries.values())).expires = 0
+            manga = client.get_manga("a")
+            await manga.fetch()
+            assert calls == ["", '"v1"']
+            assert manga.titles.en.primary == "Title"
+            assert cache.stats.revalidations == 1
+
+
+class TestRetry:
+    @staticmethod
+    def make_app(calls: List[str], failures: int) -> web.Application:
+        async def manga(request: web.Request):
+            calls.append(request.query_string)
+            if len(calls) <= failures:
+                return web.json_response({"result": "error"}, status=503, headers={"Retry-After": "0"})
+            return web.json_response({"result": "ok", "data": {"id": "a", "attributes": {}}})
+
+        app = web.Application()
+        app.router.add_get("/manga/{id}", manga)
+        return app
+
+    @pytest.mark.asyncio
+    async def test_retry_resends_request(self, mock_api):
+        calls = []
+        async with mock_api(self.make_app(calls, 2)) as url, MangadexClient(
+            api_url=url, retry_policy=RetryPolicy(0.01)
+        ) as client:
+            r = await client.request("GET", "/manga/a", params={"limit": "1"}, add_includes=True)
+            assert r.status == 200
+            assert len(calls) == 3
+            assert len(set(calls)) == 1 and "limit=1" in calls[0] and "includes" in calls[0]
+
+    @pytest.mark.asyncio
+    async def test_retries_exhausted(self, mock_api):
+        calls = []
+        async with mock_api(self.make_app(calls, 10)) as url, MangadexClient(
+            api_url=url, retry_policy=RetryPolicy(0.01)
+        ) as client:
+            with pytest.raises(HTTPException):
+                await client.request("GET", "/manga/a", retries=2)
+            assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_budget_exhausted(self, mock_api):
+        calls = []
+        async with mock_api(self.make_app(calls, 10)) as url, MangadexClient(
+            api_url=url, retry_policy=RetryPolicy(0.01, budget_minimum=1, budget_ratio=0)
+        ) as client:
+            with pytest.raises(HTTPException):
+                await client.request("GET", "/manga/a")
+            assert len(calls) == 2
+
+
+class TestSessionTokenRefresh:
+    @staticmethod
+    def make_app(refreshes: List[str], valid_tokens: List[str]) -> web.Application:
+        async def refresh(request: web.Request):
+            await asyncio.sleep(0.05)
+            refreshes.append((await request.json())["token"])
+            token = f"session{len(refreshes)}"
+            valid_tokens.append(token)
+            return web.json_response({"result": "ok", "token": {"session": token, "refresh": "refresh"}})
+
+        async def manga(request: web.Request):
+            if request.headers.get("Authorization") not in [f"Bearer {token}" for token in valid_tokens]:
+                return web.json_response({"result": "error", "errors": []}, status=401)
+            return web.json_response({"result": "ok", "data": {"id": request.match_info["id"], "attributes": {}}})
+
+        app = web.Application()
+        app.router.add_post("/auth/refresh", refresh)
+        app.router.add_get("/manga/{id}", manga)
+        return app
+
+    @staticmethod
+    def make_client(url: str) -> MangadexClient:
+        client = MangadexClient(api_url=url, refresh_token="refresh", global_ratelimit_rate=100)
+        client.user.id = "user"
+        return client
+
+    @pytest.mark.asyncio
+    async def test_shared_refresh_on_401(self, mock_api):
+        refreshes, valid_tokens = [], []
+        async with mock_api(self.make_app(refreshes, valid_tokens)) as url, self.make_client(url) as client:
+            client.session_token = "expired"
+            await asyncio.gather(*[client.request("GET", f"/manga/{index}") for index in range(10)])
+            assert refreshes == ["refresh"]
+            assert client.session_token == "session1"
+
+    @pytest.mark.asyncio
+    async def test_proactive_refresh(self, mock_api):
+        refreshes, valid_tokens = [], ["old"]
+        async with mock_api(self.make_app(refreshes, valid_tokens)) as url, self.make_client(url) as client:
+            client.session_token = "old"
+            client._session_token_acquired -= timedelta(minutes=14, seconds=30)
+            await asyncio.gather(*[client.request("GET", f"/manga/{index}") for index in range(5)])
+            assert client.session_token == "old"
+            await asyncio.sleep(0.1)
+            assert refreshes == ["refresh"]
+            assert client.session_token == "session1"
+
+    @pytest.mark.asyncio
+    async def test_token_store(self, mock_api):
+        refreshes, valid_tokens = [], ["stored"]
+        store = MemoryTokenStore()
+        acquired = datetime(2021, 6, 1)
+        store.save(StoredTokens("refresh", "stored", datetime.utcnow(), acquired))
+        async with mock_api(self.make_app(refreshes, valid_tokens)) as url, MangadexClient(
+            api_url=url, token_store=store
+        ) as client:
+            client.user.id = "user"
+            client._fetch_user_after_load = False
+            assert not client.anonymous_mode
+            await client.request("GET", "/manga/a")
+            assert refreshes == []
+            client.session_token = None
+            await client.request("GET", "/manga/a")
+            assert refreshes == ["refresh"]
+            assert store.load().session_token == "session1"
+            # Only the session token was renewed, so the refresh token keeps the time it was acquired.
+            assert store.load().refresh_token_acquired == acquired
+
+
+class TestIdentityMap:
+    @staticmethod
+    def make_app() -> web.Application:
+        def chapter(chapter_id: str):
+            return {
+                "result": "ok",
+                "data": {"id": chapter_id, "attributes": {"chapter": chapter_id, "translatedLanguage": "en"}},
+                "relationships": [{"id": "group", "type": "scanlation_group"}, {"id": "manga", "type": "manga"}],
+            }
+
+        async def chapter_list(request: web.Request):
+            return web.json_response({"results": [chapter(str(index)) for index in range(3)], "total": 3})
+
+        async def group_list(request: web.Request):
+            return web.json_response(
+                {"results": [{"result": "ok", "data": {"id": "group", "attributes": {"name": "Group"}}}]}
+            )
+
+        async def manga(request: web.Request):
+            return web.json_response(
+                {"result": "ok", "data": {"id": "manga", "attributes": {"title": {"en": "Title"}, "tags": []}}}
+            )
+
+        app = web.Application()
+        app.router.add_get("/chapter", chapter_list)
+        app.router.add_get("/group", group_list)
+        app.router.add_get("/manga/{id}", manga)
+        return app
+
+    @pytest.mark.asyncio
+    async def test_shared_objects(self, mock_api):
+        async with mock_api(self.make_app()) as url, MangadexClient(api_url=url, identity_map=True) as client:
+            chapters = await client.get_chapters().as_list()
+            groups = [chapter.groups[0] for chapter in chapters]
+            assert all(group is groups[0] for group in groups)
+            assert all(chapter.manga is client.get_manga("manga") for chapter in chapters)
+            await client.batch_groups(groups[0])
+            assert all(chapter.groups[0].name == "Group" for chapter in chapters)
+            assert await client.get_chapters().as_list() == chapters
+            assert all(new is old for new, old in zip(await client.get_chapters().as_list(), chapters))
+
+    @pytest.mark.asyncio
+    async def test_reparse(self, mock_api):
+        async with mock_api(self.make_app()) as url, MangadexClient(api_url=url, identity_map=True) as client:
+            manga = client.get_manga("manga")
+            manga.chapters.append(Chapter(client, id="chapter"))
+            await manga.fetch()
+            await manga.fetch()
+            assert manga.titles.en == ["Title"]
+            assert len(manga.chapters) == 1
+
+    @pytest.mark.asyncio
+    async def test_weak(self):
+        async with MangadexClient(identity_map=True) as client:
+            client.get_manga("a")
+            gc.collect()
+            assert len(client.identity_map) == 0
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        async with MangadexClient() as client:
+            assert client.identity_map is None
+            assert client.get_manga("a") is not client.get_manga("a")
+
+
+class TestConnectionPools:
+    @pytest.mark.asyncio
+    async def test_sessions(self):
+        pools = ConnectionPools(api=ConnectionPool(limit=3, keepalive_timeout=0))
+        async with MangadexClient(connection_pools=pools) as client:
+            assert client._session_for(client.api_base + "/manga") is client.session
+            assert client._session_for(f"{uploads_url}/covers/a/b.jpg") is client.upload_session
+            assert client._session_for("https://node.mangadex.network/data/a/1.png") is client.image_session
+            assert len({client.session, client.image_session, client.upload_session}) == 3
+            assert client.session.connector.limit == 3
+            assert client.session.connector.force_close
+            assert client.image_session.connector.limit_per_host == 8
+            assert client.upload_session.connector.limit == 100
+            assert client.image_session.headers["Accept-Encoding"] == "identity"
+            assert "Accept-Encoding" not in client.session.headers
+        assert client.image_session.closed and client.upload_session.closed
+
+    @pytest.mark.asyncio
+    async def test_custom_session(self):
+        async with aiohttp.ClientSession() as session, MangadexClient(session=session) as client:
+            assert client.connection_pools is None
+            assert client.image_session is client.upload_session is client.session is session
+
+    def test_negative(self):
+        with pytest.raises(ValueError):
+            ConnectionPool(limit_per_host=-1)
+
+    @pytest.mark.asyncio
+    async def test_warm_up(self, mock_api):
+        peers = []
+
+        async def ping(request: web.Request):
+            peers.append(request.transport.get_extra_info("peername"))
+            return web.Response(text="pong")
+
+        app = web.Application()
+        app.router.add_get("/ping", ping)
+        async with mock_api(app) as url:
+            async with MangadexClient(api_url=url, global_ratelimit_burst=3, warm_connections=3) as client:
+                assert len(set(peers)) == 3
+                await client.request("GET", "/ping", with_auth=False)
+                assert len(set(peers)) == 3
+            async with MangadexClient(api_url=url + "/missing") as client:
+                assert await client.warm_up() == 1
+            async with MangadexClient(api_url="http://127.0.0.1:1") as client:
+                assert await client.warm_up(2) == 0
+
+    @pytest.mark.asyncio
+    async def test_warm_up_cancelled(self):
+        async with MangadexClient() as client:
+
+            async def cancelled():
+                raise asyncio.CancelledError
+
+            client.global_ratelimit.acquire = cancelled
+            with pytest.raises(asyncio.CancelledError):
+                await client.warm_up(2)
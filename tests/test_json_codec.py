@@ -0,0 +1,100 @@
+import importlib.util
+import json
+import threading
+from typing import Any, List, Union
+
+import pytest
+from aiohttp import web
+
+from asyncdex import MangadexClient
+from asyncdex.json_codec import OrjsonCodec, StdlibJSONCodec, UjsonCodec, default_json_codec
+
+
+class RecordingCodec(StdlibJSONCodec):
+    def __init__(self):
+        self.threads: List[threading.Thread] = []
+        self.dumped: List[Any] = []
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        self.threads.append(threading.current_thread())
+        return super().loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        self.dumped.append(obj)
+        return super().dumps(obj)
+
+
+def make_app() -> web.Application:
+    async def manga(request: web.Request):
+        manga_id = request.match_info["id"]
+        description = "x" * int(request.query.get("size", "0"))
+        return web.json_response(
+            {"result": "ok", "data": {"id": manga_id, "attributes": {"description": {"en": description}}}}
+        )
+
+    async def echo(request: web.Request):
+        return web.json_response(await request.json())
+
+    async def raw(request: web.Request):
+        return web.Response(body=await request.read())
+
+    app = web.Application()
+    app.router.add_get("/manga/{id}", manga)
+    app.router.add_post("/echo", echo)
+    app.router.add_post("/raw", raw)
+    return app
+
+
+class TestCodecs:
+    @pytest.mark.parametrize("codec", [StdlibJSONCodec, OrjsonCodec, UjsonCodec])
+    def test_round_trip(self, codec):
+        try:
+            instance = codec()
+        except RuntimeError:
+            pytest.skip(f"{codec.__name__} is not installed")
+        obj = {"a": [1, 2.5, None, True], "b": "é"}
+        assert instance.loads(instance.dumps(obj)) == obj
+        assert instance.loads(json.dumps(obj).encode()) == obj
+
+    def test_default(self):
+        installed = [name for name in ("orjson", "ujson") if importlib.util.find_spec(name)]
+        assert default_json_codec().name == (installed or ["json"])[0]
+
+
+class TestClient:
+    @pytest.mark.asyncio
+    async def test_thread_threshold(self, mock_api):
+        codec = RecordingCodec()
+        async with mock_api(make_app()) as url, MangadexClient(
+            api_url=url, json_codec=codec, json_thread_threshold=1000
+        ) as client:
+            small = await client._get_json("GET", "/manga/a")
+            large = await client._get_json("GET", "/manga/b", params={"size": 2000})
+            assert small["data"]["id"] == "a"
+            assert large["data"]["attributes"]["description"]["en"] == "x" * 2000
+            assert codec.threads[0] is threading.main_thread()
+            assert codec.threads[1] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_no_threshold(self, mock_api):
+        codec = RecordingCodec()
+        async with mock_api(make_app()) as url, MangadexClient(
+            api_url=url, json_codec=codec, json_thread_threshold=None
+        ) as client:
+            await client._get_json("GET", "/manga/a", params={"size": 2000})
+            assert codec.threads == [threading.main_thread()]
+
+    @pytest.mark.asyncio
+    async def test_request_body(self, mock_api):
+        codec = RecordingCodec()
+        async with mock_api(make_app()) as url, MangadexClient(api_url=url, json_codec=codec) as client:
+            assert await client._get_json("POST", "/echo", json={"a": 1}) == {"a": 1}
+            assert codec.dumped == [{"a": 1}]
+
+    @pytest.mark.asyncio
+    async def test_data_body(self, mock_api):
+        async with mock_api(make_app()) as url, MangadexClient(api_url=url) as client:
+            r = await client.request("POST", "/raw", data=b"abc")
+            assert await r.read() == b"abc"
+            with pytest.raises(ValueError):
+                await client.request("POST", "/raw", json={"a": 1}, data=b"abc")
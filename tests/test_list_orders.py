@@ -0,0 +1,29 @@
+from typing import Any, Dict
+
+from asyncdex import MangadexClient
+from asyncdex.enum import OrderDirection
+from asyncdex.list_orders import ChapterListOrder, GroupListOrder, MangaFeedListOrder, MangaListOrder
+
+
+def order_params(order) -> Dict[str, Any]:
+    params = {}
+    MangadexClient._add_order(params, order)
+    return params
+
+
+class TestListOrders:
+    def test_no_order(self):
+        assert order_params(None) == {}
+        assert order_params(ChapterListOrder()) == {}
+
+    def test_mapped_attributes(self):
+        order = ChapterListOrder(creation_time=OrderDirection.ASCENDING, update_time=OrderDirection.DESCENDING)
+        assert order_params(order) == {"order[createdAt]": "asc", "order[updatedAt]": "desc"}
+
+    def test_attribute_names(self):
+        assert order_params(MangaListOrder(year=OrderDirection.DESCENDING)) == {"order[year]": "desc"}
+        assert order_params(GroupListOrder(name=OrderDirection.ASCENDING)) == {"order[name]": "asc"}
+        assert order_params(MangaFeedListOrder(volume=OrderDirection.ASCENDING, chapter=OrderDirection.ASCENDING)) == {
+            "order[volume]": "asc",
+            "order[chapter]": "asc",
+        }
@@ -0,0 +1,269 @@
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import pytest
+
+from asyncdex import Author, Chapter, Group, Manga, MangaStatus, MangadexClient, User
+from asyncdex.models.fields import Field, compile_fields
+from asyncdex.utils import relationship_models
+
+
+def chapter_data(chapter_id: str, version: int = 1) -> Dict[str, Any]:
+    return {
+        "result": "ok",
+        "data": {
+            "id": chapter_id,
+            "type": "chapter",
+            "attributes": {
+                "volume": "1",
+                "chapter": "2",
+                "title": None,
+                "translatedLanguage": "".join(["e", "n"]),
+                "hash": "hash",
+                "data": ["1.png"],
+                "dataSaver": ["1.jpg"],
+                "publishAt": "2021-05-30T00:00:00+00:00",
+                "createdAt": "2021-05-30T00:00:00+00:00",
+                "updatedAt": None,
+                "version": version,
+            },
+        },
+        "relationships": [
+            {"id": "manga", "type": "manga"},
+            {"id": "group", "type": "scanlation_group"},
+            {"id": "user", "type": "user"},
+        ],
+    }
+
+
+class TestSlots:
+    @pytest.mark.asyncio
+    async def test_no_dict(self):
+        async with MangadexClient() as client:
+            for model in (
+                Chapter(client, data=chapter_data("a")),
+                Manga(client, id="a"),
+                Author(client, id="a"),
+                Group(client, id="a"),
+                User(client, id="a"),
+            ):
+                assert not hasattr(model, "__dict__")
+                with pytest.raises(AttributeError):
+                    model.undocumented = True
+
+    @pytest.mark.asyncio
+    async def test_relationships(self):
+        async with MangadexClient() as client:
+            chapter = Chapter(client, data=chapter_data("a"))
+            assert chapter.manga.id == "manga"
+            assert [group.id for group in chapter.groups] == ["group"]
+            assert chapter.user.id == "user"
+            assert not hasattr(chapter, "mangas")
+            assert not hasattr(chapter, "_users")
+
+    @pytest.mark.asyncio
+    async def test_lazy_defaults(self):
+        async with MangadexClient() as client:
+            manga = Manga(client, id="a")
+            assert not hasattr(manga, "_titles")
+            assert manga.titles["en"] == []
+            assert manga.descriptions["en"] is None
+            assert manga.tags == []
+            assert manga.chapters.manga is manga
+            assert manga.covers.manga is manga
+            assert manga.links.anilist_id is None
+            assert manga.cover is None
+            assert Author(client, id="a").mangas == []
+
+    @pytest.mark.asyncio
+    async def test_transfer(self):
+        async with MangadexClient() as client:
+            chapter = Chapter(client, id="a")
+            chapter.transfer(Chapter(client, data=chapter_data("a", version=2)))
+            assert chapter.version == 2
+            assert chapter.number == "2"
+            assert chapter.manga.id == "manga"
+
+    @pytest.mark.asyncio
+    async def test_interned_language(self):
+        async with MangadexClient() as client:
+            first = Chapter(client, data=chapter_data("a"))
+            second = Chapter(client, data=chapter_data("b"))
+            assert first.language is second.language
+
+
+def manga_data(manga_id: str, **attributes) -> Dict[str, Any]:
+    return {
+        "result": "ok",
+        "data": {
+            "id": manga_id,
+            "type": "manga",
+            "attributes": {
+                "title": {"en": "Title"},
+                "altTitles": [{"en": "Other title"}],
+                "description": {"en": "Description"},
+                "isLocked": False,
+                "links": {"al": "1"},
+                "originalLanguage": "ja",
+                "lastVolume": None,
+                "lastChapter": None,
+                "publicationDemographic": "shounen",
+                "status": "hitaus",
+                "year": 2021,
+                "contentRating": "safe",
+                "tags": [],
+                "createdAt": "2021-05-30T00:00:00+00:00",
+                "updatedAt": None,
+                "version": 1,
+                **attributes,
+            },
+        },
+        "relationships": [{"id": "author", "type": "author"}, {"id": "cover", "type": "cover_art"}],
+    }
+
+
+class TestLazyParsing:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lazy", [False, True])
+    async def test_same_values(self, lazy: bool):
+        async with MangadexClient(lazy_parsing=lazy) as client:
+            manga = Manga(client, data=manga_data("a"))
+            assert manga.titles.en == ["Title", "Other title"]
+            assert manga.descriptions.en == "Description"
+            assert manga.links.anilist_id == "1"
+            assert manga.status == MangaStatus.HIATUS
+            assert manga.year == 2021
+            assert manga.updated_at is None
+            assert [author.id for author in manga.authors] == ["author"]
+            assert manga.cover.manga is manga
+            chapter = Chapter(client, data=chapter_data("a"))
+            assert chapter.number == "2"
+            assert chapter.manga.id == "manga"
+
+    @pytest.mark.asyncio
+    async def test_decoded_on_use(self):
+        async with MangadexClient(lazy_parsing=True) as client:
+            data = chapter_data("a")
+            chapter = Chapter(client, data=data)
+            assert chapter._raw is data
+            for name in ("number", "manga"):
+                with pytest.raises(AttributeError):
+                    object.__getattribute__(chapter, name)
+            assert chapter.number == "2"
+            manga = chapter.manga
+            assert chapter.manga is manga
+            with pytest.raises(AttributeError):
+                chapter.undocumented
+
+    @pytest.mark.asyncio
+    async def test_other_models(self):
+        async with MangadexClient(lazy_parsing=True) as client:
+            group = Group(client, data={"data": {"id": "g", "attributes": {"name": "Name", "version": 1}}})
+            assert group._raw is not None
+            assert group.name == "Name"
+
+    @pytest.mark.asyncio
+    async def test_changes_kept(self):
+        async with MangadexClient(lazy_parsing=True) as client:
+            chapter = Chapter(client, data=chapter_data("a"))
+            manga = Manga(client, id="other")
+            chapter.manga = manga
+            assert chapter.manga is manga
+            assert chapter.user.id == "user"
+
+    @pytest.mark.asyncio
+    async def test_reparse(self):
+        async with MangadexClient(lazy_parsing=True) as client:
+            manga = Manga(client, data=manga_data("a"))
+            manga.year = 1999
+            data = manga_data("a", year=2000)
+            del data["data"]["attributes"]["title"], data["data"]["attributes"]["altTitles"]
+            manga.parse(data)
+            assert manga.year == 2000
+            assert manga.titles.en == ["Title", "Other title"]
+
+    @pytest.mark.asyncio
+    async def test_transfer(self):
+        async with MangadexClient(lazy_parsing=True) as client:
+            chapter = Chapter(client, id="a")
+            chapter.transfer(Chapter(client, data=chapter_data("a", version=2)))
+            assert chapter.number == "2"
+            assert chapter.manga.id == "manga"
+
+
+class TestFields:
+    def test_compiled(self):
+        fields = (Field("a"), Field("b", "renamed", int), Field("c", default=False), Field("d", converter=int))
+        decode = compile_fields(fields)
+        obj = SimpleNamespace()
+        data = {"data": {"attributes": {"a": "x", "b": "1", "d": None}}}
+        decode(obj, data)
+        assert vars(obj) == {"a": "x", "renamed": 1, "c": False, "d": None}
+        expected = {}
+        for field in fields:
+            expected.update(field.decode(obj, data))
+        assert vars(obj) == expected
+
+    @pytest.mark.asyncio
+    async def test_models(self):
+        async with MangadexClient() as client:
+            author = Author(
+                client,
+                data={
+                    "data": {
+                        "id": "a",
+                        "attributes": {"name": "Name", "biography": [{"en": "Bio"}], "createdAt": None, "version": 2},
+                    }
+                },
+            )
+            assert (author.name, author.biographies.en, author.created_at, author.version) == ("Name", "Bio", None, 2)
+            assert not hasattr(author, "image")
+
+
+class TestRelationships:
+    @pytest.mark.asyncio
+    async def test_deduplicated(self):
+        async with MangadexClient() as client:
+            relationships = [{"id": str(index % 2000), "type": "manga"} for index in range(4000)]
+            relationships += [{"id": "0", "type": "author"}, {"id": "0", "type": "artist"}, {"id": "t", "type": "tag"}]
+            models = relationship_models({"relationships": relationships}, client)
+            assert [manga.id for manga in models["mangas"]] == [str(index) for index in range(2000)]
+            assert models["authors"][0].id == models["artists"][0].id == "0"
+            assert set(models) == {"mangas", "authors", "artists"}
+
+    @pytest.mark.asyncio
+    async def test_stubs(self):
+        async with MangadexClient() as client:
+            data = {
+                "relationships": [
+                    {"id": "a", "type": "manga"},
+                    {"id": "b", "type": "author", "attributes": {"name": "Name", "version": 1}},
+                ]
+            }
+            models = relationship_models(data, client)
+            manga = models["mangas"][0]
+            assert (manga.id, manga.version, manga.reading_status) == ("a", 0, None)
+            assert not hasattr(manga, "_titles")
+            assert models["authors"][0].name == "Name"
+
+    @pytest.mark.asyncio
+    async def test_invalid_type(self):
+        async with MangadexClient() as client:
+            with pytest.raises(ValueError):
+                relationship_models({"relationships": [{"id": "a", "type": "invalid"}]}, client)
+
+    @pytest.mark.asyncio
+    async def test_slotted_models(self):
+        async with MangadexClient() as client:
+            relationships = [{"id": "u", "type": "user"}, {"id": "m", "type": "manga"}]
+            group = Group(
+                client, data={"data": {"id": "g", "attributes": {"version": 1}}, "relationships": relationships}
+            )
+            assert [user.id for user in group._users] == ["u"]
+            # Groups have no attribute for manga relationships, so they are skipped.
+            assert not hasattr(group, "mangas")
+            author = Author(
+                client, data={"data": {"id": "a", "attributes": {"version": 1}}, "relationships": relationships}
+            )
+            assert [manga.id for manga in author.mangas] == ["m"]
+            assert not hasattr(author, "_users")
@@ -0,0 +1,422 @@
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict
+
+import pytest
+from aiohttp import web
+
+from asyncdex import Manga, MangadexClient
+from asyncdex.json_codec import StdlibJSONCodec
+from asyncdex.models.fields import ModelRecord, decode_records
+from asyncdex.models.pager import Pager, PagerCheckpoint
+
+
+def make_app(total: int, state: Dict[str, Any]) -> web.Application:
+    state.setdefault("offsets", [])
+    state.setdefault("in_flight", 0)
+    state.setdefault("max_in_flight", 0)
+
+    async def manga_list(request: web.Request):
+        offset = int(request.query["offset"])
+        limit = int(request.query["limit"])
+        state["offsets"].append(offset)
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        results = [
+            {"result": "ok", "data": {"id": str(index), "attributes": {"title": {"en": str(index)}}}}
+            for index in range(offset, min(offset + limit, total))
+        ]
+        return web.json_response({"results": results, "limit": limit, "offset": offset, "total": total})
+
+    app = web.Application()
+    app.router.add_get("/manga", manga_list)
+    return app
+
+
+def make_client(url: str) -> MangadexClient:
+    return MangadexClient(api_url=url, global_ratelimit_rate=1000, global_ratelimit_burst=100)
+
+
+class TestPager:
+    @pytest.mark.asyncio
+    async def test_all_items_in_order(self, mock_api):
+        state = {}
+        async with mock_api(make_app(95, state)) as url, make_client(url) as client:
+            items = [item.id async for item in Pager("/manga", Manga, client, limit_size=10)]
+            assert items == [str(index) for index in range(95)]
+            assert sorted(state["offsets"]) == list(range(0, 95, 10))
+
+    @pytest.mark.asyncio
+    async def test_max_in_flight(self, mock_api):
+        state = {}
+        async with mock_api(make_app(200, state)) as url, make_client(url) as client:
+            pager = Pager("/manga", Manga, client, limit_size=10, max_in_flight=3)
+            assert len([item async for item in pager]) == 200
+            assert state["max_in_flight"] <= 3
+
+    @pytest.mark.asyncio
+    async def test_limit(self, mock_api):
+        state = {}
+        async with mock_api(make_app(200, state)) as url, make_client(url) as client:
+            pager = Pager("/manga", Manga, client, limit_size=10, limit=25)
+            assert len([item async for item in pager]) == 25
+            assert sorted(state["offsets"]) == [0, 10, 20]
+
+    @pytest.mark.asyncio
+    async def test_aclose(self, mock_api):
+        state = {}
+        async with mock_api(make_app(200, state)) as url, make_client(url) as client:
+            async with Pager("/manga", Manga, client, limit_size=10, max_in_flight=3) as pager:
+                async for item in pager:
+                    await pager.aclose()
+                    break
+            assert [item async for item in pager] == []
+            await asyncio.sleep(0.05)
+            assert len(state["offsets"]) <= 4
+
+    @pytest.mark.asyncio
+    async def test_break_cancels_and_resumes(self, mock_api):
+        state = {}
+        async with mock_api(make_app(100, state)) as url, make_client(url) as client:
+            pager = Pager("/manga", Manga, client, limit_size=10, max_in_flight=3)
+            first = []
+            async for item in pager:
+                first.append(item.id)
+                if len(first) == 15:
+                    break
+            await asyncio.sleep(0.05)
+            assert all(task.done() for _, task in pager._reqs)
+            rest = [item.id async for item in pager]
+            assert first + rest == [str(index) for index in range(100)]
+
+
+def make_keyset_app(timestamps, state: Dict[str, Any]) -> web.Application:
+    """An endpoint ordering items by their createdAt timestamp, with an inclusive createdAtSince filter."""
+    items = sorted(
+        ({"id": str(index), "createdAt": timestamp} for index, timestamp in enumerate(timestamps)),
+        key=lambda item: item["createdAt"],
+    )
+    state.setdefault("requests", [])
+
+    async def manga_list(request: web.Request):
+        assert request.query["order[createdAt]"] == "asc"
+        offset = int(request.query["offset"])
+        limit = int(request.query["limit"])
+        since = request.query.get("createdAtSince", "")
+        state["requests"].append((since, offset))
+        assert offset < 30, "Keyset pagination should not need deep offsets"
+        matching = [item for item in items if item["createdAt"] >= since]
+        results = [
+            {
+                "result": "ok",
+                "data": {"id": item["id"], "attributes": {"title": {"en": item["id"]}, "createdAt": item["createdAt"]}},
+            }
+            for item in matching[offset : offset + limit]
+        ]
+        return web.json_response({"results": results, "limit": limit, "offset": offset, "total": len(matching)})
+
+    app = web.Application()
+    app.router.add_get("/manga", manga_list)
+    return app
+
+
+class TestKeysetPager:
+    @staticmethod
+    def timestamp(second: int) -> str:
+        return f"2021-01-01T{second // 3600:02}:{second // 60 % 60:02}:{second % 60:02}+00:00"
+
+    @pytest.mark.asyncio
+    async def test_keyset(self, mock_api):
+        # Three items per second, with a run of 25 items sharing one second.
+        timestamps = [self.timestamp(index // 3) for index in range(150)] + [self.timestamp(100)] * 25
+        state = {}
+        async with mock_api(make_keyset_app(timestamps, state)) as url, make_client(url) as client:
+            pager = Pager("/manga", Manga, client, limit_size=10, keyset="createdAt")
+            ids = [item.id async for item in pager]
+            assert sorted(ids, key=int) == [str(index) for index in range(175)]
+            assert len(ids) == len(set(ids))
+            assert pager.watermark is not None
+
+    @pytest.mark.asyncio
+    async def test_caller_since(self, mock_api):
+        timestamps = [self.timestamp(index // 3) for index in range(60)]
+        async with mock_api(make_keyset_app(timestamps, {})) as url, make_client(url) as client:
+            params = {"createdAtSince": "2021-01-01T00:00:10"}
+            pager = Pager("/manga", Manga, client, params=params, limit_size=10, keyset="createdAt")
+            ids = [item.id async for item in pager]
+            # Items made in the second before the given time are not returned.
+            assert sorted(ids, key=int) == [str(index) for index in range(30, 60)]
+
+    def test_invalid_keyset(self):
+        with pytest.raises(ValueError):
+            Pager("/manga", Manga, None, keyset="title")
+        with pytest.raises(ValueError):
+            Pager("/manga", Manga, None, params={"order[title]": "asc"}, keyset="createdAt")
+
+
+def make_ids_app(total: int, state: Dict[str, Any]) -> web.Application:
+    """An endpoint returning the items with the requested IDs, ordered by their createdAt timestamp."""
+    state.setdefault("requests", [])
+
+    async def chapter_list(request: web.Request):
+        ids = request.query.getall("ids[]")
+        offset = int(request.query["offset"])
+        limit = int(request.query["limit"])
+        state["requests"].append(len(ids))
+        matching = sorted(int(item) for item in ids if int(item) < total)
+        if request.query.get("order[createdAt]") == "desc":
+            matching.reverse()
+        results = [
+            {
+                "result": "ok",
+                "data": {
+                    "id": str(item),
+                    "attributes": {"title": {"en": ""}, "createdAt": f"2021-01-01T00:{item // 60:02}:{item % 60:02}"},
+                },
+            }
+            for item in matching[offset : offset + limit]
+        ]
+        return web.json_response({"results": results, "limit": limit, "offset": offset, "total": len(matching)})
+
+    app = web.Application()
+    app.router.add_get("/manga", chapter_list)
+    return app
+
+
+class TestShardedPager:
+    @pytest.mark.asyncio
+    async def test_sharded(self, mock_api):
+        state = {}
+        ids = [str(index) for index in range(40)] * 2 + [str(index) for index in range(40, 100)]
+        async with mock_api(make_ids_app(1000, state)) as url, make_client(url) as client:
+            pager = Pager("/manga", Manga, client, params={"ids": ids}, param_size=30, limit_size=10)
+            assert len(pager.shards) > 1
+            items = [item.id async for item in pager]
+            assert sorted(items, key=int) == [str(index) for index in range(100)]
+            assert len(items) == len(set(items))
+            assert max(state["requests"]) <= 30 - 2
+
+    @pytest.mark.asyncio
+    async def test_sharded_order(self, mock_api):
+        state = {}
+        ids = [str(index) for index in range(100)]
+        async with mock_api(make_ids_app(1000, state)) as url, make_client(url) as client:
+            pager = Pager(
+                "/manga", Manga, client, params={"ids": ids, "order[createdAt]": "desc"}, param_size=30, limit_size=10
+            )
+            items = [item.id async for item in pager]
+            assert items == [str(index) for index in reversed(range(100))]
+
+    @pytest.mark.asyncio
+    async def test_sharded_numeric_order(self, mock_api):
+        numbers = ["2", "10", "9.5", "1", "100", "3"]
+
+        async def chapter_list(request: web.Request):
+            ids = [int(item) for item in request.query.getall("ids[]")]
+            offset = int(request.query["offset"])
+            matching = sorted(ids, key=lambda item: float(numbers[item]))
+            results = [
+                {"result": "ok", "data": {"id": str(item), "attributes": {"chapter": numbers[item]}}}
+                for item in matching[offset : offset + 10]
+            ]
+            return web.json_response({"results": results, "limit": 10, "offset": offset, "total": len(matching)})
+
+        app = web.Application()
+        app.router.add_get("/manga", chapter_list)
+        async with mock_api(app) as url, make_client(url) as client:
+            params = {"ids": [str(index) for index in range(len(numbers))], "order[chapter]": "asc"}
+            pager = Pager("/manga", Manga, client, params=params, param_size=4, limit_size=10, raw=True)
+            assert len(pager.shards) > 1
+            items = [item["data"]["attributes"]["chapter"] async for item in pager]
+            assert items == ["1", "2", "3", "9.5", "10", "100"]
+
+    def test_sharded_unmergeable_order(self):
+        with pytest.raises(ValueError):
+            Pager("/manga", Manga, None, params={"ids": list(range(20)), "order[title]": "asc"}, param_size=10)
+
+    def test_too_many_params(self):
+        with pytest.raises(ValueError):
+            Pager("/manga", Manga, None, params={"a": list(range(10)), "b": list(range(10))}, param_size=10)
+
+
+class TestPages:
+    @pytest.mark.asyncio
+    async def test_pages(self, mock_api):
+        async with mock_api(make_app(45, {})) as url, make_client(url) as client:
+            pages = [page async for page in Pager("/manga", Manga, client, limit_size=10).pages()]
+            assert [page.offset for page in pages] == [0, 10, 20, 30, 40]
+            assert all(page.total == 45 for page in pages)
+            assert [len(page.items) for page in pages] == [10, 10, 10, 10, 5]
+            assert isinstance(pages[0].items[0], Manga)
+
+    @pytest.mark.asyncio
+    async def test_pages_after_items(self, mock_api):
+        async with mock_api(make_app(45, {})) as url, make_client(url) as client:
+            pager = Pager("/manga", Manga, client, limit_size=10, limit=25)
+            await pager.__anext__()
+            pages = [page async for page in pager.pages()]
+            assert [(page.offset, len(page.items)) for page in pages] == [(1, 9), (10, 10), (20, 5)]
+
+    @pytest.mark.asyncio
+    async def test_raw(self, mock_api):
+        async with mock_api(make_app(15, {})) as url, make_client(url) as client:
+            items = await Pager("/manga", Manga, client, limit_size=10, raw=True).as_list()
+            assert [item["data"]["id"] for item in items] == [str(index) for index in range(15)]
+
+
+class TestCheckpoint:
+    @pytest.mark.asyncio
+    async def test_resume(self, mock_api):
+        state = {}
+        async with mock_api(make_app(95, state)) as url, make_client(url) as client:
+            pager = Pager("/manga", Manga, client, limit_size=10, max_in_flight=1)
+            first = []
+            async for item in pager:
+                first.append(item.id)
+                if len(first) == 25:
+                    break
+            checkpoint = PagerCheckpoint.from_dict(json.loads(json.dumps(pager.checkpoint().to_dict())))
+            assert checkpoint.offset == 30
+            assert checkpoint.total == 95
+            assert len(checkpoint.pending) == 5
+            await asyncio.sleep(0.05)
+            state["offsets"].clear()
+            rest = [item.id async for item in Pager.from_checkpoint(client, Manga, checkpoint)]
+            assert first + rest == [str(index) for index in range(95)]
+            assert sorted(state["offsets"]) == list(range(30, 95, 10))
+
+    @pytest.mark.asyncio
+    async def test_resume_limit(self, mock_api):
+        state = {}
+        async with mock_api(make_app(200, state)) as url, make_client(url) as client:
+            pager = Pager("/manga", Manga, client, limit_size=10, limit=35)
+            first = [item.id for item in [await pager.__anext__() for _ in range(10)]]
+            resumed = Pager.from_checkpoint(client, Manga, pager.checkpoint())
+            rest = [item.id async for item in resumed]
+            assert first + rest == [str(index) for index in range(35)]
+
+    @pytest.mark.asyncio
+    async def test_resume_keyset(self, mock_api):
+        timestamps = [TestKeysetPager.timestamp(index // 3) for index in range(60)]
+        state = {}
+        async with mock_api(make_keyset_app(timestamps, state)) as url, make_client(url) as client:
+            pager = Pager("/manga", Manga, client, limit_size=10, keyset="createdAt")
+            first = [item.id for item in [await pager.__anext__() for _ in range(15)]]
+            checkpoint = PagerCheckpoint.from_dict(json.loads(json.dumps(pager.checkpoint().to_dict())))
+            rest = [item.id async for item in Pager.from_checkpoint(client, Manga, checkpoint)]
+            assert sorted(first + rest, key=int) == [str(index) for index in range(60)]
+            assert len(first + rest) == 60
+
+    def test_sharded(self):
+        pager = Pager("/manga", Manga, None, params={"ids[]": list(range(20))}, param_size=10)
+        with pytest.raises(ValueError):
+            pager.checkpoint()
+
+
+class TestExecutor:
+    @pytest.mark.asyncio
+    async def test_same_items(self, mock_api):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            async with mock_api(make_app(45, {})) as url, make_client(url) as client:
+                expected = [(item.id, item.titles.en) async for item in Pager("/manga", Manga, client, limit_size=10)]
+                pager = Pager("/manga", Manga, client, limit_size=10, executor=executor)
+                assert [(item.id, item.titles.en) async for item in pager] == expected
+                client.pager_executor = executor
+                records = await Pager("/manga", Manga, client, limit_size=10, raw=True).as_list()
+                assert all(isinstance(record, ModelRecord) for record in records)
+                assert [record.id for record in records] == [item[0] for item in expected]
+
+    @pytest.mark.asyncio
+    async def test_record(self):
+        body = json.dumps(
+            {
+                "results": [
+                    {
+                        "data": {
+                            "id": "a",
+                            "attributes": {"title": {"en": "Title"}, "year": 2021, "status": "ongoing", "version": 3},
+                        },
+                        "relationships": [{"id": "author", "type": "author"}],
+                    }
+                ]
+            }
+        ).encode()
+        record = decode_records(Manga, body, StdlibJSONCodec(), keep=("year",))["results"][0]
+        assert record.values["year"] == 2021
+        assert set(record.data["data"]["attributes"]) == {"title", "year", "version"}
+        async with MangadexClient() as client:
+            manga = record.to_model(client)
+            assert (manga.id, manga.year, manga.version, manga.titles.en) == ("a", 2021, 3, ["Title"])
+            assert manga.status.value == "ongoing"
+            assert manga.authors[0].id == "author"
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_rewinds(self, mock_api):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            async with mock_api(make_app(30, {})) as url, make_client(url) as client:
+                pager = Pager("/manga", Manga, client, limit_size=10, max_in_flight=1, executor=executor)
+                first = [(await pager.__anext__()).id for _ in range(5)]
+                checkpoint = pager.checkpoint()
+                assert (checkpoint.offset, checkpoint.pending) == (5, [])
+                rest = [item.id async for item in Pager.from_checkpoint(client, Manga, checkpoint)]
+                assert first + rest == [str(index) for index in range(30)]
+
+
+class TestCombinators:
+    @pytest.mark.asyncio
+    async def test_map_concurrent(self, mock_api):
+        running = 0
+        max_running = 0
+
+        async def double(item: Manga) -> int:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            # Later items finish first, so the order of the results depends on ordered.
+            await asyncio.sleep(0.01 * (3 - int(item.id) % 3))
+            running -= 1
+            return int(item.id) * 2
+
+        async with mock_api(make_app(30, {})) as url, make_client(url) as client:
+            results = [item async for item in Pager("/manga", Manga, client, limit_size=10).map_concurrent(double, 4)]
+            assert results == [index * 2 for index in range(30)]
+            assert max_running == 4
+            results = [
+                item
+                async for item in Pager("/manga", Manga, client, limit_size=10).map_concurrent(double, 4, ordered=False)
+            ]
+            assert sorted(results) == [index * 2 for index in range(30)]
+            assert results != [index * 2 for index in range(30)]
+
+    @pytest.mark.asyncio
+    async def test_map_concurrent_error(self, mock_api):
+        async def fail(item: Manga):
+            if item.id == "5":
+                raise RuntimeError
+            await asyncio.sleep(1)
+
+        async with mock_api(make_app(30, {})) as url, make_client(url) as client:
+            with pytest.raises(RuntimeError):
+                async for _ in Pager("/manga", Manga, client, limit_size=10).map_concurrent(fail, 10, ordered=False):
+                    pass
+
+    @pytest.mark.asyncio
+    async def test_filter(self, mock_api):
+        async def is_even(item: Manga) -> bool:
+            await asyncio.sleep(0)
+            return int(item.id) % 2 == 0
+
+        async with mock_api(make_app(25, {})) as url, make_client(url) as client:
+            pager = Pager("/manga", Manga, client, limit_size=10)
+            assert [item.id async for item in pager.filter(is_even)] == [str(index) for index in range(0, 25, 2)]
+            pager = Pager("/manga", Manga, client, limit_size=10)
+            assert [item.id async for item in pager.filter(lambda item: item.id.endswith("1"))] == ["1", "11", "21"]
+
+    @pytest.mark.asyncio
+    async def test_batched(self, mock_api):
+        async with mock_api(make_app(25, {})) as url, make_client(url) as client:
+            batches = [batch async for batch in Pager("/manga", Manga, client, limit_size=10).batched(7)]
+            assert [len(batch) for batch in batches] == [7, 7, 7, 4]
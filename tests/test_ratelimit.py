@@ -0,0 +1,195 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from multiprocessing import get_context
+from re import compile
+from time import monotonic
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from asyncdex import ratelimit
+from asyncdex.constants import ratelimit_data
+from asyncdex.enum import RequestPriority
+from asyncdex.ratelimit import (
+    FileRatelimitBackend,
+    GlobalRatelimit,
+    MemoryRatelimitBackend,
+    Path,
+    PathRatelimit,
+    Ratelimits,
+)
+
+
+class TestGlobalRatelimit:
+    def test_invalid_values(self):
+        with pytest.raises(ValueError):
+            GlobalRatelimit(0)
+        with pytest.raises(ValueError):
+            GlobalRatelimit(5, 0)
+
+    def test_reserve_spacing(self):
+        limiter = GlobalRatelimit(10, 1)
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+        assert limiter.reserve() == pytest.approx(0.2, abs=0.01)
+
+    def test_reserve_burst(self):
+        limiter = GlobalRatelimit(10, 3)
+        assert [limiter.reserve() for _ in range(3)] == [0, 0, 0]
+        assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_acquire_concurrent(self):
+        limiter = GlobalRatelimit(50, 1)
+        start = monotonic()
+        await asyncio.gather(*[limiter.acquire() for _ in range(6)])
+        assert monotonic() - start == pytest.approx(0.1, abs=0.05)
+
+
+class TestRatelimits:
+    @pytest.fixture
+    def ratelimits(self):
+        return Ratelimits(*ratelimit_data)
+
+    def test_exact_path(self, ratelimits):
+        assert ratelimits.find("/auth/login", "POST").path.name == "/auth/login"
+
+    def test_variable_path(self, ratelimits):
+        obj = ratelimits.find("/chapter/9b1c5ae4-5d5a-4e6c-8b1a-3f1e2c1a7d7e/read?x=1", "POST")
+        assert obj.path.name == "/chapter/{id}/read"
+
+    def test_literal_preferred(self, ratelimits):
+        assert ratelimits.find("/account/activate/resend", "POST").path.name == "/account/activate/resend"
+        assert ratelimits.find("/account/activate/abc", "POST").path.name == "/account/activate/{code}"
+
+    def test_method(self, ratelimits):
+        assert ratelimits.find("/manga/abc", "PUT").path.method == "PUT"
+        assert ratelimits.find("/manga/abc", "DELETE").path.method == "DELETE"
+        assert ratelimits.find("/manga/abc", "GET") is None
+        assert ratelimits.find("/manga/abc/feed", "POST") is None
+
+    def test_remove(self, ratelimits):
+        obj = ratelimits.find("/auth/login", "POST")
+        ratelimits.remove(obj)
+        assert ratelimits.find("/auth/login", "POST") is None
+        ratelimits.add(obj)
+        assert ratelimits.find("/auth/login", "POST") is obj
+
+
+class TestPathRatelimit:
+    @staticmethod
+    def make_response(**headers):
+        return SimpleNamespace(headers=headers)
+
+    @pytest.mark.asyncio
+    async def test_try_acquire(self):
+        obj = PathRatelimit(Path("/test", compile(r"/test")), 2, 60)
+        assert obj.try_acquire()
+        assert obj.try_acquire()
+        assert not obj.try_acquire()
+        obj.abandon()
+        assert obj.try_acquire()
+
+    @pytest.mark.asyncio
+    async def test_released_by_headers_in_priority_order(self):
+        obj = PathRatelimit(Path("/test", compile(r"/test")), 1, 60)
+        assert obj.try_acquire()
+        order = []
+
+        async def waiter(name, priority):
+            await obj.acquire(priority)
+            order.append(name)
+
+        tasks = [
+            asyncio.create_task(waiter("low", RequestPriority.LOW)),
+            asyncio.create_task(waiter("normal", RequestPriority.NORMAL)),
+            asyncio.create_task(waiter("high", RequestPriority.HIGH)),
+        ]
+        await asyncio.sleep(0)
+        assert obj.ratelimit_enqueued == 3
+        for _ in range(3):
+            obj.update(self.make_response(**{"x-ratelimit-limit": "1", "x-ratelimit-remaining": "1"}))
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        assert order == ["high", "normal", "low"]
+        assert obj.ratelimit_enqueued == 0
+
+    @pytest.mark.asyncio
+    async def test_released_on_expire(self):
+        obj = PathRatelimit(Path("/test", compile(r"/test")), 1, 60)
+        assert obj.try_acquire()
+        obj.update(self.make_response())
+        obj.ratelimit_expires = datetime.utcnow() + timedelta(milliseconds=50)
+        await asyncio.wait_for(obj.acquire(), 1)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter(self):
+        obj = PathRatelimit(Path("/test", compile(r"/test")), 1, 60)
+        assert obj.try_acquire()
+        task = asyncio.create_task(obj.acquire())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert obj.ratelimit_enqueued == 0
+        obj.update(self.make_response(**{"x-ratelimit-remaining": "1"}))
+        assert obj.try_acquire()
+
+
+def acquire_in_process(path: str, attempts: int) -> List[bool]:
+    ratelimits = Ratelimits(PathRatelimit(Path("/test", compile(r"/test")), 3, 60), backend=FileRatelimitBackend(path))
+    obj = ratelimits.find("/test", "GET")
+    return [obj.try_acquire() for _ in range(attempts)]
+
+
+class TestBackends:
+    @pytest.fixture(params=["memory", "file"])
+    def backend(self, request, tmp_path):
+        if request.param == "memory":
+            return MemoryRatelimitBackend()
+        return FileRatelimitBackend(tmp_path / "ratelimits.json")
+
+    def test_shared_global_ratelimit(self, backend, monkeypatch):
+        # The clock is frozen so that the reservations do not depend on how long the backend takes.
+        monkeypatch.setattr(ratelimit, "time", lambda: 1000.0)
+        first = GlobalRatelimit(10, 1, backend)
+        second = GlobalRatelimit(10, 1, backend)
+        assert first.reserve() == 0
+        assert second.reserve() == pytest.approx(0.1)
+        assert first.reserve() == pytest.approx(0.2)
+        monkeypatch.setattr(ratelimit, "time", lambda: 1000.15)
+        assert second.reserve() == pytest.approx(0.15)
+
+    def test_shared_path_ratelimit(self, backend):
+        first = Ratelimits(PathRatelimit(Path("/test", compile(r"/test")), 2, 60), backend=backend)
+        second = Ratelimits(PathRatelimit(Path("/test", compile(r"/test")), 2, 60), backend=backend)
+        assert first.find("/test", "GET").try_acquire()
+        assert second.find("/test", "GET").try_acquire()
+        assert not first.find("/test", "GET").try_acquire()
+        second.find("/test", "GET").abandon()
+        assert first.find("/test", "GET").try_acquire()
+
+    def test_shared_pending(self, backend):
+        first = Ratelimits(PathRatelimit(Path("/test", compile(r"/test")), 3, 60), backend=backend)
+        second = Ratelimits(PathRatelimit(Path("/test", compile(r"/test")), 3, 60), backend=backend)
+        first_path, second_path = first.find("/test", "GET"), second.find("/test", "GET")
+        assert first_path.try_acquire() and first_path.try_acquire()
+        assert second_path.try_acquire()
+        # The server has only seen the request of the second client, but the first has two requests in flight.
+        second_path.update(TestPathRatelimit.make_response(**{"x-ratelimit-limit": "3", "x-ratelimit-remaining": "2"}))
+        assert not second_path.try_acquire()
+        second_path.ratelimit_expires = datetime.utcnow() - timedelta(seconds=1)
+        backend.modify("* /test", lambda state: setattr(state, "expires", second_path.ratelimit_expires))
+        assert second_path.try_acquire()
+        assert not second_path.try_acquire()
+        first_path.abandon()
+        assert second_path.try_acquire()
+
+    def test_file_shared_between_processes(self, tmp_path):
+        path = str(tmp_path / "ratelimits.json")
+        with ProcessPoolExecutor(2, mp_context=get_context("spawn")) as executor:
+            results = list(executor.map(acquire_in_process, [path, path], [3, 3]))
+        assert sum(sum(result) for result in results) == 3
+        assert acquire_in_process(path, 1) == [False]
@@ -0,0 +1,50 @@
+from time import time
+
+import pytest
+
+from asyncdex.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after({"Retry-After": "3"}) == 3
+
+    def test_http_date(self):
+        assert parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+
+    def test_ratelimit_header(self):
+        assert 9 < parse_retry_after({"X-RateLimit-Retry-After": str(int(time()) + 10)}) <= 10
+
+    def test_missing(self):
+        assert parse_retry_after({}) is None
+        assert parse_retry_after({"Retry-After": "soon"}) is None
+
+
+class TestRetryPolicy:
+    def test_invalid_jitter(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(jitter=2)
+
+    def test_backoff_without_jitter(self):
+        policy = RetryPolicy(1, 2, 5, 0)
+        assert [policy.delay(attempt) for attempt in range(5)] == [1, 2, 4, 5, 5]
+
+    def test_jitter(self):
+        policy = RetryPolicy(1, 2, 30, 1)
+        assert all(0 <= policy.delay(2) <= 4 for _ in range(100))
+
+    def test_retry_after(self):
+        assert RetryPolicy(jitter=0).delay(3, 10) == 10
+
+    def test_budgets_per_route(self):
+        policy = RetryPolicy()
+        assert policy.budget("/manga/a") is policy.budget("/manga/b?includes[]=author")
+        assert policy.budget("/manga/a") is not policy.budget("/chapter/a")
+
+
+class TestRetryBudget:
+    def test_budget(self):
+        budget = RetryBudget(ratio=0.5, minimum=1)
+        for _ in range(4):
+            budget.deposit()
+        assert [budget.withdraw() for _ in range(4)] == [True, True, True, False]
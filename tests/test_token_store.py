@@ -0,0 +1,33 @@
+import os
+from datetime import datetime
+
+from asyncdex.token_store import FileTokenStore, MemoryTokenStore, StoredTokens
+
+
+class TestTokenStores:
+    tokens = StoredTokens("refresh", "session", datetime(2021, 6, 1, 12, 30), datetime(2021, 6, 1, 12), "user")
+
+    def test_memory(self):
+        store = MemoryTokenStore()
+        assert store.load() is None
+        store.save(self.tokens)
+        assert store.load() == self.tokens
+        store.clear()
+        assert store.load() is None
+
+    def test_file(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        store = FileTokenStore(path)
+        assert store.load() is None
+        store.save(self.tokens)
+        assert FileTokenStore(path).load() == self.tokens
+        if os.name == "posix":
+            assert os.stat(path).st_mode & 0o777 == 0o600
+        store.clear()
+        assert store.load() is None
+        store.clear()
+
+    def test_unreadable_file(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        path.write_text("{")
+        assert FileTokenStore(path).load() is None